@@ -1034,6 +1034,7 @@ def pytest_runtest_makereport(item, call):
                     skip_after_max_fail=True,
                     timeout=timeout,
                     since_time=since_time_str,
+                    incremental=True,
                 )
         except Exception:
             log.exception("Failed to collect OCS logs")
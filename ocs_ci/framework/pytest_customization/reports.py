@@ -1,3 +1,4 @@
+import json
 import os
 import pytest
 import logging
@@ -10,6 +11,7 @@ from ocs_ci.utility.utils import (
 )
 from ocs_ci.framework import config as ocsci_config
 from ocs_ci.framework import GlobalVariables as GV
+from ocs_ci.utility.tracing import tracer
 
 
 log = logging.getLogger(__name__)
@@ -64,14 +66,137 @@ def pytest_runtest_makereport(item, call):
                 log_file = handler.baseFilename
                 break
         extra.append(pytest_html.extras.url(log_file, name="Log File"))
+        if ocsci_config.RUN.get("trace_oc_calls"):
+            extra.append(pytest_html.extras.html(get_oc_calls_summary_html()))
         report.extra = extra
         item.session.results[item] = report
+    if report.when == "teardown" and ocsci_config.RUN.get("trace_oc_calls"):
+        save_oc_calls_summary(item.name)
+    if report.when == "teardown":
+        timelines_html = get_ceph_health_timelines_html()
+        if timelines_html:
+            extra.append(pytest_html.extras.html(timelines_html))
+            report.extra = extra
     if report.skipped:
         item.session.results[item] = report
     if report.when in ("setup", "teardown") and report.failed:
         item.session.results[item] = report
 
 
+def pytest_runtest_logstart(nodeid, location):
+    """
+    Reset the oc calls traces at the start of each test
+    """
+    tracer.reset()
+
+
+def get_oc_calls_summary_html():
+    """
+    Get summary of the traced oc calls of the test (setup and call phases)
+    for the HTML report
+
+    Returns:
+        str: HTML table with the slowest call sites
+
+    """
+    summary = tracer.get_summary(top_n=ocsci_config.RUN.get("trace_oc_calls_top_n", 10))
+    rows = [
+        html.tr(
+            html.th("Call site"),
+            html.th("Commands"),
+            html.th("Calls"),
+            html.th("Subprocess time [s]"),
+            html.th("Max time [s]"),
+            html.th("Parse time [s]"),
+            html.th("Output [bytes]"),
+        )
+    ]
+    for site in summary["top_call_sites"]:
+        rows.append(
+            html.tr(
+                html.td(site["call_site"]),
+                html.td(", ".join(site["commands"])),
+                html.td(site["calls"]),
+                html.td(f"{site['subprocess_time']:.2f}"),
+                html.td(f"{site['max_time']:.2f}"),
+                html.td(f"{site['parse_time']:.3f}"),
+                html.td(site["output_bytes"]),
+            )
+        )
+    return str(
+        html.div(
+            html.p(
+                f"Commands: {summary['calls']}, subprocess time: "
+                f"{summary['subprocess_time']:.2f}s, YAML parse time: "
+                f"{summary['parse_time']:.3f}s"
+            ),
+            html.table(*rows),
+        )
+    )
+
+
+def get_ceph_health_timelines_html():
+    """
+    Get the timelines of Ceph health transitions recorded by the Ceph health
+    monitors during the test for the HTML report
+
+    Returns:
+        str: HTML tables with the health transitions, empty string if no
+            timeline was recorded
+
+    """
+    # Imported here to not load the cluster module with the reporting plugin
+    from ocs_ci.ocs.cluster import pop_ceph_health_timelines
+
+    tables = []
+    for timeline in pop_ceph_health_timelines():
+        rows = [
+            html.tr(
+                html.th("Time"),
+                html.th("Health"),
+                html.th("Source"),
+                html.th("Details"),
+            )
+        ]
+        for transition in timeline:
+            details = transition["details"]
+            if isinstance(details, dict):
+                details = json.dumps(details)
+            rows.append(
+                html.tr(
+                    html.td(transition["time"]),
+                    html.td(transition["health"]),
+                    html.td(transition["source"]),
+                    html.td(details or ""),
+                )
+            )
+        tables.append(html.table(*rows))
+    if not tables:
+        return ""
+    return str(html.div(html.p("Ceph health timeline"), *tables))
+
+
+def save_oc_calls_summary(test_name):
+    """
+    Save summary of the traced oc calls of the test (all phases) to JSON file
+    in oc_call_traces directory of the logs
+
+    Args:
+        test_name (str): Name of the test
+
+    """
+    try:
+        summary = tracer.get_summary(
+            top_n=ocsci_config.RUN.get("trace_oc_calls_top_n", 10)
+        )
+        traces_dir = os.path.join(ocsci_log_path(), "oc_call_traces")
+        os.makedirs(traces_dir, exist_ok=True)
+        with open(os.path.join(traces_dir, f"{test_name}.json"), "w") as fd:
+            json.dump(summary, fd, indent=2)
+    except Exception as e:
+        log.warning(f"Failed to save oc calls summary of {test_name}: {e}")
+
+
 def pytest_sessionstart(session):
     """
     Prepare results dict
@@ -12,7 +12,6 @@ import os
 import re
 import statistics
 import tempfile
-import threading
 import time
 import inspect
 import stat
@@ -20,7 +19,6 @@ import platform
 import ipaddress
 
 from urllib.parse import urlparse, urlunparse
-from concurrent.futures import ThreadPoolExecutor
 from itertools import cycle
 from subprocess import PIPE, run
 from uuid import uuid4
@@ -51,9 +49,11 @@ from ocs_ci.ocs.exceptions import (
     UnexpectedBehaviour,
 )
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.pod_exec import search_pod_log_events
 from ocs_ci.ocs.resources import pod, pvc
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.utility import templating, version
+from ocs_ci.utility.executor import get_executor
 from ocs_ci.utility.vsphere import VSPHERE
 from ocs_ci.utility.operators import NMStateOperator
 from ocs_ci.utility.retry import retry
@@ -1143,6 +1143,8 @@ def create_multiple_pvcs(
     do_reload=False,
     access_mode=constants.ACCESS_MODE_RWO,
     burst=False,
+    wait_for_bound=False,
+    timeout=600,
 ):
     """
     Create one or more PVC as a bulk or one by one
@@ -1156,6 +1158,10 @@ def create_multiple_pvcs(
             False otherwise
         access_mode (str): The kind of access mode for PVC
         burst (bool): True for bulk creation, False ( default) for multiple creation
+        wait_for_bound (bool): Relevant only for burst creation. True for
+            waiting until all the PVCs reach Bound state, False (default) for
+            returning as soon as all the PVCs were accepted by the API server
+        timeout (int): Time in seconds to wait for the PVCs in burst creation
 
     Returns:
          ocs_objs (list): List of PVC objects
@@ -1206,18 +1212,83 @@ def create_multiple_pvcs(
     cmd = f"create -f {tmpdir}/"
     oc.exec_oc_cmd(command=cmd, out_yaml_format=False)
 
-    # Letting the system 1 sec for each PVC to create.
-    # this will prevent any other command from running in the system in this
-    # period of time.
-    logger.info(
-        f"Going to sleep for {number_of_pvc} sec. "
-        "until starting verify that PVCs was created."
+    wait_for_bulk_pvcs(
+        pvc_names=[pvc_obj.name for pvc_obj in ocs_objs],
+        namespace=namespace,
+        status=constants.STATUS_BOUND if wait_for_bound else None,
+        timeout=timeout,
     )
-    time.sleep(number_of_pvc)
 
     return ocs_objs, tmpdir
 
 
+def get_pvcs_not_in_status(pvc_names, namespace, status=None):
+    """
+    Get the PVCs from the given list which do not exist yet, or which are not
+    yet in the given status, using a single list call for all of them
+
+    Args:
+        pvc_names (list): Names of the PVCs to check
+        namespace (str): The namespace of the PVCs
+        status (str): The expected status (phase) of the PVCs, e.g. Bound.
+            None for checking only the existence of the PVCs
+
+    Returns:
+        list: Names of the PVCs which do not exist or not in the expected status
+
+    """
+    pvc_ocp = OCP(kind=constants.PVC, namespace=namespace)
+    items = pvc_ocp.get(silent=True).get("items", [])
+    pvc_phases = {
+        item["metadata"]["name"]: item.get("status", {}).get("phase") for item in items
+    }
+    return [
+        name
+        for name in pvc_names
+        if name not in pvc_phases or (status and pvc_phases[name] != status)
+    ]
+
+
+def wait_for_bulk_pvcs(pvc_names, namespace, status=None, timeout=600, sleep=3):
+    """
+    Wait until all the given PVCs exist, and optionally reach the given
+    status. Every sample lists the PVCs in the namespace once, regardless of
+    the number of the PVCs.
+
+    Args:
+        pvc_names (list): Names of the PVCs to wait for
+        namespace (str): The namespace of the PVCs
+        status (str): The expected status (phase) of the PVCs, e.g. Bound.
+            None for waiting only for the existence of the PVCs
+        timeout (int): Time in seconds to wait
+        sleep (int): Time in seconds to sleep between samples
+
+    Raises:
+        TimeoutExpiredError: In case not all the PVCs reached the expected
+            state in the given timeout
+
+    """
+    expected_state = f"status {status}" if status else "existence"
+    logger.info(f"Waiting for {expected_state} of {len(pvc_names)} PVCs")
+    sample = None
+    try:
+        for sample in TimeoutSampler(
+            timeout=timeout,
+            sleep=sleep,
+            func=get_pvcs_not_in_status,
+            pvc_names=pvc_names,
+            namespace=namespace,
+            status=status,
+        ):
+            if not sample:
+                logger.info(f"All {len(pvc_names)} PVCs reached {expected_state}")
+                return
+            logger.info(f"{len(sample)} PVCs did not reach {expected_state} yet")
+    except TimeoutExpiredError:
+        logger.error(f"PVCs which did not reach {expected_state}: {sample}")
+        raise
+
+
 def delete_bulk_pvcs(pvc_yaml_dir, pv_names_list, namespace):
     """
     Deletes all the pvcs created from yaml file in a provided dir
@@ -1896,6 +1967,33 @@ def measure_pvc_creation_time(interface, pvc_name):
     return total.total_seconds()
 
 
+def search_csi_provisioner_logs(provisioner_pods, events, names, timeout=600):
+    """
+    Search for the first line of each of the events of each of the names
+    (PVCs or PVs) in the logs of the csi-provisioner containers, in one pass
+    over the streamed logs which stops as soon as all of them are found
+
+    Args:
+        provisioner_pods (list): Names of the CSI provisioner pods
+        events (dict): Event to the regular expression with the "name" group
+        names (list): Names of the PVCs or PVs
+        timeout (int): Time in seconds for streaming the log of each pod
+
+    Returns:
+        dict: The (name, event) key to the first matching line, None if not
+            found
+
+    """
+    return search_pod_log_events(
+        provisioner_pods,
+        config.ENV_DATA["cluster_namespace"],
+        events,
+        names,
+        timeout=timeout,
+        container="csi-provisioner",
+    )
+
+
 def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
     """
     Measure PVC creation time of bulk PVC based on logs.
@@ -1913,29 +2011,27 @@ def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
     pod_name = pod.get_csi_provisioner_pod(interface)
     # due to some delay in CSI log generation added wait
     time.sleep(wait_time)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
+    # The PVC is logged as "namespace/name"
+    events = {
+        "start": r'provision "(?:[^"/]*/)?(?P<name>[^"]+)".*started',
+        "end": r'provision "(?:[^"/]*/)?(?P<name>[^"]+)".*succeeded',
+    }
 
     loop_counter = 0
     while True:
-        no_data_list = list()
-        for name in pvc_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f"provision.*{name}.*started", i)]
-            end = [i for i in logs if re.search(f"provision.*{name}.*succeeded", i)]
-            if not start or not end:
-                no_data_list.append(name)
+        # search the logs from the csi-provisioner containers
+        matches = search_csi_provisioner_logs(pod_name, events, pvc_name_list)
+        # check if PV data present in CSI logs
+        no_data_list = [
+            name
+            for name in pvc_name_list
+            if not matches[(name, "start")] or not matches[(name, "end")]
+        ]
 
         if no_data_list:
-            # Clear and get CSI logs after 60secs
+            # Search CSI logs again after 60secs
             logger.info(f"PVC count without CSI create log data {len(no_data_list)}")
-            logs.clear()
             time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
             loop_counter += 1
             if loop_counter >= 6:
                 logger.info("Waited for more than 6mins still no data")
@@ -1950,13 +2046,11 @@ def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
     this_year = str(datetime.datetime.now().year)
     for pvc_name in pvc_name_list:
         # Extract the starting time for the PVC provisioning
-        start = [i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)]
-        mon_day = " ".join(start[0].split(" ")[0:2])
+        mon_day = " ".join(matches[(pvc_name, "start")].split(" ")[0:2])
         start = f"{this_year} {mon_day}"
         start_time = datetime.datetime.strptime(start, DATE_TIME_FORMAT)
         # Extract the end time for the PVC provisioning
-        end = [i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)]
-        mon_day = " ".join(end[0].split(" ")[0:2])
+        mon_day = " ".join(matches[(pvc_name, "end")].split(" ")[0:2])
         end = f"{this_year} {mon_day}"
         end_time = datetime.datetime.strptime(end, DATE_TIME_FORMAT)
         total = end_time - start_time
@@ -1989,38 +2083,31 @@ def measure_pv_deletion_time_bulk(
     pod_name = pod.get_csi_provisioner_pod(interface)
     # due to some delay in CSI log generation added wait
     time.sleep(wait_time)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
 
     delete_suffix_to_search = (
         "succeeded"
         if version.get_semantic_ocs_version_from_config() <= version.VERSION_4_13
         else "persistentvolume deleted succeeded"
     )
+    events = {
+        "start": 'delete "(?P<name>[^"]+)": started',
+        "end": f'delete "(?P<name>[^"]+)": {delete_suffix_to_search}',
+    }
     loop_counter = 0
     while True:
-        no_data_list = list()
-        for pv in pv_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f'delete "{pv}": started', i)]
-            end = [
-                i
-                for i in logs
-                if re.search(f'delete "{pv}": {delete_suffix_to_search}', i)
-            ]
-            if not start or not end:
-                no_data_list.append(pv)
+        # search the logs from the csi-provisioner containers
+        matches = search_csi_provisioner_logs(pod_name, events, pv_name_list)
+        # check if PV data present in CSI logs
+        no_data_list = [
+            pv
+            for pv in pv_name_list
+            if not matches[(pv, "start")] or not matches[(pv, "end")]
+        ]
 
         if no_data_list:
-            # Clear and get CSI logs after 60secs
+            # Search CSI logs again after 60secs
             logger.info(f"PV count without CSI delete log data {len(no_data_list)}")
-            logs.clear()
             time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
             loop_counter += 1
             if loop_counter >= 6:
                 logger.info("Waited for more than 6mins still no data")
@@ -2035,17 +2122,11 @@ def measure_pv_deletion_time_bulk(
     this_year = str(datetime.datetime.now().year)
     for pv_name in pv_name_list:
         # Extract the deletion start time for the PV
-        start = [i for i in logs if re.search(f'delete "{pv_name}": started', i)]
-        mon_day = " ".join(start[0].split(" ")[0:2])
+        mon_day = " ".join(matches[(pv_name, "start")].split(" ")[0:2])
         start_tm = f"{this_year} {mon_day}"
         start_time = datetime.datetime.strptime(start_tm, DATE_TIME_FORMAT)
         # Extract the deletion end time for the PV
-        end = [
-            i
-            for i in logs
-            if re.search(f'delete "{pv_name}": {delete_suffix_to_search}', i)
-        ]
-        mon_day = " ".join(end[0].split(" ")[0:2])
+        mon_day = " ".join(matches[(pv_name, "end")].split(" ")[0:2])
         end_tm = f"{this_year} {mon_day}"
         end_time = datetime.datetime.strptime(end_tm, DATE_TIME_FORMAT)
         total = end_time - start_time
@@ -2628,7 +2709,7 @@ def converge_lists(list_to_converge):
 
 def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_modes):
     """
-    Funtion to create multiple PVC in parallel using threads
+    Funtion to create multiple PVC in parallel using the framework executor
     Function will create PVCs based on the available access modes
 
     Args:
@@ -2641,39 +2722,53 @@ def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_
     Returns:
         pvc_objs_list (list): List of pvc objs created in function
     """
-    obj_status_list, result_lists = ([] for i in range(2))
-    with ThreadPoolExecutor() as executor:
-        for mode in access_modes:
-            result_lists.append(
-                executor.submit(
-                    create_multiple_pvcs,
-                    sc_name=sc_obj.name,
-                    namespace=namespace,
-                    number_of_pvc=number_of_pvc,
-                    access_mode=mode,
-                    size=size,
-                )
-            )
+    executor = get_executor()
+    result_lists = [
+        executor.submit(
+            create_multiple_pvcs,
+            verb="create",
+            sc_name=sc_obj.name,
+            namespace=namespace,
+            number_of_pvc=number_of_pvc,
+            access_mode=mode,
+            size=size,
+        )
+        for mode in access_modes
+    ]
     result_list = [result.result() for result in result_lists]
     pvc_objs_list = converge_lists(result_list)
     # Check for all the pvcs in Bound state
-    with ThreadPoolExecutor() as executor:
-        for objs in pvc_objs_list:
-            if objs is not None:
-                if type(objs) is list:
-                    for obj in objs:
-                        obj_status_list.append(
-                            executor.submit(wait_for_resource_state, obj, "Bound", 90)
-                        )
-                else:
-                    obj_status_list.append(
-                        executor.submit(wait_for_resource_state, objs, "Bound", 90)
-                    )
+    obj_status_list = [
+        executor.submit(wait_for_resource_state, obj, "Bound", 90)
+        for obj in _flatten_objs(pvc_objs_list)
+    ]
     if False in [obj.result() for obj in obj_status_list]:
         raise TimeoutExpiredError("Not all PVC are in bound state")
     return pvc_objs_list
 
 
+def _flatten_objs(obj_list):
+    """
+    Flatten list of objects which may contain nested lists of objects and None
+
+    Args:
+        obj_list (list): List of objects or lists of objects
+
+    Returns:
+        list: Flat list of the objects without None items
+
+    """
+    objs = []
+    for obj in obj_list:
+        if obj is None:
+            continue
+        if type(obj) is list:
+            objs.extend(obj_ for obj_ in obj if obj_ is not None)
+        else:
+            objs.append(obj)
+    return objs
+
+
 def create_pods_parallel(
     pvc_list,
     namespace,
@@ -2685,7 +2780,7 @@ def create_pods_parallel(
     node_selector=None,
 ):
     """
-    Function to create pods in parallel
+    Function to create pods in parallel using the framework executor
 
     Args:
         pvc_list (list): List of pvcs to be attached in pods
@@ -2702,66 +2797,44 @@ def create_pods_parallel(
     Returns:
         pod_objs (list): Returns list of pods created
     """
-    future_pod_objs = []
     # Added 300 sec wait time since in scale test once the setup has more
     # PODs time taken for the pod to be up will be based on resource available
     wait_time = 300
     if raw_block_pv and not pod_dict_path:
         pod_dict_path = constants.CSI_RBD_RAW_BLOCK_POD_YAML
-    with ThreadPoolExecutor() as executor:
-        for pvc_obj in pvc_list:
-            if pvc_obj is not None:
-                if type(pvc_obj) is list:
-                    for pvc_ in pvc_obj:
-                        future_pod_objs.append(
-                            executor.submit(
-                                create_pod,
-                                interface_type=interface,
-                                pvc_name=pvc_.name,
-                                do_reload=False,
-                                namespace=namespace,
-                                raw_block_pv=raw_block_pv,
-                                pod_dict_path=pod_dict_path,
-                                sa_name=sa_name,
-                                deployment=deployment,
-                                node_selector=node_selector,
-                            )
-                        )
-                else:
-                    future_pod_objs.append(
-                        executor.submit(
-                            create_pod,
-                            interface_type=interface,
-                            pvc_name=pvc_obj.name,
-                            do_reload=False,
-                            namespace=namespace,
-                            raw_block_pv=raw_block_pv,
-                            pod_dict_path=pod_dict_path,
-                            sa_name=sa_name,
-                            deployment=deployment,
-                            node_selector=node_selector,
-                        )
-                    )
-
-    pod_objs = [pvc_obj.result() for pvc_obj in future_pod_objs]
+    executor = get_executor()
+    future_pod_objs = [
+        executor.submit(
+            create_pod,
+            verb="create",
+            interface_type=interface,
+            pvc_name=pvc_obj.name,
+            do_reload=False,
+            namespace=namespace,
+            raw_block_pv=raw_block_pv,
+            pod_dict_path=pod_dict_path,
+            sa_name=sa_name,
+            deployment=deployment,
+            node_selector=node_selector,
+        )
+        for pvc_obj in _flatten_objs(pvc_list)
+    ]
+    pod_objs = [future.result() for future in future_pod_objs]
     # Check for all the pods are in Running state
     # In above pod creation not waiting for the pod to be created because of threads usage
-    with ThreadPoolExecutor() as executor:
-        for obj in pod_objs:
-            future_pod_objs.append(
-                executor.submit(
-                    wait_for_resource_state, obj, "Running", timeout=wait_time
-                )
-            )
+    future_statuses = [
+        executor.submit(wait_for_resource_state, obj, "Running", timeout=wait_time)
+        for obj in pod_objs
+    ]
     # If pods not up raise exception/failure
-    if False in [obj.result() for obj in future_pod_objs]:
+    if False in [future.result() for future in future_statuses]:
         raise TimeoutExpiredError("Not all pods are in running state")
     return pod_objs
 
 
 def delete_objs_parallel(obj_list):
     """
-    Function to delete objs specified in list
+    Function to delete objs specified in list using the framework executor
     Args:
         obj_list(list): List can be obj of pod, pvc, etc
 
@@ -2769,21 +2842,18 @@ def delete_objs_parallel(obj_list):
         bool: True if obj deleted else False
 
     """
-    threads = list()
-    for obj in obj_list:
-        if obj is not None:
-            if type(obj) is list:
-                for obj_ in obj:
-                    process = threading.Thread(target=obj_.delete)
-                    process.start()
-                    threads.append(process)
-            else:
-                process = threading.Thread(target=obj.delete)
-                process.start()
-                threads.append(process)
-    for process in threads:
-        process.join()
-    return True
+    executor = get_executor()
+    futures = [
+        executor.submit(obj.delete, verb="delete") for obj in _flatten_objs(obj_list)
+    ]
+    deleted = True
+    for future in futures:
+        try:
+            future.result()
+        except Exception as ex:
+            logger.error(f"Failed to delete object: {ex}")
+            deleted = False
+    return deleted
 
 
 def memory_leak_analysis(median_dict):
@@ -10,6 +10,7 @@ import base64
 import json
 import logging
 import random
+import subprocess
 import threading
 import yaml
 import time
@@ -21,6 +22,7 @@ import math
 from datetime import datetime
 from semantic_version import Version
 from ocs_ci.utility.decorators import enable_high_recovery_during_rebalance_flag
+from ocs_ci.utility.executor import config_context, get_config_index
 
 from ocs_ci.ocs.utils import thread_init_class
 
@@ -52,6 +54,7 @@ from ocs_ci.utility.utils import (
     convert_bytes_to_unit,
     get_trim_mean,
     ceph_health_check,
+    ocsci_log_path,
 )
 from ocs_ci.ocs.node import get_node_ip_addresses, wait_for_nodes_status
 from ocs_ci.ocs.utils import get_pod_name_by_pattern
@@ -652,17 +655,22 @@ class CephCluster(object):
             cmd += f" -f {format}"
         return self.toolbox.exec_cmd_on_pod(cmd, out_yaml_format=False)
 
-    def get_ceph_default_replica(self):
+    def get_ceph_default_replica(self, mgr_dump=None):
         """
         The function return the default replica count in the system,
         taken from 'ceph status'. in case no parameter found, return '0'.
 
+        Args:
+            mgr_dump (dict): Output of 'ceph mgr dump' if already available,
+                None for getting it from the toolbox
+
         Returns:
              int : the default replica count - 0 if not found.
         """
-        ceph_pod = pod.get_ceph_tools_pod()
-        ceph_status = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph mgr dump")
-        av_mod = ceph_status.get("available_modules")
+        if mgr_dump is None:
+            ceph_pod = pod.get_ceph_tools_pod()
+            mgr_dump = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph mgr dump")
+        av_mod = mgr_dump.get("available_modules")
         for mod in av_mod:
             if mod["name"] == "localpool":
                 return mod.get("module_options").get("num_rep").get("default_value")
@@ -683,9 +691,13 @@ class CephCluster(object):
 
         """
         ceph_pod = pod.get_ceph_tools_pod()
-        ceph_status = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph df")
+        ceph_cmds = ["ceph df"] + (["ceph mgr dump"] if replica_divide else [])
+        results = ceph_pod.exec_ceph_cmds(ceph_cmds)
+        ceph_status = results["ceph df"]["output"]
         if replica_divide:
-            replica = int(self.get_ceph_default_replica())
+            replica = int(
+                self.get_ceph_default_replica(results["ceph mgr dump"]["output"])
+            )
             logger.info(f"Number of replica : {replica}")
             usable_capacity = (
                 int(ceph_status["stats"]["total_bytes"]) / replica / constant.GB
@@ -702,11 +714,12 @@ class CephCluster(object):
             float: The free capacity of a cluster (in GB)
 
         """
-        replica = int(self.get_ceph_default_replica())
+        ct_pod = pod.get_ceph_tools_pod()
+        results = ct_pod.exec_ceph_cmds(["ceph mgr dump", "ceph df"])
+        replica = int(self.get_ceph_default_replica(results["ceph mgr dump"]["output"]))
         if replica > 0:
             logger.info(f"Number of replica : {replica}")
-            ct_pod = pod.get_ceph_tools_pod()
-            output = ct_pod.exec_ceph_cmd(ceph_cmd="ceph df")
+            output = results["ceph df"]["output"]
             total_avail = output.get("stats").get("total_bytes")
             total_used = output.get("stats").get("total_used_raw_bytes")
             total_free = total_avail - total_used
@@ -821,8 +834,9 @@ class CephCluster(object):
         """
 
         ceph_pod = pod.get_ceph_tools_pod()
-        ceph_status = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph status")
-        ceph_health = ceph_pod.exec_ceph_cmd(ceph_cmd="ceph health")
+        results = ceph_pod.exec_ceph_cmds(["ceph status", "ceph health"])
+        ceph_status = results["ceph status"]["output"]
+        ceph_health = results["ceph health"]["output"]
         total_pg_count = ceph_status["pgmap"]["num_pgs"]
         pg_states = ceph_status["pgmap"]["pgs_by_state"]
         logger.info(ceph_health)
@@ -1081,43 +1095,258 @@ class MulticlusterCephHealthMonitor(object):
         pass
 
 
+# Timelines of Ceph health transitions recorded by CephHealthMonitor, taken
+# by the reporting plugin after each test
+ceph_health_timelines = list()
+
+# Template of the CephCluster watch output, one line per event
+CEPH_HEALTH_WATCH_TEMPLATE = '{.status.ceph.health}{"\\t"}{.status.ceph.details}{"\\n"}'
+
+
+def is_ceph_health_error(health):
+    """
+    Check if the Ceph health status is error
+
+    Args:
+        health (str): Ceph health status, e.g. HEALTH_WARN
+
+    Returns:
+        bool: True if the health status is error
+
+    """
+    return bool(health) and "HEALTH_ERROR" in health
+
+
+def pop_ceph_health_timelines():
+    """
+    Get the timelines recorded by the Ceph health monitors since the last
+    call and remove them
+
+    Returns:
+        list: Timelines, each a list of the health transitions
+
+    """
+    timelines = list(ceph_health_timelines)
+    del ceph_health_timelines[:]
+    return timelines
+
+
 class CephHealthMonitor(threading.Thread):
     """
     Context manager class for monitoring ceph health status of CephCluster.
     If CephCluster will get to HEALTH_ERROR state it will save the ceph status
     to health_error_status variable and will stop monitoring.
 
+    In watch mode the health reported in the status of the CephCluster CR is
+    watched, so the changes are noticed immediately without executing
+    anything in the toolbox pod. If the watch repeatedly fails, the monitor
+    falls back to the exec mode, which periodically executes
+    `ceph health detail` in the toolbox pod.
+
+    All the health transitions are recorded to the timeline, which is saved
+    to the logs directory and added to the test report.
+
     """
 
-    def __init__(self, ceph_cluster, sleep=5):
+    # Number of consecutive failures of the watch before falling back to exec
+    watch_max_failures = 3
+
+    def __init__(self, ceph_cluster, sleep=5, mode=None):
         """
         Constructor for ceph health status thread.
 
         Args:
             ceph_cluster (CephCluster): Reference to CephCluster object.
-            sleep (int): Number of seconds to sleep between health checks.
+            sleep (int): Number of seconds to sleep between health checks in
+                exec mode and between restarts of the watch.
+            mode (str): "watch" or "exec", if not specified it is taken from
+                RUN['ceph_health_monitor_mode'].
 
         """
         if isinstance(ceph_cluster, CephClusterMultiCluster):
             return MulticlusterCephHealthMonitor()
         self.ceph_cluster = ceph_cluster
         self.sleep = sleep
+        self.mode = mode or config.RUN.get("ceph_health_monitor_mode", "watch")
         self.health_error_status = None
         self.health_monitor_enabled = False
         self.latest_health_status = None
-        super(CephHealthMonitor, self).__init__()
+        self.timeline = list()
+        self._stop_event = threading.Event()
+        self._watch_process = None
+        # Monitor the cluster of the config context in which it was created
+        self.config_index = get_config_index()
+        super(CephHealthMonitor, self).__init__(daemon=True)
 
     def run(self):
         self.health_monitor_enabled = True
+        with config_context(self.config_index):
+            if self.mode == "watch" and self.watch_health():
+                return
+            self.poll_health()
+
+    def poll_health(self):
+        """
+        Periodically check the Ceph health by executing `ceph health detail`
+        in the toolbox pod
+        """
         while self.health_monitor_enabled and (not self.health_error_status):
-            time.sleep(self.sleep)
-            self.latest_health_status = self.ceph_cluster.get_ceph_health(detail=True)
-            if "HEALTH_ERROR" in self.latest_health_status:
+            if self._stop_event.wait(self.sleep):
+                break
+            health_detail = self.ceph_cluster.get_ceph_health(detail=True)
+            health, _, details = health_detail.partition("\n")
+            self.record_health(health.split(" ")[0], details.strip() or None, "exec")
+            self.latest_health_status = health_detail
+
+    def watch_health(self):
+        """
+        Watch the Ceph health in the status of the CephCluster CR until the
+        monitoring is stopped or HEALTH_ERROR is detected. The watch is
+        restarted when it ends, e.g. because of the API server timeout.
+
+        Returns:
+            bool: False if the watch repeatedly failed and the health should
+                be polled in the toolbox pod instead, True otherwise
+
+        """
+        failures = 0
+        while self.health_monitor_enabled and (not self.health_error_status):
+            try:
+                self._watch_cephcluster()
+                failures = 0
+            except (CommandFailed, OSError) as e:
+                failures += 1
+                logger.warning(f"Watch of CephCluster health failed: {e}")
+                if failures >= self.watch_max_failures:
+                    logger.warning(
+                        "Falling back to monitoring of Ceph health in the "
+                        "toolbox pod"
+                    )
+                    self.mode = "exec"
+                    return False
+                if self._stop_event.wait(self.sleep):
+                    break
+        return True
+
+    def _watch_cephcluster(self):
+        """
+        Run watch of the CephCluster CR and record the health from its
+        events, until the watch ends or the monitoring is stopped
+
+        Raises:
+            CommandFailed: If the watch ends with an error
+
+        """
+        cmd = ["oc"]
+        kubeconfig = config.RUN.get("kubeconfig")
+        if kubeconfig:
+            cmd += ["--kubeconfig", kubeconfig]
+        cmd += [
+            "-n",
+            self.ceph_cluster.namespace,
+            "get",
+            "cephcluster",
+            self.ceph_cluster.cluster_name,
+            "--watch",
+            "-o",
+            f"jsonpath={CEPH_HEALTH_WATCH_TEMPLATE}",
+        ]
+        logger.debug(f"Watching CephCluster health: {' '.join(cmd)}")
+        self._watch_process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        try:
+            for line in self._watch_process.stdout:
+                if not self.health_monitor_enabled:
+                    break
+                health, _, details = line.rstrip("\n").partition("\t")
+                if not health:
+                    continue
+                try:
+                    details = json.loads(details) if details else None
+                except ValueError:
+                    pass
+                self.record_health(health, details, "watch")
+                self.latest_health_status = health
+                if self.health_error_status:
+                    break
+        finally:
+            self._stop_watch_process()
+        returncode = self._watch_process.wait()
+        if returncode and self.health_monitor_enabled and not self.health_error_status:
+            raise CommandFailed(
+                f"Error during execution of command: {' '.join(cmd)}."
+                f"\nError is {self._watch_process.stderr.read().strip()}"
+            )
+
+    def _stop_watch_process(self):
+        """
+        Terminate the watch process, if it is running
+        """
+        process = self._watch_process
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def record_health(self, health, details, source):
+        """
+        Record the health to the timeline, if it differs from the last
+        recorded one, and save the Ceph status on HEALTH_ERROR
+
+        Args:
+            health (str): Ceph health status, e.g. HEALTH_WARN
+            details (dict|str): Details of the health status
+            source (str): "watch" or "exec"
+
+        """
+        last = self.timeline[-1] if self.timeline else None
+        if last and (last["health"], last["details"]) == (health, details):
+            return
+        logger.info(f"Ceph health changed to {health} ({source}): {details}")
+        self.timeline.append(
+            {
+                "time": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                "health": health,
+                "details": details,
+                "source": source,
+            }
+        )
+        if is_ceph_health_error(health):
+            try:
                 self.health_error_status = self.ceph_cluster.get_ceph_status()
-                self.log_error_status()
+            except CommandFailed as e:
+                logger.warning(f"Failed to get Ceph status: {e}")
+                self.health_error_status = f"{health}: {details}"
+            self.log_error_status()
+
+    def save_timeline(self):
+        """
+        Save the timeline of the health transitions to the logs directory and
+        make it available for the test report
+        """
+        if not self.timeline:
+            return
+        ceph_health_timelines.append(self.timeline)
+        try:
+            timeline_dir = os.path.join(ocsci_log_path(), "ceph_health_timelines")
+            os.makedirs(timeline_dir, exist_ok=True)
+            file_name = f"{self.ceph_cluster.cluster_name}_{self.timeline[0]['time']}"
+            with open(
+                os.path.join(timeline_dir, f"{file_name.replace(':', '-')}.json"), "w"
+            ) as fd:
+                json.dump(self.timeline, fd, indent=2)
+        except OSError as e:
+            logger.warning(f"Failed to save Ceph health timeline: {e}")
 
     def __enter__(self):
         self.start()
+        return self
 
     def __exit__(self, exception_type, value, traceback):
         """
@@ -1132,6 +1361,10 @@ class CephHealthMonitor(threading.Thread):
 
         """
         self.health_monitor_enabled = False
+        self._stop_event.set()
+        self._stop_watch_process()
+        self.join(timeout=60)
+        self.save_timeline()
         if self.health_error_status:
             self.log_error_status()
         if exception_type:
@@ -2379,10 +2612,11 @@ def get_mds_cache_memory_limit():
 
     """
     pod_obj = pod.get_ceph_tools_pod()
-    ceph_cmd = "ceph config show mds.ocs-storagecluster-cephfilesystem-a mds_cache_memory_limit"
-    mds_a_cache_memory_limit = pod_obj.exec_ceph_cmd(ceph_cmd=ceph_cmd)
-    ceph_cmd = "ceph config show mds.ocs-storagecluster-cephfilesystem-b mds_cache_memory_limit"
-    mds_b_cache_memory_limit = pod_obj.exec_ceph_cmd(ceph_cmd=ceph_cmd)
+    mds_a_cmd = "ceph config show mds.ocs-storagecluster-cephfilesystem-a mds_cache_memory_limit"
+    mds_b_cmd = "ceph config show mds.ocs-storagecluster-cephfilesystem-b mds_cache_memory_limit"
+    results = pod_obj.exec_ceph_cmds([mds_a_cmd, mds_b_cmd])
+    mds_a_cache_memory_limit = results[mds_a_cmd]["output"]
+    mds_b_cache_memory_limit = results[mds_b_cmd]["output"]
 
     if mds_a_cache_memory_limit != mds_b_cache_memory_limit:
         raise UnexpectedBehaviour(
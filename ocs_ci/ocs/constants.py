@@ -2178,6 +2178,8 @@ REVISION_ANNOTATION = "deployment.kubernetes.io/revision"
 MASTER_LABEL = "node-role.kubernetes.io/master"
 WORKER_LABEL = "node-role.kubernetes.io/worker"
 APP_LABEL = "node-role.kubernetes.io/app"
+NODE_ROLE_LABEL_PREFIX = "node-role.kubernetes.io/"
+NODE_ROLE_LEGACY_LABEL = "kubernetes.io/role"
 STRESS_CLI_APP_LABEL = "app=stress-cli"
 S3CLI_APP_LABEL = "app=s3cli"
 OSD_NODE_LABEL = "node.ocs.openshift.io/osd=''"
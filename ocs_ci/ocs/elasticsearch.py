@@ -12,6 +12,7 @@ import json
 import logging
 import os
 import tempfile
+import time
 
 # 3rd party modules
 from elasticsearch import Elasticsearch, helpers, exceptions as esexp
@@ -37,49 +38,106 @@ es_log = logging.getLogger("elasticsearch")
 es_log.setLevel(logging.CRITICAL)
 
 
-def elasticsearch_load(connection, target_path):
+def get_docs_from_file(json_file):
     """
-    Load all data from target_path/results into an elasticsearch (es) server.
+    Stream the documents stored in a text file, one JSON document per line.
+    Lines are read and parsed one at a time, so the file is never held in
+    memory as a whole.
 
     Args:
-        connection (obj): an elasticsearch connection object
-        target_path (str): the path where data was dumped into
+        json_file (str): the file name to look for docs in
 
-    Returns:
-        bool: True if loading data succeed, False otherwise
+    Yields:
+        dict: document as json dict
 
     """
-
-    # define a function that will load a text file
-    def get_data_from_text_file(json_file):
-        """
-        This function will return a list of docs stored in a text file.
-        the function is working as a generator, and return the records
-        one at a time.
-
-        Args:
-            json_file (str): the file name to look for docs in
-
-        Returns:
-             list : list of documents as json dicts
-
-        """
-
-        docs = [
-            l.strip() for l in open(str(json_file), encoding="utf8", errors="ignore")
-        ]
-        log.info(f"String docs length: {len(docs)}")
-
-        for num, doc in enumerate(docs):
+    with open(str(json_file), encoding="utf8", errors="ignore") as fd:
+        for num, line in enumerate(fd):
+            doc = line.strip()
+            if not doc:
+                continue
             try:
-                dict_doc = json.loads(doc)
-                yield dict_doc
+                yield json.loads(doc)
             except json.decoder.JSONDecodeError as err:
                 # print the errors
                 log.error(
                     f"ERROR for num: {num} -- JSONDecodeError: {err} for doc: {doc}"
                 )
 
+
+def load_file_into_elasticsearch(
+    connection, file_name, index_name, chunk_size=500, thread_count=1
+):
+    """
+    Stream the documents of a file into an elasticsearch (es) index.
+
+    Args:
+        connection (obj): an elasticsearch connection object
+        file_name (str): the file with one JSON document per line
+        index_name (str): the name of the index to load the documents into
+        chunk_size (int): number of documents in one bulk request
+        thread_count (int): number of concurrent bulk requests, with 1 the
+            documents are loaded by helpers.streaming_bulk, otherwise by
+            helpers.parallel_bulk
+
+    Returns:
+        dict: loading statistics - number of indexed and failed documents,
+            size of the file in bytes, duration in seconds and throughput in
+            documents per second
+
+    """
+    start_time = time.time()
+    if thread_count > 1:
+        results = helpers.parallel_bulk(
+            connection,
+            get_docs_from_file(file_name),
+            index=index_name,
+            chunk_size=chunk_size,
+            thread_count=thread_count,
+            raise_on_error=False,
+        )
+    else:
+        results = helpers.streaming_bulk(
+            connection,
+            get_docs_from_file(file_name),
+            index=index_name,
+            chunk_size=chunk_size,
+            raise_on_error=False,
+        )
+    indexed = failed = 0
+    for ok, item in results:
+        if ok:
+            indexed += 1
+        else:
+            failed += 1
+            log.error(f"Failed to index document into {index_name}: {item}")
+    duration = time.time() - start_time
+    stats = {
+        "index": index_name,
+        "indexed": indexed,
+        "failed": failed,
+        "bytes": os.path.getsize(file_name),
+        "duration": round(duration, 3),
+        "docs_per_sec": round(indexed / duration, 2) if duration else indexed,
+    }
+    log.info(f"Loaded {file_name} into the ES server: {stats}")
+    return stats
+
+
+def elasticsearch_load(connection, target_path, chunk_size=500, thread_count=1):
+    """
+    Load all data from target_path/results into an elasticsearch (es) server.
+
+    Args:
+        connection (obj): an elasticsearch connection object
+        target_path (str): the path where data was dumped into
+        chunk_size (int): number of documents in one bulk request
+        thread_count (int): number of concurrent bulk requests per file
+
+    Returns:
+        bool: True if loading data succeed, False otherwise
+
+    """
     all_files = run_command(f"ls {target_path}/results/", out_format="list")
     if "Error in command" in all_files:
         log.error("There is No data to load into ES server")
@@ -96,12 +154,15 @@ def elasticsearch_load(connection, target_path):
                 log.info(f"Loading the {ind} data into the ES server")
 
                 try:
-                    resp = helpers.bulk(
-                        connection, get_data_from_text_file(file_name), index=ind_name
+                    load_file_into_elasticsearch(
+                        connection,
+                        file_name,
+                        ind_name,
+                        chunk_size=chunk_size,
+                        thread_count=thread_count,
                     )
-                    log.info(f"helpers.bulk() RESPONSE: {resp}")
                 except Exception as err:
-                    log.error(f"Elasticsearch helpers.bulk() ERROR:{err}")
+                    log.error(f"Elasticsearch bulk loading ERROR:{err}")
         return True
 
 
@@ -0,0 +1,200 @@
+# -*- coding: utf8 -*-
+"""
+Inventory of the container images running in the cluster.
+
+The inventory is built from one list of the pods in all namespaces, which is
+filtered locally, and it is cached per cluster for the whole session, so the
+version report and other consumers share it without listing the pods again.
+Use ``get_image_inventory(refresh=True)`` where the current state is needed,
+e.g. after an upgrade.
+"""
+
+import logging
+import re
+from collections import OrderedDict
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+
+logger = logging.getLogger(__name__)
+
+# Namespaces of the storage stack, e.g. openshift-storage and
+# openshift-cluster-storage-operator
+STORAGE_NAMESPACE_PATTERN = re.compile("^openshift.*storage")
+
+# Cluster (name, kubeconfig) to its ImageInventory
+_inventory_cache = {}
+
+
+class ImageInventory(object):
+    """
+    Images of the containers of the pods in the cluster
+    """
+
+    def __init__(self, pods):
+        """
+        Constructor of ImageInventory
+
+        Args:
+            pods (list): Pod resources from all the namespaces
+
+        """
+        # Records of every container: namespace, pod, container name, image
+        # and image ID (None if the container has no status yet)
+        self.containers = []
+        for pod_data in pods:
+            metadata = pod_data["metadata"]
+            statuses = {
+                container_status["name"]: container_status
+                for container_status in pod_data.get("status", {}).get(
+                    "containerStatuses"
+                )
+                or []
+            }
+            for container in pod_data.get("spec", {}).get("containers", []):
+                container_status = statuses.get(container["name"], {})
+                self.containers.append(
+                    {
+                        "namespace": metadata["namespace"],
+                        "pod": metadata["name"],
+                        "labels": metadata.get("labels") or {},
+                        "container": container["name"],
+                        "image": container_status.get("image", container["image"]),
+                        "image_id": container_status.get("imageID"),
+                    }
+                )
+
+    @classmethod
+    def from_cluster(cls):
+        """
+        Build the inventory from one list of the pods in all namespaces
+
+        Returns:
+            ImageInventory: The inventory of the current cluster
+
+        """
+        pods = OCP(kind=constants.POD).get(all_namespaces=True)["items"]
+        inventory = cls(pods)
+        logger.info(
+            f"Image inventory: {len(inventory.containers)} containers in "
+            f"{len(pods)} pods"
+        )
+        return inventory
+
+    def get_namespaces(self, pattern=None):
+        """
+        Get namespaces with running pods
+
+        Args:
+            pattern (re.Pattern): Pattern the namespaces have to match
+
+        Returns:
+            list: Sorted names of the namespaces
+
+        """
+        return sorted(
+            {
+                record["namespace"]
+                for record in self.containers
+                if not pattern or pattern.match(record["namespace"])
+            }
+        )
+
+    def get_containers(self, namespace=None, selector=None):
+        """
+        Get container records, filtered by namespace and labels
+
+        Args:
+            namespace (str): Namespace of the pods, all if not specified
+            selector (dict): Labels the pods have to have
+
+        Returns:
+            list: Dicts with namespace, pod, labels, container, image and
+                image_id of the containers
+
+        """
+        selector = selector or {}
+        return [
+            record
+            for record in self.containers
+            if (not namespace or record["namespace"] == namespace)
+            and all(record["labels"].get(k) == v for k, v in selector.items())
+        ]
+
+    def get_image_ids(self, namespace):
+        """
+        Get image IDs of the images running in the namespace. Containers
+        without status are skipped.
+
+        Args:
+            namespace (str): The namespace
+
+        Returns:
+            dict: Image to set of its image IDs
+
+        """
+        image_ids = OrderedDict()
+        for record in self.get_containers(namespace=namespace):
+            if record["image_id"] is None:
+                continue
+            image_ids.setdefault(record["image"], set()).add(record["image_id"])
+        return image_ids
+
+    def get_storage_image_ids(self):
+        """
+        Get image IDs of the images per storage namespace, in the format of
+        the version report
+
+        Returns:
+            dict: Storage namespace to dict of image to set of its image IDs
+
+        """
+        return OrderedDict(
+            (namespace, self.get_image_ids(namespace))
+            for namespace in self.get_namespaces(STORAGE_NAMESPACE_PATTERN)
+        )
+
+    def find_images(self, pattern):
+        """
+        Find images running in the cluster
+
+        Args:
+            pattern (str): Regular expression to search for in the images
+
+        Returns:
+            list: Sorted matching images
+
+        """
+        pattern = re.compile(pattern)
+        return sorted(
+            {
+                record["image"]
+                for record in self.containers
+                if pattern.search(record["image"])
+            }
+        )
+
+
+def get_image_inventory(refresh=False):
+    """
+    Get image inventory of the current cluster, cached for the session
+
+    Args:
+        refresh (bool): True to list the pods again and update the cache
+
+    Returns:
+        ImageInventory: The inventory
+
+    """
+    key = (config.ENV_DATA.get("cluster_name"), config.RUN.get("kubeconfig"))
+    if refresh or key not in _inventory_cache:
+        _inventory_cache[key] = ImageInventory.from_cluster()
+    return _inventory_cache[key]
+
+
+def clear_image_inventory_cache():
+    """
+    Remove the cached inventories of all the clusters
+    """
+    _inventory_cache.clear()
@@ -14,6 +14,7 @@ from ocs_ci.ocs.must_gather.const_must_gather import (
     GATHER_COMMANDS_VERSION,
     GATHER_COMMANDS_LOG,
 )
+from ocs_ci.ocs.must_gather.must_gather_index import MustGatherIndex
 from ocs_ci.utility import version
 from ocs_ci.ocs.constants import DEFAULT_CEPHBLOCKPOOL, MANAGED_SERVICE_PLATFORMS
 
@@ -36,6 +37,22 @@ class MustGather(object):
         self.files_content_issue = list()
         self.ocs_version = version.get_semantic_ocs_version_from_config()
         self.full_paths = list()
+        self._index = None
+
+    @property
+    def index(self):
+        """
+        Index of the paths in the must-gather directory, built on the first
+        access after the collection and reused by all the validations
+
+        Returns:
+            MustGatherIndex: The index of the must-gather directory
+
+        """
+        if self._index is None or self._index.root != self.root:
+            logger.info(f"Indexing must-gather directory {self.root}")
+            self._index = MustGatherIndex(self.root)
+        return self._index
 
     @property
     def log_type(self):
@@ -61,6 +78,7 @@ class MustGather(object):
             dir_name=temp_folder, ocp=False, ocs_flags=ocs_flags, mg_options=mg_options
         )
         self.root = temp_folder + "_ocs_logs"
+        self._index = None
 
     def search_file_path(self):
         """
@@ -118,25 +136,21 @@ class MustGather(object):
             )
 
         self.get_all_paths()
-        basenames = {}
-        for p in self.full_paths:
-            bn = os.path.basename(p)
-            if bn not in basenames or os.path.isfile(p):
-                basenames[bn] = p
         for file in files:
-            if file in basenames:
-                self.files_path[file] = basenames[file]
-            elif (
-                ec_pool
-                and DEFAULT_CEPHBLOCKPOOL in file
-                and file.replace(DEFAULT_CEPHBLOCKPOOL, ec_pool) in basenames
-            ):
-                ec_file = file.replace(DEFAULT_CEPHBLOCKPOOL, ec_pool)
+            file_path = self.index.find(file)
+            ec_file = (
+                file.replace(DEFAULT_CEPHBLOCKPOOL, ec_pool)
+                if ec_pool and DEFAULT_CEPHBLOCKPOOL in file
+                else None
+            )
+            if file_path:
+                self.files_path[file] = file_path
+            elif ec_file and self.index.find(ec_file):
                 logger.info(
                     f"Must-gather file '{file}' not found, matched EC "
                     f"variant '{ec_file}'"
                 )
-                self.files_path[file] = basenames[ec_file]
+                self.files_path[file] = self.index.find(ec_file)
             else:
                 self.files_not_exist.append(file)
 
@@ -147,15 +161,11 @@ class MustGather(object):
         """
         if self.type_log != "OTHERS":
             return
-        for path, subdirs, files in os.walk(self.root):
-            for file in files:
-                file_path = os.path.join(path, file)
-                if (
-                    Path(file_path).stat().st_size == 0
-                    and "noobaa-db-pg-0-init.log" not in file_path
-                ):
-                    logger.error(f"log file {file} empty!")
-                    self.empty_files.append(file)
+        for file_path, size in self.index.files_on_disk():
+            if size == 0 and "noobaa-db-pg-0-init.log" not in file_path:
+                file = os.path.basename(file_path)
+                logger.error(f"log file {file} empty!")
+                self.empty_files.append(file)
 
     def validate_expected_files(self):
         """
@@ -186,16 +196,16 @@ class MustGather(object):
         if self.type_log != "CEPH" or self.ocs_version < version.VERSION_4_9:
             return
         pattern = re.compile("exit code [1-9]+")
-        for root, dirs, files in os.walk(self.root):
-            for file in files:
-                try:
-                    with open(os.path.join(root, file), "r") as f:
-                        data_file = f.read()
-                    exit_code_error = pattern.findall(data_file.lower())
-                    if len(exit_code_error) > 0 and "gather-debug" not in file:
-                        self.files_content_issue.append(os.path.join(root, file))
-                except Exception as e:
-                    logger.error(f"There is no option to read {file}, error: {e}")
+        for file_path, _ in self.index.files_on_disk():
+            file = os.path.basename(file_path)
+            try:
+                with open(file_path, "r") as f:
+                    data_file = f.read()
+                exit_code_error = pattern.findall(data_file.lower())
+                if len(exit_code_error) > 0 and "gather-debug" not in file:
+                    self.files_content_issue.append(file_path)
+            except Exception as e:
+                logger.error(f"There is no option to read {file}, error: {e}")
 
     def print_must_gather_debug(self) -> None:
         try:
@@ -221,7 +231,7 @@ class MustGather(object):
                 pod_names.append(pod.name)
 
         pod_path = None
-        for dir_name, subdir_list, files_list in os.walk(self.root):
+        for dir_name in self.index.dirs:
             if re.search("openshift-storage/pods$", dir_name):
                 pod_path = dir_name
                 break
@@ -236,7 +246,7 @@ class MustGather(object):
         else:
             pods_pattern = re.compile(r"openshift-storage/pods/([^/]+)")
             seen = set()
-            for full_path in self.full_paths:
+            for full_path in self.index.paths:
                 match = pods_pattern.search(full_path)
                 if match and match.group(1) not in seen:
                     seen.add(match.group(1))
@@ -318,6 +328,7 @@ class MustGather(object):
                         logger.info(f"Extract noobaa_diagnostics: {full_path}")
                         with tarfile.open(full_path) as f:
                             f.extractall(os.path.dirname(full_path))
+                        self.index.update(os.path.dirname(full_path))
                     else:
                         logger.info(f"Found noobaa_diagnostics in tarball: {full_path}")
                     break
@@ -325,54 +336,17 @@ class MustGather(object):
                 logger.error("noobaa_diagnostics.tar.gz does not exist")
                 self.files_not_exist.append("noobaa_diagnostics.tar.gz")
 
-    def _get_paths_from_tarball(self, tarball_path):
-        """
-        Collect all member paths from a must-gather tar.gz archive.
-
-        Args:
-            tarball_path (str): path to the .tar.gz file
-
-        Returns:
-            list: paths of all members (files and dirs) in the archive
-
-        """
-        paths = []
-        try:
-            with tarfile.open(tarball_path, "r:*") as tar:
-                for member in tar.getmembers():
-                    # Add the member path (files and dirs)
-                    paths.append(member.name)
-                    # Ensure parent directory paths are included for substring
-                    # matching in verify_paths_in_dir / verify_paths_not_in_dir
-                    parts = member.name.replace("\\", "/").split("/")
-                    for i in range(1, len(parts)):
-                        parent = "/".join(parts[:i])
-                        if parent and parent not in paths:
-                            paths.append(parent)
-        except (tarfile.TarError, OSError) as e:
-            logger.warning(f"Could not read tarball {tarball_path}: {e}")
-        return paths
-
     def get_all_paths(self):
         """
         Get all paths in must gather dir (directory and/or tar.gz archives).
 
         When REPORTING["tarball_mg_logs"] is used, must-gather may be packed
-        into a .tar.gz; this method collects paths from both directory trees
-        and from inside such tarballs.
+        into a .tar.gz; the paths are collected from both directory trees
+        and from inside such tarballs. The directory is walked only once per
+        collection, see MustGather.index.
 
         """
-        self.full_paths = []
-
-        for root_dir, dirs, files in os.walk(self.root):
-            for name in files + dirs:
-                full_path = os.path.join(root_dir, name)
-                self.full_paths.append(full_path)
-            # Collect paths from must-gather tarballs found under root
-            for name in files:
-                if name.endswith(".tar.gz"):
-                    tarball_path = os.path.join(root_dir, name)
-                    self.full_paths.extend(self._get_paths_from_tarball(tarball_path))
+        self.full_paths = list(self.index.paths)
 
     def verify_paths_in_dir(self, paths):
         """
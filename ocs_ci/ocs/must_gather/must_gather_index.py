@@ -0,0 +1,138 @@
+import logging
+import os
+import tarfile
+
+logger = logging.getLogger(__name__)
+
+
+class MustGatherIndex(object):
+    """
+    Index of the paths in a must-gather directory, built by a single walk of
+    the directory tree (including the members of must-gather tarballs) and
+    reused for all the lookups during must-gather validation.
+
+    """
+
+    def __init__(self, root):
+        """
+        Constructor for MustGatherIndex class
+
+        Args:
+            root (str): Path to the must-gather directory
+
+        """
+        self.root = root
+        # All the paths (files and directories) in the order of the walk
+        self.paths = list()
+        # Basename to list of paths with that basename
+        self.basenames = dict()
+        # Path of a regular file to its size in bytes
+        self.file_sizes = dict()
+        # Regular files on the disk (not tarball members)
+        self.disk_files = list()
+        # Directories on the disk in the order of the walk
+        self.dirs = list()
+        self._known_paths = set()
+        self.update(root)
+
+    def _add_path(self, path, is_file=False, size=None):
+        """
+        Add the path to the index, if it is not indexed yet
+
+        Args:
+            path (str): The path to add
+            is_file (bool): True if the path is a regular file
+            size (int): Size of the file in bytes, None if unknown
+
+        """
+        if path in self._known_paths:
+            return
+        self._known_paths.add(path)
+        self.paths.append(path)
+        self.basenames.setdefault(os.path.basename(path), list()).append(path)
+        if is_file:
+            self.file_sizes[path] = size
+
+    def _add_tarball(self, tarball_path):
+        """
+        Add paths of the members of a must-gather tarball to the index,
+        including the parent directories of the members
+
+        Args:
+            tarball_path (str): Path to the .tar.gz file
+
+        """
+        try:
+            with tarfile.open(tarball_path, "r:*") as tar:
+                for member in tar:
+                    name = member.name.replace("\\", "/")
+                    self._add_path(
+                        name,
+                        is_file=member.isfile(),
+                        size=member.size if member.isfile() else None,
+                    )
+                    parts = name.split("/")
+                    for i in range(1, len(parts)):
+                        parent = "/".join(parts[:i])
+                        if parent:
+                            self._add_path(parent)
+        except (tarfile.TarError, OSError) as e:
+            logger.warning(f"Could not read tarball {tarball_path}: {e}")
+
+    def update(self, path):
+        """
+        Walk the directory and add its paths which are not indexed yet, e.g.
+        after an archive was extracted in the must-gather directory
+
+        Args:
+            path (str): Path to the directory in the must-gather directory
+
+        """
+        for root_dir, dirs, files in os.walk(path):
+            for name in dirs:
+                dir_path = os.path.join(root_dir, name)
+                if dir_path not in self._known_paths:
+                    self.dirs.append(dir_path)
+                self._add_path(dir_path)
+            for name in files:
+                file_path = os.path.join(root_dir, name)
+                try:
+                    size = os.lstat(file_path).st_size
+                except OSError:
+                    size = None
+                if file_path in self._known_paths:
+                    continue
+                self.disk_files.append(file_path)
+                self._add_path(file_path, is_file=True, size=size)
+                if name.endswith(".tar.gz"):
+                    self._add_tarball(file_path)
+
+    def find(self, basename):
+        """
+        Find the path with the given basename, the last found regular file
+        is preferred over directories
+
+        Args:
+            basename (str): Basename of the path
+
+        Returns:
+            str: The path, None if not found
+
+        """
+        paths = self.basenames.get(basename)
+        if not paths:
+            return None
+        for path in reversed(paths):
+            if path in self.file_sizes:
+                return path
+        return paths[0]
+
+    def files_on_disk(self):
+        """
+        Get regular files on the disk (not tarball members) with their sizes
+
+        Returns:
+            list: Tuples of the file path and size in bytes
+
+        """
+        return [(path, self.file_sizes[path]) for path in self.disk_files]
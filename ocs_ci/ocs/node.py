@@ -2,6 +2,10 @@ import copy
 import logging
 import re
 import shlex
+import signal
+import subprocess
+import tempfile
+import threading
 import time
 from prettytable import PrettyTable
 from collections import defaultdict
@@ -33,7 +37,14 @@ from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs import constants, exceptions, ocp, defaults
 from ocs_ci.ocs.resources.pvc import get_pvc_size
+from ocs_ci.ocs.utilization import (
+    UtilizationSampler,
+    aggregate_pod_requests,
+    get_percent,
+    parse_quantity,
+)
 from ocs_ci.utility import version
+from ocs_ci.utility.executor import config_context, get_config_index
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
     TimeoutSampler,
@@ -240,17 +251,60 @@ def get_node_objs(node_names=None):
     return nodes
 
 
+def get_node_roles(node_dict):
+    """
+    Get roles of the node from its labels, the same way as they are shown in
+    the ROLES column of 'oc get node' - from the node-role.kubernetes.io/<role>
+    labels and the value of the kubernetes.io/role label
+
+    Args:
+        node_dict (dict): The node resource
+
+    Returns:
+        list: Sorted roles of the node
+
+    """
+    roles = set()
+    labels = node_dict.get("metadata", {}).get("labels") or {}
+    for label, value in labels.items():
+        if label.startswith(constants.NODE_ROLE_LABEL_PREFIX):
+            role = label[len(constants.NODE_ROLE_LABEL_PREFIX) :]
+            if role:
+                roles.add(role)
+        elif label == constants.NODE_ROLE_LEGACY_LABEL and value:
+            roles.add(value)
+    return sorted(roles)
+
+
+def get_node_roles_column(node_dict):
+    """
+    Get the value of the ROLES column of 'oc get node' for the node, without
+    executing the command
+
+    Args:
+        node_dict (dict): The node resource
+
+    Returns:
+        str: Comma separated roles of the node, '<none>' if it has no role
+
+    """
+    return ",".join(get_node_roles(node_dict)) or "<none>"
+
+
 def get_nodes(node_type=constants.WORKER_MACHINE, num_of_nodes=None, retry=3):
     """
     Get cluster's nodes according to the node type (e.g. worker, master) and the
     number of requested nodes from that type.
     In case of HCI provider cluster and 'node_type' is worker, it will exclude the master nodes.
 
+    The nodes are listed with a single 'oc get' and their roles are taken from
+    their labels.
+
     Args:
         node_type (str): The node type (e.g. worker, master)
         num_of_nodes (int): The number of nodes to be returned
         retry (int): Number of attempts to retry to get the node
-            resource via ``oc get``.
+            resources via ``oc get``.
 
     Returns:
         list: The nodes OCP instances
@@ -258,40 +312,19 @@ def get_nodes(node_type=constants.WORKER_MACHINE, num_of_nodes=None, retry=3):
     """
     from ocs_ci.ocs.cluster import is_hci_provider_cluster
 
-    if (
-        config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS
-        and node_type == constants.WORKER_MACHINE
-    ):
-        typed_nodes = [
-            node
-            for node in get_node_objs()
-            if node_type
-            in node.ocp.get_resource(
-                resource_name=node.name, column="ROLES", retry=retry
-            )
-            and constants.INFRA_MACHINE
-            not in node.ocp.get_resource(
-                resource_name=node.name, column="ROLES", retry=retry
-            )
-        ]
-    else:
-        typed_nodes = [
-            node
-            for node in get_node_objs()
-            if node_type
-            in node.ocp.get_resource(
-                resource_name=node.name, column="ROLES", retry=retry
-            )
-        ]
-    if is_hci_provider_cluster() and node_type == constants.WORKER_MACHINE:
-        typed_nodes = [
-            node
-            for node in typed_nodes
-            if constants.MASTER_MACHINE
-            not in node.ocp.get_resource(
-                resource_name=node.name, column="ROLES", retry=retry
-            )
-        ]
+    excluded_roles = []
+    if node_type == constants.WORKER_MACHINE:
+        if config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS:
+            excluded_roles.append(constants.INFRA_MACHINE)
+        if is_hci_provider_cluster():
+            excluded_roles.append(constants.MASTER_MACHINE)
+
+    node_dicts = OCP(kind="node").get(retry=retry)["items"]
+    typed_nodes = []
+    for node_dict in node_dicts:
+        roles = get_node_roles_column(node_dict)
+        if node_type in roles and not any(role in roles for role in excluded_roles):
+            typed_nodes.append(OCS(**node_dict))
 
     if num_of_nodes:
         typed_nodes = typed_nodes[:num_of_nodes]
@@ -327,12 +360,203 @@ def get_all_nodes():
     return [node["metadata"]["name"] for node in node_items]
 
 
+def get_node_status_from_dict(node_dict):
+    """
+    Get status of the node from its Ready condition and spec.unschedulable,
+    the same way as it is shown in the STATUS column of 'oc get node'
+
+    Args:
+        node_dict (dict): The node resource
+
+    Returns:
+        str: The node status (e.g. 'Ready', 'NotReady', 'Ready,SchedulingDisabled')
+
+    """
+    ready = None
+    for condition in node_dict.get("status", {}).get("conditions") or []:
+        if condition.get("type") == "Ready":
+            ready = condition.get("status")
+    return get_node_status_from_fields(
+        ready, node_dict.get("spec", {}).get("unschedulable")
+    )
+
+
+def get_node_status_from_fields(ready, unschedulable):
+    """
+    Get status of the node as shown in the STATUS column of 'oc get node'
+
+    Args:
+        ready (str): Status of the Ready condition ('True', 'False',
+            'Unknown'), None if the node has no Ready condition
+        unschedulable (bool|str): Value of spec.unschedulable
+
+    Returns:
+        str: The node status
+
+    """
+    if ready is None:
+        status = ["Unknown"]
+    elif ready == "True":
+        status = [constants.NODE_READY]
+    else:
+        status = [constants.NODE_NOT_READY]
+    if unschedulable in (True, "true"):
+        status.append("SchedulingDisabled")
+    return ",".join(status)
+
+
+def get_nodes_status(node_names=None):
+    """
+    Get status of the nodes from a single node list
+
+    Args:
+        node_names (list): The node names, all cluster nodes if None
+
+    Returns:
+        dict: Node name to its status
+
+    """
+    return {
+        node_dict["metadata"]["name"]: get_node_status_from_dict(node_dict)
+        for node_dict in OCP(kind="node").get()["items"]
+        if not node_names or node_dict["metadata"]["name"] in node_names
+    }
+
+
+def get_node_states(node_dicts):
+    """
+    Get statuses and boot IDs of the nodes
+
+    Args:
+        node_dicts (list): The node resources
+
+    Returns:
+        tuple: Dicts of node name to its status and to its boot ID
+
+    """
+    statuses = {}
+    boot_ids = {}
+    for node_dict in node_dicts:
+        name = node_dict["metadata"]["name"]
+        statuses[name] = get_node_status_from_dict(node_dict)
+        boot_ids[name] = node_dict.get("status", {}).get("nodeInfo", {}).get("bootID")
+    return statuses, boot_ids
+
+
+class NodeStatusWatch(threading.Thread):
+    """
+    Thread watching the nodes and keeping their statuses and boot IDs up to
+    date. They are initialized from a node list and updated from the watch
+    events, on_change callback is called when a node status or boot ID
+    changes.
+
+    """
+
+    # Template of the node watch output, one line per event
+    watch_template = (
+        '{.metadata.name}{"\\t"}{.spec.unschedulable}{"\\t"}'
+        '{.status.conditions[?(@.type=="Ready")].status}{"\\t"}'
+        '{.status.nodeInfo.bootID}{"\\n"}'
+    )
+
+    def __init__(self, on_change=None):
+        """
+        Constructor of NodeStatusWatch
+
+        Args:
+            on_change (function): Called without arguments when status or
+                boot ID of a node changes
+
+        """
+        super(NodeStatusWatch, self).__init__(daemon=True)
+        self.on_change = on_change
+        self.statuses, self.boot_ids = get_node_states(OCP(kind="node").get()["items"])
+        self.error = None
+        self.config_index = get_config_index()
+        self._process = None
+        self._stopped = False
+
+    def run(self):
+        # Watch the cluster of the thread which created the watch
+        with config_context(self.config_index):
+            cmd = ["oc"]
+            kubeconfig = config.RUN.get("kubeconfig")
+            if kubeconfig:
+                cmd += ["--kubeconfig", kubeconfig]
+            cmd += ["get", "node", "--watch", "-o", f"jsonpath={self.watch_template}"]
+            # stderr is not read while the watch runs, a file doesn't block
+            # oc when it writes a lot of warnings
+            with tempfile.TemporaryFile() as stderr:
+                try:
+                    self._process = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.PIPE,
+                        stderr=stderr,
+                        universal_newlines=True,
+                        start_new_session=True,
+                    )
+                    for line in self._process.stdout:
+                        name, unschedulable, ready, boot_id = (
+                            line.rstrip("\n").split("\t") + [""] * 4
+                        )[:4]
+                        if not name:
+                            continue
+                        status = get_node_status_from_fields(
+                            ready or None, unschedulable
+                        )
+                        changed = False
+                        if self.statuses.get(name) != status:
+                            log.info(f"Node {name} status changed to {status}")
+                            self.statuses = dict(self.statuses, **{name: status})
+                            changed = True
+                        if boot_id and self.boot_ids.get(name) != boot_id:
+                            log.info(f"Node {name} boot ID changed to {boot_id}")
+                            self.boot_ids = dict(self.boot_ids, **{name: boot_id})
+                            changed = True
+                        if changed and self.on_change:
+                            self.on_change()
+                    if self._process.wait() and not self._stopped:
+                        stderr.seek(0)
+                        self.error = stderr.read().decode(errors="replace").strip()
+                except OSError as e:
+                    self.error = str(e)
+            if self.error:
+                log.warning(f"Watch of node status failed: {self.error}")
+            elif not self._stopped:
+                self.error = "Watch of node status ended"
+            if self.on_change:
+                self.on_change()
+
+    @property
+    def watching(self):
+        """
+        bool: True if the statuses are kept up to date by the watch
+        """
+        return self.is_alive() and not self.error
+
+    def stop(self):
+        """
+        Stop the watch
+        """
+        self._stopped = True
+        if self._process and self._process.poll() is None:
+            try:
+                os.killpg(self._process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        self.join(timeout=10)
+
+
 def wait_for_nodes_status(
-    node_names=None, status=constants.NODE_READY, timeout=600, sleep=3
+    node_names=None, status=constants.NODE_READY, timeout=600, sleep=3, watch=None
 ):
     """
     Wait until all nodes are in the given status
 
+    The statuses of all the nodes are taken from a single node list per
+    attempt. With watch, the statuses are updated by a node watch and the
+    changes are evaluated as soon as they happen.
+
     Args:
         node_names (list): The node names to wait for to reached the desired state
             If None, will wait for all cluster nodes
@@ -341,12 +565,17 @@ def wait_for_nodes_status(
         timeout (int): The number in seconds to wait for the nodes to reach
             the status
         sleep (int): Time in seconds to sleep between attempts
+        watch (bool): True to watch the nodes instead of listing them on
+            every attempt, if None it is taken from RUN['watch_node_status']
 
     Raises:
         ResourceWrongStatusException: In case one or more nodes haven't
             reached the desired state
 
     """
+    if watch is None:
+        watch = config.RUN.get("watch_node_status", False)
+    node_watch = None
     try:
         if not node_names:
             for sample in TimeoutSampler(60, 3, get_node_objs):
@@ -355,15 +584,23 @@ def wait_for_nodes_status(
                     break
         nodes_not_in_state = copy.deepcopy(node_names)
         log.info(f"Waiting for nodes {node_names} to reach status {status}")
-        for sample in TimeoutSampler(timeout, sleep, get_node_objs, nodes_not_in_state):
-            for node in sample:
-                try:
-                    if node.ocp.get_resource_status(node.name) == status:
-                        log.info(f"Node {node.name} reached status {status}")
-                        nodes_not_in_state.remove(node.name)
-                except CommandFailed as ex:
-                    log.info(f"failed to get the node status by error {ex}")
-                    continue
+        sampler = TimeoutSampler(
+            timeout,
+            sleep,
+            lambda: (
+                node_watch.statuses
+                if node_watch and node_watch.watching
+                else get_nodes_status(nodes_not_in_state)
+            ),
+        )
+        if watch:
+            node_watch = NodeStatusWatch(on_change=sampler.wake_up)
+            node_watch.start()
+        for sample in sampler:
+            for node_name, node_status in sample.items():
+                if node_name in nodes_not_in_state and node_status == status:
+                    log.info(f"Node {node_name} reached status {status}")
+                    nodes_not_in_state.remove(node_name)
             if not nodes_not_in_state:
                 break
         log.info(f"The following nodes reached status {status}: {node_names}")
@@ -376,6 +613,9 @@ def wait_for_nodes_status(
             f"{node_names}, {[n.describe() for n in get_node_objs(node_names)]}"
         )
         raise exceptions.ResourceWrongStatusException(error_message)
+    finally:
+        if node_watch:
+            node_watch.stop()
 
 
 def unschedule_nodes(node_names):
@@ -767,29 +1007,21 @@ def get_node_resource_utilization_from_adm_top(
     # Validate node is in Ready state
     wait_for_nodes_status(node_names, status=constants.NODE_READY, timeout=30)
 
-    obj = ocp.OCP()
-    resource_utilization_all_nodes = obj.exec_oc_cmd(
-        command="adm top nodes", out_yaml_format=False
-    ).split("\n")
+    # Same values as in oc adm top nodes, taken from the metrics API
+    sample = UtilizationSampler().sample(node_names=node_names)
     utilization_dict = {}
 
     for node in node_names:
-        for value in resource_utilization_all_nodes:
-            if node in value:
-                value = re.findall(r"(\d{1,3})%", value.strip())
-                cpu_utilization = value[0]
-                log.info(
-                    "The CPU utilized by the node " f"{node} is {cpu_utilization}%"
-                )
-                memory_utilization = value[1]
-                log.info(
-                    "The memory utilized of the node "
-                    f"{node} is {memory_utilization}%"
-                )
-                utilization_dict[node] = {
-                    "cpu": int(cpu_utilization),
-                    "memory": int(memory_utilization),
-                }
+        if node not in sample:
+            continue
+        cpu_utilization = sample[node]["cpu_percent"]
+        log.info("The CPU utilized by the node " f"{node} is {cpu_utilization}%")
+        memory_utilization = sample[node]["memory_percent"]
+        log.info("The memory utilized of the node " f"{node} is {memory_utilization}%")
+        utilization_dict[node] = {
+            "cpu": cpu_utilization,
+            "memory": memory_utilization,
+        }
 
     if print_table:
         print_table_node_resource_utilization(
@@ -817,6 +1049,9 @@ def get_node_resource_utilization_from_oc_describe(
         dict : Node name and its cpu and memory utilization in
                percentage
 
+    Raises:
+        CommandFailed: If the node doesn't exist
+
     """
 
     node_names = (
@@ -824,20 +1059,26 @@ def get_node_resource_utilization_from_oc_describe(
         if nodename
         else [node.name for node in get_nodes(node_type=node_type)]
     )
-    obj = ocp.OCP()
+    # Same values as the allocated resources in oc describe node, computed
+    # from the pod specs
+    sampler = UtilizationSampler()
+    allocatable = {
+        node["metadata"]["name"]: node["status"]["allocatable"]
+        for node in sampler.get_nodes()
+    }
+    missing = [node for node in node_names if node not in allocatable]
+    if missing:
+        raise CommandFailed(f'nodes "{", ".join(missing)}" not found')
+    requests = aggregate_pod_requests(sampler.get_pods(), node_names=node_names)
     utilization_dict = {}
     for node in node_names:
-        output = obj.exec_oc_cmd(
-            command=f"describe node {node}", out_yaml_format=False
-        ).split("\n")
-        for line in output:
-            if "cpu  " in line:
-                cpu_data = line.split(" ")
-                cpu = re.findall(r"\d+", [i for i in cpu_data if i][2])
-            if "memory  " in line:
-                mem_data = line.split(" ")
-                mem = re.findall(r"\d+", [i for i in mem_data if i][2])
-        utilization_dict[node] = {"cpu": int(cpu[0]), "memory": int(mem[0])}
+        cpu_requests, memory_requests, _ = requests.get(node, (0.0, 0.0, 0))
+        utilization_dict[node] = {
+            "cpu": get_percent(cpu_requests, parse_quantity(allocatable[node]["cpu"])),
+            "memory": get_percent(
+                memory_requests, parse_quantity(allocatable[node]["memory"])
+            ),
+        }
 
     if print_table:
         print_table_node_resource_utilization(
@@ -3260,32 +3501,34 @@ def generate_nodes_for_provider_worker_node_tests():
     return generated_nodes
 
 
-def gracefully_reboot_nodes(disable_eviction=False):
+def gracefully_reboot_nodes(disable_eviction=False, max_parallel=1, pdb_timeout=300):
     """
 
-    Gracefully reboot OpenShift Container Platform nodes
+    Gracefully reboot OpenShift Container Platform nodes. The nodes are
+    rebooted in batches per failure domain, see
+    ocs_ci.ocs.rolling_reboot.RollingRebootOrchestrator
 
     Args:
         disable_eviction (bool): On True will delete pod that is protected by PDB, False by default
+        max_parallel (int): Maximum number of nodes rebooted at the same time,
+            one at a time by default. None for rebooting all the nodes of a
+            failure domain together, which on a stretch cluster means the
+            whole data zone
+        pdb_timeout (int): Time in seconds to wait before each batch for the
+            PodDisruptionBudgets which block disruption
+
+    Returns:
+        dict: Node name to the time in seconds of each of its reboot phases
 
     """
-    from ocs_ci.ocs import platform_nodes
+    from ocs_ci.ocs.rolling_reboot import RollingRebootOrchestrator
 
-    node_objs = get_node_objs()
-    factory = platform_nodes.PlatformNodesFactory()
-    nodes = factory.get_nodes_platform()
-    waiting_time = 30
-    for node in node_objs:
-        node_name = node.name
-        unschedule_nodes([node_name])
-        drain_nodes(node_names=[node_name], disable_eviction=disable_eviction)
-        nodes.restart_nodes([node], wait=False)
-        log.info(f"Waiting for {waiting_time} seconds")
-        time.sleep(waiting_time)
-        schedule_nodes([node_name])
-        wait_for_nodes_status(
-            node_names=[node_name], status=constants.NODE_READY, timeout=1800
-        )
+    return RollingRebootOrchestrator(
+        get_node_objs(),
+        disable_eviction=disable_eviction,
+        max_parallel=max_parallel,
+        pdb_timeout=pdb_timeout,
+    ).run()
 
 
 def get_num_of_racks():
@@ -3713,9 +3956,8 @@ def get_pod_requests_per_node(worker_nodes=None):
     """
     Fetch requested CPU/Memory resources for all running pods, grouped by node.
 
-    This function queries the OpenShift (okd) cluster's API using 'oc' command to retrieve
-    details about all pods in the cluster. It then parses these details and aggregates
-    the requested CPU (in millicores) and Memory (in GB) for each worker node.
+    This function lists all the non-terminated pods in the cluster in one call and
+    aggregates the requested CPU (in cores) and Memory (in GiB) for each worker node.
 
     Args:
         worker_nodes (list, optional): A list of worker node names to filter pods by.
@@ -3723,43 +3965,15 @@ def get_pod_requests_per_node(worker_nodes=None):
 
     Returns:
         dict: A dictionary where keys are worker node names and values are another
-            dictionary containing 'cpu' (float, in millicores) and 'mem' (float, in GB).
+            dictionary containing 'cpu' (float, in cores) and 'mem' (float, in GiB).
     """
-    cmd = ["oc", "get", "pods", "-A", "-o", "yaml"]
-    result = run_cmd(cmd)
-    pods = yaml.safe_load(result)
-
+    requests = aggregate_pod_requests(
+        UtilizationSampler().get_pods(), node_names=worker_nodes
+    )
     usage = defaultdict(lambda: {"cpu": 0, "mem": 0})
-    for pod_data in pods["items"]:
-        node = pod_data.get("spec", {}).get("nodeName")
-        if not node or (worker_nodes and node not in worker_nodes):
-            continue  # skip unscheduled pods and non-worker nodes
-
-        for container in pod_data["spec"].get("containers", []):
-            requests = container.get("resources", {}).get("requests", {})
-            cpu_req = str(requests.get("cpu") or "0")
-            mem_req = str(requests.get("memory") or "0")
-
-            # CPU conversion
-            if cpu_req.endswith("m"):  # e.g. "500m"
-                cpu_val = int(cpu_req[:-1]) / 1000
-            elif cpu_req:
-                cpu_val = int(cpu_req)
-            else:
-                cpu_val = 0
-
-            # Memory conversion
-            if mem_req.endswith("Mi"):
-                mem_val = int(mem_req[:-2]) / 1024
-            elif mem_req.endswith("Gi"):
-                mem_val = int(mem_req[:-2])
-            elif mem_req.endswith("Ki"):
-                mem_val = int(mem_req[:-2]) / (1024**2)
-            else:
-                mem_val = 0
-
-            usage[node]["cpu"] += cpu_val
-            usage[node]["mem"] += mem_val
+    for node, (cpu, memory, _) in requests.items():
+        usage[node]["cpu"] = cpu
+        usage[node]["mem"] = memory / 1024**3
     return usage
 
 
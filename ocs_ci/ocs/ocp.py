@@ -26,6 +26,7 @@ from ocs_ci.utility.retry import retry, catch_exceptions
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility.utils import exec_cmd, run_cmd, update_container_with_mirrored_image
 from ocs_ci.utility.templating import dump_data_to_temp_yaml, load_yaml
+from ocs_ci.utility.tracing import tracer
 from ocs_ci.utility import version
 from ocs_ci.ocs import constants
 from ocs_ci.framework import config
@@ -235,7 +236,12 @@ class OCP(object):
             config.switch_ctx(original_context)
 
         if out_yaml_format:
-            return yaml.load(out, Loader=yaml.CSafeLoader)
+            if not config.RUN.get("trace_oc_calls"):
+                return yaml.load(out, Loader=yaml.CSafeLoader)
+            parse_start = time.perf_counter()
+            result = yaml.load(out, Loader=yaml.CSafeLoader)
+            tracer.record_parse(time.perf_counter() - parse_start, len(out))
+            return result
         return out
 
     @retry(CommandFailed, tries=3, delay=30, backoff=1)
@@ -1,8 +1,9 @@
 import logging
+import queue
 import sys
+import threading
 
-import gevent.pool
-import gevent.queue
+from ocs_ci.utility.executor import get_config_index, run_in_config_context
 
 log = logging.getLogger(__name__)
 
@@ -52,17 +53,20 @@ class parallel(object):
             for result in p:
                 print result
 
+    Every spawned function runs in its own thread, with the config context
+    (cluster) of the thread which spawned it.
+
     If one of the spawned functions throws an exception, it will be thrown
     when iterating over the results, or when the with block ends.
 
     At the end of the with block, the main thread waits until all
-    spawned functions have completed, or, if one exited with an exception,
-    kills the rest and raises the exception.
+    spawned functions have completed, and if one exited with an exception,
+    raises the exception.
     """
 
     def __init__(self):
-        self.group = gevent.pool.Group()
-        self.results = gevent.queue.Queue()
+        self.threads = []
+        self.results = queue.Queue()
         self.count = 0
         self.any_spawned = False
         self.iteration_stopped = False
@@ -70,20 +74,26 @@ class parallel(object):
     def spawn(self, func, *args, **kwargs):
         self.count += 1
         self.any_spawned = True
-        greenlet = self.group.spawn(capture_traceback, func, *args, **kwargs)
-        greenlet.link(self._finish)
+        thread = threading.Thread(
+            target=self._run,
+            args=(get_config_index(), func, args, kwargs),
+            daemon=True,
+        )
+        self.threads.append(thread)
+        thread.start()
 
     def __enter__(self):
         return self
 
     def __exit__(self, type_, value, traceback):
-        self.group.join()
+        for thread in self.threads:
+            thread.join()
 
         if value is not None:
             return False
 
         try:
-            # raises if any greenlets exited with an exception
+            # raises if any of the functions exited with an exception
             for result in self:
                 log.debug("result is %s", repr(result))
                 pass
@@ -97,8 +107,10 @@ class parallel(object):
         return self
 
     def __next__(self):
-        if not self.any_spawned or self.iteration_stopped:
+        if not self.any_spawned or self.iteration_stopped or not self.count:
             raise StopIteration()
+        # Every spawned function puts exactly one result to the queue
+        self.count -= 1
         result = self.results.get()
 
         try:
@@ -109,12 +121,9 @@ class parallel(object):
 
         return result
 
-    def _finish(self, greenlet):
-        if greenlet.successful():
-            self.results.put(greenlet.value)
-        else:
-            self.results.put(greenlet.exception)
-
-        self.count -= 1
-        if self.count <= 0:
-            self.results.put(StopIteration())
+    def _run(self, config_index, func, args, kwargs):
+        self.results.put(
+            run_in_config_context(
+                config_index, capture_traceback, func, *args, **kwargs
+            )
+        )
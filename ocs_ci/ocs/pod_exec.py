@@ -11,17 +11,34 @@ this we might have to dynamically figure out at run time which backend to use.
 This module will have all api client class definitions in this file along with
 dispatcher class Exec.
 
+It also provides streaming of raw (binary) output of a command run in a pod
+into a local file, see stream_from_pod and copy_file_from_pod, and streaming
+of pod logs line by line with search of multiple patterns in one pass, see
+stream_pod_logs and search_pod_logs.
+
 """
 
-from collections import namedtuple
+from collections import deque, namedtuple
+import hashlib
 import logging
+import os
+import re
+import shlex
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import zlib
 
-from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.framework import config as ocsci_config
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutException
+from ocs_ci.utility.tracing import tracer
 
 # Upstream KubernetesClient
 from kubernetes import config
 from kubernetes.client import Configuration
-from kubernetes.client.apis import core_v1_api
+from kubernetes.client.api import core_v1_api
 from kubernetes.client.rest import ApiException
 from kubernetes.stream import stream
 
@@ -32,6 +49,19 @@ logger = logging.getLogger(__name__)
 # Used by factory function to dynamically find the class to be instantiated
 _clsmap = dict()
 
+# Size of the chunks read from the exec stream, bounds the memory used for
+# the transfer
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Shell wrapper compressing the output of the command with gzip, it exits
+# with the exit status of the command, not the one of gzip. The pod's shell
+# doesn't have to support pipefail.
+GZIP_COMMAND_WRAPPER = (
+    "exec 3>&1; "
+    "status=$({{ {{ {command}; echo $? >&4; }} | gzip -c >&3; }} 4>&1); "
+    "exit $status"
+)
+
 # Packing all elements required for execution
 CmdObj = namedtuple(
     "CmdObj",
@@ -162,3 +192,617 @@ class KubClient(object):
             stdout = outbuf
 
         return stdout, stderr, ret
+
+
+def get_oc_exec_cmd(pod_name, namespace, command, container=None, cluster_config=None):
+    """
+    Get oc exec command running the shell command in the pod
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        command (str): Shell command to run in the pod
+        container (str): Name of the container, None for the default one
+        cluster_config (MultiClusterConfig): Config of the cluster, None for
+            the current one
+
+    Returns:
+        list: The oc exec command
+
+    """
+    kubeconfig = (cluster_config or ocsci_config).RUN.get("kubeconfig")
+    cmd = ["oc"]
+    if kubeconfig:
+        cmd += ["--kubeconfig", kubeconfig]
+    cmd += ["-n", namespace, "exec", pod_name]
+    if container:
+        cmd += ["-c", container]
+    return cmd + ["--", "sh", "-c", command]
+
+
+def _kill_process_group(proc):
+    """
+    Kill the process group of the process
+
+    Args:
+        proc (subprocess.Popen): The process
+
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def stream_from_pod(
+    pod_name,
+    namespace,
+    command,
+    output,
+    container=None,
+    compress=False,
+    timeout=3600,
+    chunk_size=STREAM_CHUNK_SIZE,
+    cluster_config=None,
+):
+    """
+    Run the command in the pod and stream its raw standard output into the
+    file object, without keeping the whole output in memory
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        command (str): Shell command to run in the pod, e.g. "cat /path"
+            or "tar cf - /dir"
+        output (file): Binary file object to write the output to
+        container (str): Name of the container, None for the default one
+        compress (bool): True for compressing the output with gzip in the pod
+            and decompressing it locally, the pod has to provide gzip
+        timeout (int): Timeout of the whole transfer in seconds
+        chunk_size (int): Size of the chunks read from the stream in bytes
+        cluster_config (MultiClusterConfig): Config of the cluster, None for
+            the current one
+
+    Returns:
+        dict: Transfer stats - written bytes, transferred bytes, sha256 of the
+            written data and duration in seconds
+
+    Raises:
+        CommandFailed: In case the command failed in the pod
+        TimeoutException: In case the transfer didn't finish in time
+
+    """
+    remote_command = (
+        GZIP_COMMAND_WRAPPER.format(command=command) if compress else command
+    )
+    cmd = get_oc_exec_cmd(
+        pod_name, namespace, remote_command, container, cluster_config
+    )
+    logger.info(f"Streaming output of command: {shlex.join(cmd)}")
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if compress else None
+    checksum = hashlib.sha256()
+    written = 0
+    transferred = 0
+    start_time = time.time()
+    with tempfile.TemporaryFile() as stderr:
+        # New session, so that the whole process group can be killed on
+        # timeout, including children holding the output pipe
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            start_new_session=True,
+        )
+        timer = threading.Timer(timeout, _kill_process_group, args=(proc,))
+        timer.start()
+        try:
+            while True:
+                chunk = proc.stdout.read(chunk_size)
+                if not chunk:
+                    break
+                transferred += len(chunk)
+                if decompressor:
+                    chunk = decompressor.decompress(chunk)
+                output.write(chunk)
+                checksum.update(chunk)
+                written += len(chunk)
+            if decompressor:
+                chunk = decompressor.flush()
+                output.write(chunk)
+                checksum.update(chunk)
+                written += len(chunk)
+            returncode = proc.wait()
+            if decompressor and not returncode and not decompressor.eof:
+                # gzip failed or the stream was cut, the output is incomplete
+                stderr.seek(0)
+                raise CommandFailed(
+                    f"Compressed output of '{command}' from pod {pod_name} is "
+                    f"incomplete: {stderr.read().decode(errors='replace')}"
+                )
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+            proc.stdout.close()
+            if proc.poll() is None:
+                _kill_process_group(proc)
+                proc.wait()
+        if returncode:
+            if timed_out:
+                raise TimeoutException(
+                    f"Streaming output of '{command}' from pod {pod_name} didn't "
+                    f"finish in {timeout} seconds"
+                )
+            stderr.seek(0)
+            raise CommandFailed(
+                f"Streaming output of '{command}' from pod {pod_name} failed "
+                f"with return code {returncode}: "
+                f"{stderr.read().decode(errors='replace')}"
+            )
+    stats = {
+        "bytes": written,
+        "transferred_bytes": transferred,
+        "sha256": checksum.hexdigest(),
+        "duration": time.time() - start_time,
+    }
+    logger.info(f"Streamed output of '{command}' from pod {pod_name}: {stats}")
+    return stats
+
+
+def get_file_checksum_in_pod(
+    pod_name, namespace, src_path, container=None, cluster_config=None
+):
+    """
+    Get sha256 checksum of the file in the pod
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        src_path (str): Path of the file in the pod
+        container (str): Name of the container, None for the default one
+        cluster_config (MultiClusterConfig): Config of the cluster, None for
+            the current one
+
+    Returns:
+        str: The sha256 checksum of the file
+
+    """
+    cmd = get_oc_exec_cmd(
+        pod_name,
+        namespace,
+        f"sha256sum {shlex.quote(src_path)}",
+        container,
+        cluster_config,
+    )
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode:
+        raise CommandFailed(
+            f"Failed to get checksum of {src_path} in pod {pod_name}: "
+            f"{result.stderr.decode(errors='replace')}"
+        )
+    return result.stdout.decode().split()[0]
+
+
+def copy_file_from_pod(
+    pod_name,
+    namespace,
+    src_path,
+    target_path,
+    container=None,
+    compress=False,
+    verify_checksum=True,
+    timeout=3600,
+    cluster_config=None,
+):
+    """
+    Copy a file (text or binary) from the pod to the local path by streaming
+    'cat' output of the file. Doesn't depend on 'tar' utility in the pod as
+    'oc cp' does.
+
+    The file is written to a temporary file next to the target path, which
+    is renamed to the target path only after successful transfer.
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        src_path (str): Path of the file in the pod
+        target_path (str): Local path to copy the file to
+        container (str): Name of the container, None for the default one
+        compress (bool): True for compressing the file in transit with gzip
+        verify_checksum (bool): True for comparing sha256 checksum of the
+            copied file with checksum of the file in the pod
+        timeout (int): Timeout of the transfer in seconds
+        cluster_config (MultiClusterConfig): Config of the cluster, None for
+            the current one
+
+    Returns:
+        dict: Transfer stats, see stream_from_pod
+
+    Raises:
+        CommandFailed: In case the transfer failed or the checksum doesn't match
+
+    """
+    partial_path = f"{target_path}.part"
+    try:
+        with open(partial_path, "wb") as output:
+            stats = stream_from_pod(
+                pod_name,
+                namespace,
+                f"cat {shlex.quote(src_path)}",
+                output,
+                container=container,
+                compress=compress,
+                timeout=timeout,
+                cluster_config=cluster_config,
+            )
+        if verify_checksum:
+            src_checksum = get_file_checksum_in_pod(
+                pod_name, namespace, src_path, container, cluster_config
+            )
+            if src_checksum != stats["sha256"]:
+                raise CommandFailed(
+                    f"Checksum of the copied file {target_path} "
+                    f"({stats['sha256']}) doesn't match checksum of "
+                    f"{pod_name}:{src_path} ({src_checksum})"
+                )
+        os.replace(partial_path, target_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return stats
+
+
+def get_oc_logs_cmd(
+    pod_name,
+    namespace,
+    container=None,
+    previous=False,
+    all_containers=False,
+    since=None,
+    since_time=None,
+    tail=None,
+    limit_bytes=None,
+    follow=False,
+    cluster_config=None,
+):
+    """
+    Get oc logs command of the pod
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        container (str): Name of the container, None for the default one
+        previous (bool): True for the log of the previous container instance
+        all_containers (bool): True for the logs of all the containers
+        since (str): Only logs newer than a relative duration like 5s or 2m
+        since_time (str): Only logs after the date (RFC3339)
+        tail (int): Number of the last lines
+        limit_bytes (int): Maximum number of bytes of the log
+        follow (bool): True to follow the log
+        cluster_config (MultiClusterConfig): Config of the cluster, None for
+            the current one
+
+    Returns:
+        list: The oc logs command
+
+    """
+    kubeconfig = (cluster_config or ocsci_config).RUN.get("kubeconfig")
+    cmd = ["oc"]
+    if kubeconfig:
+        cmd += ["--kubeconfig", kubeconfig]
+    cmd += ["-n", namespace, "logs", pod_name]
+    if container:
+        cmd += ["-c", container]
+    if previous:
+        cmd.append("--previous")
+    if all_containers:
+        cmd.append("--all-containers=true")
+    if since:
+        cmd.append(f"--since={since}")
+    if since_time:
+        cmd.append(f"--since-time={since_time}")
+    if tail:
+        cmd.append(f"--tail={tail}")
+    if limit_bytes:
+        cmd.append(f"--limit-bytes={limit_bytes}")
+    if follow:
+        cmd.append("--follow")
+    return cmd
+
+
+def stream_pod_logs(pod_name, namespace, timeout=None, **log_options):
+    """
+    Stream the log of the pod line by line, without keeping the whole log in
+    memory. When the consumer stops iterating (closes the generator), the oc
+    process is killed, so searching for a line doesn't need to read the rest
+    of the log.
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        timeout (int): Time in seconds after which the oc process is killed,
+            no limit if not specified. Required in follow mode unless the
+            consumer stops iterating by itself.
+        **log_options: Options of the log, see get_oc_logs_cmd
+
+    Yields:
+        str: Lines of the log without the trailing new line
+
+    Raises:
+        CommandFailed: In case oc logs failed
+        TimeoutException: In case the log didn't end in time
+
+    """
+    cmd = get_oc_logs_cmd(pod_name, namespace, **log_options)
+    logger.info(f"Streaming log: {shlex.join(cmd)}")
+    trace_start = time.perf_counter()
+    output_bytes = 0
+    with tempfile.TemporaryFile() as stderr:
+        # New session, so that the whole process group can be killed
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            start_new_session=True,
+        )
+        timer = None
+        if timeout:
+            timer = threading.Timer(timeout, _kill_process_group, args=(proc,))
+            timer.start()
+        try:
+            for line in proc.stdout:
+                output_bytes += len(line)
+                yield line.decode(errors="replace").rstrip("\n")
+            returncode = proc.wait()
+        finally:
+            timed_out = timer is not None and not timer.is_alive()
+            if timer:
+                timer.cancel()
+            proc.stdout.close()
+            if proc.poll() is None:
+                _kill_process_group(proc)
+                proc.wait()
+            # oc is executed directly, not by exec_cmd which traces the calls
+            if ocsci_config.RUN.get("trace_oc_calls"):
+                tracer.record_call(
+                    cmd,
+                    time.perf_counter() - trace_start,
+                    output_bytes,
+                    proc.returncode,
+                )
+        if returncode:
+            if timed_out:
+                raise TimeoutException(
+                    f"Log of pod {pod_name} didn't end in {timeout} seconds"
+                )
+            stderr.seek(0)
+            raise CommandFailed(
+                f"Streaming log of pod {pod_name} failed with return code "
+                f"{returncode}: {stderr.read().decode(errors='replace')}"
+            )
+
+
+def _combine_patterns(patterns, flags):
+    """
+    Args:
+        patterns (dict): Key to the compiled regular expression
+        flags (int): Flags of the regular expressions
+
+    Returns:
+        re.Pattern: All the patterns combined to one regular expression
+
+    """
+    return re.compile(
+        "|".join(f"(?:{compiled.pattern})" for compiled in patterns.values()), flags
+    )
+
+
+def match_lines(lines, patterns, max_matches=None, ignore_case=False):
+    """
+    Search for multiple patterns in the lines in one pass. Every line is
+    first matched against all the patterns combined to one regular
+    expression, only matching lines are checked against the individual
+    patterns. Patterns with max_matches matches are dropped from the
+    combined expression and once every pattern has them, the iteration of
+    the lines stops.
+
+    For many patterns which differ only by a name (e.g. one per PVC), use
+    match_events, which matches every line just once per kind of event.
+
+    Args:
+        lines (iterable): The lines, e.g. from stream_pod_logs
+        patterns (dict): Key to the regular expression
+        max_matches (int): Maximum number of matches per pattern, no limit
+            if not specified
+        ignore_case (bool): True for case insensitive matching
+
+    Yields:
+        tuple: The key of the matching pattern and the line
+
+    """
+    flags = re.IGNORECASE if ignore_case else 0
+    remaining = {key: re.compile(pattern, flags) for key, pattern in patterns.items()}
+    if not remaining:
+        return
+    combined = _combine_patterns(remaining, flags)
+    counts = dict.fromkeys(remaining, 0)
+    for line in lines:
+        if not combined.search(line):
+            continue
+        satisfied = False
+        for key, compiled in list(remaining.items()):
+            if compiled.search(line):
+                yield key, line
+                counts[key] += 1
+                if max_matches and counts[key] >= max_matches:
+                    del remaining[key]
+                    satisfied = True
+        if not remaining:
+            return
+        if satisfied:
+            combined = _combine_patterns(remaining, flags)
+
+
+def match_events(lines, events, keys, ignore_case=False):
+    """
+    Search for the first line of every event of every name in one pass, e.g.
+    for the start and the end of the provisioning of many PVCs. Each event is
+    one regular expression with a "name" group, the matched name is looked up
+    in the keys, so every line is matched once per event regardless of the
+    number of the names. Once all the keys are found, the iteration of the
+    lines stops.
+
+    Args:
+        lines (iterable): The lines, e.g. from stream_pod_logs
+        events (dict): Event to the regular expression with the "name" group
+        keys (iterable): The (name, event) tuples to search for
+        ignore_case (bool): True for case insensitive matching
+
+    Yields:
+        tuple: The (name, event) key and the first line of the event
+
+    """
+    flags = re.IGNORECASE if ignore_case else 0
+    compiled = {event: re.compile(pattern, flags) for event, pattern in events.items()}
+    remaining = set(keys)
+    if not remaining:
+        return
+    for line in lines:
+        for event, regex in compiled.items():
+            match = regex.search(line)
+            if match and (match.group("name"), event) in remaining:
+                remaining.discard((match.group("name"), event))
+                yield (match.group("name"), event), line
+        if not remaining:
+            return
+
+
+def grep_lines(lines, pattern, ignore_case=False, context=0, max_count=None):
+    """
+    Filter the lines like grep, including context lines and the "--"
+    separators of non adjacent groups
+
+    Args:
+        lines (iterable): The lines
+        pattern (str): Regular expression
+        ignore_case (bool): True for case insensitive matching
+        context (int): Number of lines before and after the matching line
+        max_count (int): Stop after this number of matching lines
+
+    Yields:
+        str: The matching lines with their context
+
+    """
+    compiled = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    before = deque(maxlen=context)
+    after = 0
+    matches = 0
+    last_printed = None
+    for index, line in enumerate(lines):
+        if (not max_count or matches < max_count) and compiled.search(line):
+            first = index - len(before)
+            if last_printed is not None and first > last_printed + 1:
+                yield "--"
+            yield from before
+            before.clear()
+            yield line
+            last_printed = index
+            matches += 1
+            after = context
+        elif after:
+            yield line
+            last_printed = index
+            after -= 1
+        elif max_count and matches >= max_count:
+            return
+        elif context:
+            before.append(line)
+
+
+def search_pod_logs(
+    pod_names,
+    namespace,
+    patterns,
+    max_matches=None,
+    ignore_case=False,
+    timeout=None,
+    **log_options,
+):
+    """
+    Search for multiple patterns in the logs of the pods in one pass over the
+    streamed logs. Reading of the logs stops as soon as every pattern has
+    max_matches matches.
+
+    Args:
+        pod_names (list): Names of the pods, searched in the order
+        namespace (str): Namespace of the pods
+        patterns (dict): Key to the regular expression
+        max_matches (int): Maximum number of matches per pattern, no limit
+            if not specified
+        ignore_case (bool): True for case insensitive matching
+        timeout (int): Time in seconds for streaming the log of each pod
+        **log_options: Options of the logs, see get_oc_logs_cmd
+
+    Returns:
+        dict: Key of the pattern to the list of the matching lines
+
+    """
+    matches = {key: [] for key in patterns}
+
+    def get_remaining():
+        return {
+            key: pattern
+            for key, pattern in patterns.items()
+            if not max_matches or len(matches[key]) < max_matches
+        }
+
+    for pod_name in pod_names:
+        remaining = get_remaining()
+        if not remaining:
+            break
+        lines = stream_pod_logs(pod_name, namespace, timeout=timeout, **log_options)
+        try:
+            for key, line in match_lines(
+                lines, remaining, max_matches=max_matches, ignore_case=ignore_case
+            ):
+                if not max_matches or len(matches[key]) < max_matches:
+                    matches[key].append(line)
+        finally:
+            lines.close()
+    return matches
+
+
+def search_pod_log_events(
+    pod_names, namespace, events, names, timeout=None, **log_options
+):
+    """
+    Search for the first line of every event of every name in the logs of
+    the pods in one pass over the streamed logs, see match_events. Reading
+    of the logs stops as soon as all the events are found.
+
+    Args:
+        pod_names (list): Names of the pods, searched in the order
+        namespace (str): Namespace of the pods
+        events (dict): Event to the regular expression with the "name" group
+        names (list): Names to search the events for
+        timeout (int): Time in seconds for streaming the log of each pod
+        **log_options: Options of the logs, see get_oc_logs_cmd
+
+    Returns:
+        dict: The (name, event) key to the first matching line, None if not
+            found
+
+    """
+    matches = {(name, event): None for name in names for event in events}
+    for pod_name in pod_names:
+        remaining = [key for key, line in matches.items() if line is None]
+        if not remaining:
+            break
+        lines = stream_pod_logs(pod_name, namespace, timeout=timeout, **log_options)
+        try:
+            for key, line in match_events(lines, events, remaining):
+                matches[key] = line
+        finally:
+            lines.close()
+    return matches
@@ -19,11 +19,17 @@ Usage:
 import logging
 import os
 import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
 import yaml
 
 from ocs_ci.framework import config
-from ocs_ci.utility.utils import run_cmd
-from ocs_ci.ocs.exceptions import CommandFailed, NotFoundError
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.utils import run_cmd, TimeoutSampler
+from ocs_ci.ocs.exceptions import CommandFailed, NotFoundError, TimeoutExpiredError
 
 
 logger = logging.getLogger(__name__)
@@ -149,6 +155,16 @@ class ObjectConfFile:
         """
         return self._run_command("apply", namespace)
 
+    def get_object_dicts(self):
+        """
+        Get the k8s objects described in this object file, without running
+        any oc command.
+
+        Returns:
+            list: Dictionaries with k8s objects
+        """
+        return [obj for obj in yaml.safe_load_all(self.yaml_file.read_text()) if obj]
+
     def get(self, namespace=None):
         """
         Run ``oc get`` on in this object file.
@@ -213,3 +229,207 @@ class ObjectConfFile:
                 )
                 raise TimeoutError(msg)
             time.sleep(sleep)
+
+
+# Checks whether the object of the kind (lower case) is ready
+KUBE_JOB_READY_CHECKS = {
+    constants.PVC.lower(): lambda obj: obj.get("status", {}).get("phase")
+    == constants.STATUS_BOUND,
+    constants.POD.lower(): lambda obj: obj.get("status", {}).get("phase")
+    == constants.STATUS_RUNNING,
+    constants.DEPLOYMENTCONFIG: lambda obj: bool(
+        obj.get("status", {}).get("availableReplicas")
+    ),
+    constants.OBC.lower(): lambda obj: obj.get("status", {}).get("phase")
+    == constants.STATUS_BOUND,
+}
+
+
+class KubeJobWaiter(object):
+    """
+    Wait for all the objects of several kube jobs (object config files) to
+    become ready - PVCs and OBCs Bound, pods Running, deployment configs
+    available. Every round lists each kind of objects once per namespace,
+    regardless of the number of the objects and kube jobs, and the waiting
+    ends as soon as the last object is ready. Time to ready of every object
+    (from its creation timestamp) is recorded and summarized.
+
+    Example::
+
+        waiter = KubeJobWaiter(timeout=1800)
+        for kube_job in kube_pod_obj_list + kube_pvc_obj_list:
+            waiter.add(kube_job, namespace)
+        waiter.wait()
+        pod_running_list = waiter.get_ready_names(constants.POD)
+
+    """
+
+    def __init__(self, timeout=600, sleep=10, selector=None):
+        """
+        Constructor of KubeJobWaiter
+
+        Args:
+            timeout (int): Time in seconds to wait for all the objects
+            sleep (int): Time in seconds between the rounds
+            selector (str): Label selector of the listed objects, if all the
+                objects of the kube jobs have a common label
+
+        """
+        self.timeout = timeout
+        self.sleep = sleep
+        self.selector = selector
+        # (kind, namespace) to the names of the objects
+        self.objects = OrderedDict()
+        # (kind, namespace, name) to the time to ready in seconds
+        self.time_to_ready = OrderedDict()
+
+    def add(self, kube_job_obj, namespace=None):
+        """
+        Add objects of the kube job to wait for
+
+        Args:
+            kube_job_obj (ObjectConfFile): The kube job
+            namespace (str): Namespace of the objects, if not set in them
+
+        """
+        for obj in kube_job_obj.get_object_dicts():
+            kind = obj["kind"].lower()
+            if kind not in KUBE_JOB_READY_CHECKS:
+                logger.warning(f"Not waiting for {obj['kind']}, unknown ready state")
+                continue
+            obj_namespace = obj["metadata"].get("namespace", namespace)
+            self.objects.setdefault((kind, obj_namespace), []).append(
+                obj["metadata"]["name"]
+            )
+
+    def get_pending(self):
+        """
+        Get the objects which are not ready yet
+
+        Returns:
+            list: Tuples of kind, namespace and name
+
+        """
+        return [
+            (kind, namespace, name)
+            for (kind, namespace), names in self.objects.items()
+            for name in names
+            if (kind, namespace, name) not in self.time_to_ready
+        ]
+
+    def check(self):
+        """
+        List the objects with pending ones, one list per kind and namespace,
+        and record the objects which became ready
+
+        Returns:
+            list: The objects which are still not ready
+
+        """
+        now = datetime.now(timezone.utc)
+        for (kind, namespace), names in self.objects.items():
+            pending = [
+                name
+                for name in names
+                if (kind, namespace, name) not in self.time_to_ready
+            ]
+            if not pending:
+                continue
+            items = (
+                OCP(kind=kind, namespace=namespace).get(selector=self.selector)["items"]
+                or []
+            )
+            listed = {item["metadata"]["name"]: item for item in items}
+            for name in pending:
+                obj = listed.get(name)
+                if obj and KUBE_JOB_READY_CHECKS[kind](obj):
+                    created = datetime.strptime(
+                        obj["metadata"]["creationTimestamp"], "%Y-%m-%dT%H:%M:%SZ"
+                    ).replace(tzinfo=timezone.utc)
+                    self.time_to_ready[(kind, namespace, name)] = max(
+                        (now - created).total_seconds(), 0
+                    )
+        return self.get_pending()
+
+    def wait(self):
+        """
+        Wait until all the objects are ready
+
+        Raises:
+            AssertionError: If not all the objects are ready in time
+
+        """
+        pending = self.get_pending()
+        logger.info(f"Waiting for {len(pending)} kube job objects to be ready")
+        try:
+            for pending in TimeoutSampler(self.timeout, self.sleep, self.check):
+                if not pending:
+                    break
+                logger.info(
+                    f"{len(self.time_to_ready)} kube job objects ready, "
+                    f"{len(pending)} pending"
+                )
+        except TimeoutExpiredError:
+            self.log_summary()
+            raise AssertionError(
+                f"{len(pending)} kube job objects not ready in {self.timeout} "
+                f"secs: {[name for _, _, name in pending][:50]}"
+            )
+        self.log_summary()
+
+    def get_ready_names(self, kind):
+        """
+        Get names of the objects of the kind which are ready
+
+        Args:
+            kind (str): Kind of the objects, e.g. Pod
+
+        Returns:
+            list: Names of the ready objects in the order of the kube jobs
+
+        """
+        kind = kind.lower()
+        return [
+            name
+            for (obj_kind, namespace), names in self.objects.items()
+            if obj_kind == kind
+            for name in names
+            if (obj_kind, namespace, name) in self.time_to_ready
+        ]
+
+    def get_summary(self):
+        """
+        Get distribution of the time to ready per kind
+
+        Returns:
+            dict: Kind to dict with count, min, p50, p90, p99 and max of the
+                time to ready in seconds
+
+        """
+        per_kind = OrderedDict()
+        for (kind, _, _), seconds in self.time_to_ready.items():
+            per_kind.setdefault(kind, []).append(seconds)
+        summary = OrderedDict()
+        for kind, values in per_kind.items():
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            summary[kind] = {
+                "count": len(values),
+                "min": min(values),
+                "p50": p50,
+                "p90": p90,
+                "p99": p99,
+                "max": max(values),
+            }
+        return summary
+
+    def log_summary(self):
+        """
+        Log distribution of the time to ready per kind
+        """
+        for kind, stats in self.get_summary().items():
+            logger.info(
+                f"{kind} time to ready of {stats['count']} objects: "
+                f"min {stats['min']:.0f}s, p50 {stats['p50']:.0f}s, "
+                f"p90 {stats['p90']:.0f}s, p99 {stats['p99']:.0f}s, "
+                f"max {stats['max']:.0f}s"
+            )
@@ -5,10 +5,12 @@ Each pod in the openshift cluster will have a corresponding pod object
 """
 
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
+import json
 import logging
 import os
 import re
+import shlex
+import uuid
 import yaml
 import tempfile
 import time
@@ -31,12 +33,16 @@ from ocs_ci.ocs.exceptions import (
     UnavailableResourceException,
     ResourceNotFoundError,
     NotFoundError,
-    TimeoutException,
     NoRunningCephToolBoxException,
     TolerationNotFoundException,
 )
 
 from ocs_ci.ocs.utils import setup_ceph_toolbox, get_pod_name_by_pattern
+from ocs_ci.ocs.pod_exec import (
+    copy_file_from_pod,
+    grep_lines,
+    stream_pod_logs,
+)
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs.resources.job import get_job_obj, get_jobs_with_prefix
 from ocs_ci.utility import templating
@@ -52,7 +58,10 @@ from ocs_ci.utility.retry import retry
 from ocs_ci.ocs.constants import CSI_RBD_ADDON_NODEPLUGIN_LABEL_420
 
 logger = logging.getLogger(__name__)
+
 FIO_TIMEOUT = 600
+# Maximum number of pods deleted with one oc command
+BULK_DELETE_CHUNK_SIZE = 100
 
 TEXT_CONTENT = (
     "Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
@@ -257,51 +266,26 @@ class Pod(OCS):
         cmd = f"cat {src_path} | oc exec -i {self.name} -n {self.namespace} -- sh -c 'cat > {target_path}'"
         return exec_cmd(cmd, timeout=timeout, shell=True)
 
-    def copy_from_pod_oc_exec(
-        self, target_path, src_path, timeout=60 * 40, chunk_size=2000
-    ):
+    def copy_from_pod_oc_exec(self, target_path, src_path, timeout=60 * 40):
         """
         !!!Important Note!!!
         Due to implemented https://url.corp.redhat.com/RHSTOR-3411 task 'tar', 'yum' utilities were removed from ceph
         pods to trim an image size.
         oc cp command depends on 'tar' utility, see https://linuxhint.com/use-kubectl-cp-command/ and oc cp --help
 
-        This function is a workaround to copy files from the pod to the local path file using standard input stream
-        Copies to local path file from the pod using standard output stream via 'oc exec'. Good for log/json/yaml/text
-        files, not good for large files/binaries with one-line plain string
-        * Hand data from the pod over `oc exec cat`, other standard output ways will fail for the files > 1 Mb
+        This function is a workaround to copy files from the pod to the local path file using standard output stream
+        of 'oc exec cat'. The output is streamed to the local file, so it is good for large and binary files as well.
 
         Args:
             target_path (str): local path
             src_path (str): path within pod what you want to copy
-            timeout (int): total timeout in seconds
-                until size of the local file will not reach the initial file size.
-                2000 lines is a maximum chunk size tested successfully
-            chunk_size (int): file will be copied by chunks, by number of lines
-        """
-        file_size = int(self.exec_cmd_on_pod(f"stat -c %s {src_path}"))
+            timeout (int): total timeout of the copy in seconds
 
-        timestamp_end = datetime.now() + timedelta(seconds=timeout)
+        Returns:
+            dict: Transfer stats, see ocs_ci.ocs.pod_exec.stream_from_pod
 
-        start_line = 1
-        cmd = f"oc exec -i {self.name} -n {self.namespace} -- bash -c "
-        while os.path.exists(target_path) and datetime.now() <= timestamp_end:
-            exec_cmd(
-                cmd
-                + f"\"tail -n '+{start_line}' {src_path}| head -n '{chunk_size}'\" >> {target_path}",
-                timeout=timeout,
-                shell=True,
-            )
-            start_line += chunk_size
-            logger.info(f"size of target file = {os.stat(target_path).st_size}b")
-            if os.stat(target_path).st_size == file_size:
-                logger.info(f"file '{target_path}' copied")
-                break
-        else:
-            raise TimeoutException(
-                f"Failed to copy file from pod {self.name}:{src_path} to local path '{target_path}'\n"
-                f"src file size = {src_path}b, target file size = {os.stat(target_path).st_size}b"
-            )
+        """
+        return self.copy_from_pod_stream(target_path, src_path, timeout=timeout)
 
     def copy_file_with_base64(self, target_path, src_path, container=""):
         """
@@ -310,21 +294,57 @@ class Pod(OCS):
         pods to trim an image size.
         oc cp command depends on 'tar' utility, see https://linuxhint.com/use-kubectl-cp-command/ and oc cp --help
 
-        Function to copy a file to a pod using base64 tool. Example:
-        1) oc exec -n odf-storage rook-ceph-osd-0-68d76f868c-s25sw -c osd -- base64 /var/log/ceph/pg_log_1.30.txt >
-        pg_log_1.30.txt.base64
-        2) cat pg_log_1.30.txt.base64 | base64 -d > pg_log_1.30.txt
+        Function to copy a file from a pod. The raw output of 'cat' is streamed to the target file, base64 encoding
+        is not needed as the stream is binary safe.
 
         Args:
             src_path (str): The source file to copy
             target_path (str): The target file to copy to
-            container (str): The container to copy to
+            container (str): The container to copy from
+
+        Returns:
+            dict: Transfer stats, see ocs_ci.ocs.pod_exec.stream_from_pod
+
         """
-        with tempfile.NamedTemporaryFile(delete=True, suffix=".base64") as temp_file:
-            base64_file = temp_file.name
-            cmd = f"oc -n {self.namespace} exec {self.name} -c {container} -- base64 {src_path} > {base64_file}"
-            exec_cmd(cmd, shell=True)
-            exec_cmd(f"cat {base64_file} | base64 -d > {target_path}", shell=True)
+        return self.copy_from_pod_stream(target_path, src_path, container=container)
+
+    def copy_from_pod_stream(
+        self,
+        target_path,
+        src_path,
+        container=None,
+        compress=False,
+        verify_checksum=True,
+        timeout=3600,
+    ):
+        """
+        Copy a file from the pod to the local path by streaming its content
+        over 'oc exec', with bounded memory usage
+
+        Args:
+            target_path (str): Local path to copy the file to
+            src_path (str): Path of the file in the pod
+            container (str): Name of the container, None for the default one
+            compress (bool): True for compressing the file in transit with
+                gzip, the pod has to provide gzip
+            verify_checksum (bool): True for verifying sha256 checksum of the
+                copied file, the pod has to provide sha256sum
+            timeout (int): Timeout of the copy in seconds
+
+        Returns:
+            dict: Transfer stats, see ocs_ci.ocs.pod_exec.stream_from_pod
+
+        """
+        return copy_file_from_pod(
+            self.name,
+            self.namespace,
+            src_path,
+            target_path,
+            container=container or None,
+            compress=compress,
+            verify_checksum=verify_checksum,
+            timeout=timeout,
+        )
 
     def exec_sh_cmd_on_pod(self, command, sh="bash", timeout=600, **kwargs):
         """
@@ -388,6 +408,62 @@ class Pod(OCS):
             return [item for item in out if item]
         return out
 
+    def exec_ceph_cmds(
+        self, ceph_cmds, format="json", timeout=600, raise_on_failure=True
+    ):
+        """
+        Execute multiple Ceph commands on the Ceph tools pod in one exec
+
+        The output of every command is framed by unique markers, so the
+        results can be parsed per command.
+
+        Args:
+            ceph_cmds (list): The Ceph commands to execute
+            format (str): The output format of the Ceph commands, the output
+                is parsed as JSON if the format is json or json-pretty
+            timeout (int): timeout of the whole batch in seconds
+            raise_on_failure (bool): True for raising CommandFailed if any of
+                the commands failed
+
+        Returns:
+            dict: Result of every command, keyed by the command, see
+                parse_ceph_batch_output
+
+        Raises:
+            CommandFailed: In case the pod is not a toolbox pod, or any of the
+                commands failed and raise_on_failure is True
+
+        """
+        if "rook-ceph-tools" not in self.labels.values():
+            raise CommandFailed("Ceph commands can be executed only on toolbox pod")
+        marker = f"OCSCI-{uuid.uuid4().hex}"
+        err_file = f"/tmp/{marker}.err"
+        script = []
+        for index, ceph_cmd in enumerate(ceph_cmds):
+            if format:
+                ceph_cmd += f" --format {format}"
+            script.append(
+                f"echo '{marker} BEGIN {index}'; {ceph_cmd} 2>{err_file}; "
+                f"rc=$?; echo '{marker} STDERR {index}'; cat {err_file}; "
+                f'echo "{marker} END {index} $rc"'
+            )
+        script.append(f"rm -f {err_file}")
+        out = self.exec_cmd_on_pod(
+            f"sh -c {shlex.quote('; '.join(script))}",
+            out_yaml_format=False,
+            timeout=timeout,
+        )
+        results = parse_ceph_batch_output(
+            out, ceph_cmds, marker, parse_json=format in ("json", "json-pretty")
+        )
+        failed = {cmd: res for cmd, res in results.items() if res["returncode"] != 0}
+        if failed and raise_on_failure:
+            raise CommandFailed(
+                "Ceph commands failed: "
+                + "; ".join(f"{cmd}: {res['error']}" for cmd, res in failed.items())
+            )
+        return results
+
     def get_storage_path(self, storage_type="fs"):
         """
         Get the pod volume mount path or device path
@@ -775,6 +851,72 @@ class Pod(OCS):
 # Helper functions for Pods
 
 
+def parse_ceph_batch_output(output, ceph_cmds, marker, parse_json=True):
+    """
+    Parse output of the Ceph commands executed by Pod.exec_ceph_cmds
+
+    Args:
+        output (str): Output of the batch
+        ceph_cmds (list): The executed Ceph commands
+        marker (str): The marker framing the output of the commands
+        parse_json (bool): True for parsing the output of the commands as JSON
+
+    Returns:
+        dict: Result of every command, keyed by the command - dict with
+            "output" (parsed JSON or raw output, None if the command failed),
+            "returncode" (None if the command didn't finish) and "error"
+            (stderr of the command or the parsing error, None if succeeded)
+
+    """
+    stdout = {index: [] for index in range(len(ceph_cmds))}
+    stderr = {index: [] for index in range(len(ceph_cmds))}
+    returncodes = {}
+    current = None
+    for line in output.splitlines():
+        if marker in line:
+            # Output which doesn't end with a newline is followed by the
+            # marker on the same line
+            line, marker_line = line.split(marker, 1)
+            if line and current is not None:
+                current.append(line)
+            frame, index, *returncode = marker_line.split()
+            index = int(index)
+            if frame == "BEGIN":
+                current = stdout[index]
+            elif frame == "STDERR":
+                current = stderr[index]
+            else:
+                returncodes[index] = int(returncode[0])
+                current = None
+        elif current is not None:
+            current.append(line)
+
+    results = {}
+    for index, ceph_cmd in enumerate(ceph_cmds):
+        returncode = returncodes.get(index)
+        error = "\n".join(stderr[index]).strip() or None
+        result_output = "\n".join(stdout[index])
+        if returncode is None:
+            error = error or "Command didn't finish"
+            result_output = None
+        elif returncode:
+            error = error or result_output
+            result_output = None
+        elif parse_json:
+            try:
+                result_output = json.loads(result_output) if result_output else None
+            except ValueError as ex:
+                error = f"Failed to parse JSON output: {ex}"
+                result_output = None
+                returncode = -1
+        results[ceph_cmd] = {
+            "output": result_output,
+            "returncode": returncode,
+            "error": error if returncode != 0 else None,
+        }
+    return results
+
+
 def get_all_pods(
     namespace=None,
     selector=None,
@@ -1989,6 +2131,8 @@ def get_pod_logs(
     context=0,
     return_empty_string=True,
     first_match_only=True,
+    since_time=None,
+    limit_bytes=None,
 ):
     """
     Get logs from a given pod
@@ -2001,7 +2145,8 @@ def get_pod_logs(
         all_containers (bool): fetch logs from all containers of the resource
         since (str): only return logs newer than a relative duration like 5s, 2m, or 3h.
         tail (str): number of lines to tail
-        grep (str): filter the logs by the given string
+        grep (str): filter the logs by the given string. The log is streamed
+            and filtered line by line, see ocs_ci.ocs.pod_exec.grep_lines
         regex (bool): True, if the grep is a regex. False otherwise.
             Applicable only if grep is provided.
         case_senitive (bool): True, if the grep is case sensitive. False otherwise.
@@ -2012,12 +2157,36 @@ def get_pod_logs(
             Applicable only if grep is provided. Default value is True.
         first_match_only (bool): True, if the function should return the first match only. False otherwise.
             Applicable only if grep is provided. Default value is True.
+        since_time (str): only return logs after a specific date (RFC3339), e.g. 2024-01-20T10:00:00Z
+        limit_bytes (int): maximum number of bytes of the log to return
 
     Returns:
         str: Output from 'oc get logs <pod_name> command
 
+    Raises:
+        CommandFailed: If grep is provided, nothing matched and
+            return_empty_string is False
+
     """
     namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    if grep:
+        return _grep_pod_logs(
+            pod_name,
+            namespace,
+            grep,
+            regex=regex,
+            ignore_case=not case_senitive,
+            context=context,
+            max_count=1 if first_match_only else None,
+            return_empty_string=return_empty_string,
+            container=container,
+            previous=previous,
+            all_containers=all_containers,
+            since=since,
+            since_time=since_time,
+            tail=tail,
+            limit_bytes=limit_bytes,
+        )
     pod = OCP(kind=constants.POD, namespace=namespace)
     cmd = f"logs {pod_name}"
     if container:
@@ -2028,20 +2197,63 @@ def get_pod_logs(
         cmd += " --all-containers=true"
     if since:
         cmd += f" --since={since}"
+    if since_time:
+        cmd += f" --since-time={since_time}"
     if tail:
         cmd += f" --tail={tail}"
-    if grep:
-        regex_flag = "-E" if regex else ""
-        cmd += f" | grep {regex_flag} '{grep}'"
-        if not case_senitive:
-            cmd += " -i"
-        if context:
-            cmd += f" -C {context}"
-        if first_match_only:
-            cmd += " -m 1"
-        if return_empty_string:
-            cmd += " || echo ''"
-    return pod.exec_oc_cmd(cmd, out_yaml_format=False, shell=bool(grep))
+    if limit_bytes:
+        cmd += f" --limit-bytes={limit_bytes}"
+    return pod.exec_oc_cmd(cmd, out_yaml_format=False)
+
+
+def _grep_pod_logs(
+    pod_name,
+    namespace,
+    grep,
+    regex,
+    ignore_case,
+    context,
+    max_count,
+    return_empty_string,
+    timeout=600,
+    **log_options,
+):
+    """
+    Filter the streamed pod log like grep, see get_pod_logs. The log is
+    streamed for at most timeout seconds, the same as oc logs executed by
+    exec_oc_cmd.
+
+    Returns:
+        str: The matching lines with their context
+
+    Raises:
+        CommandFailed: If nothing matched and return_empty_string is False
+
+    """
+    # Without -E grep uses basic regular expressions, where these characters
+    # have no special meaning
+    pattern = grep if regex else re.sub(r"([+?(){}|])", r"\\\1", grep)
+    lines = stream_pod_logs(pod_name, namespace, timeout=timeout, **log_options)
+    try:
+        output = list(
+            grep_lines(
+                lines,
+                pattern,
+                ignore_case=ignore_case,
+                context=context,
+                max_count=max_count,
+            )
+        )
+    except CommandFailed as e:
+        if not return_empty_string:
+            raise
+        logger.warning(f"Failed to get log of pod {pod_name}: {e}")
+        return ""
+    finally:
+        lines.close()
+    if not output and not return_empty_string:
+        raise CommandFailed(f"No line matching '{grep}' in log of pod {pod_name}")
+    return "".join(f"{line}\n" for line in output)
 
 
 def get_pod_node(pod_obj):
@@ -2064,18 +2276,160 @@ def get_pod_node(pod_obj):
     return node.get_node_objs(node_names=node_name)[0]
 
 
-def delete_pods(pod_objs, wait=True):
+def delete_pods(pod_objs, wait=True, grace_period=None, timeout=600):
     """
-    Deletes list of the pod objects
+    Deletes list of the pod objects. Deletion of all the pods is issued at
+    once and then all of them are waited for together, see bulk_delete_pods.
 
     Args:
         pod_objs (list): List of the pod objects to be deleted
         wait (bool): Determines if the delete command should wait for
             completion
+        grace_period (int): Override of the termination grace period of the
+            pods in seconds
+        timeout (int): Time in seconds to wait for the pods to be deleted
+
+    Raises:
+        CommandFailed: If some of the pods does not exist
+        TimeoutExpiredError: If not all the pods are deleted in time
 
     """
-    for pod in pod_objs:
-        pod.delete(wait=wait)
+    pod_objs = [pod_obj for pod_obj in pod_objs if not pod_obj._is_deleted]
+    if pod_objs:
+        bulk_delete_pods(
+            pod_objs=pod_objs, wait=wait, grace_period=grace_period, timeout=timeout
+        )
+
+
+def bulk_delete_pods(
+    pod_objs=None,
+    namespace=None,
+    selector=None,
+    grace_period=None,
+    wait=True,
+    timeout=600,
+    sleep=3,
+):
+    """
+    Delete many pods at once - one 'oc delete' per namespace with the names
+    of the pods (in chunks of BULK_DELETE_CHUNK_SIZE) or with a label selector
+    - and wait for all of them to disappear together, instead of waiting for
+    termination of each pod before deleting the next one. A pod is considered
+    deleted when it is not listed anymore or is listed with another UID, i.e.
+    it was recreated with the same name (e.g. by a StatefulSet).
+
+    Like OCS.delete, the oc calls take the threading lock of the pods and
+    deletion of a pod which does not exist fails with CommandFailed (the
+    other pods of the same chunk are still deleted).
+
+    Args:
+        pod_objs (list): Pod objects to delete
+        namespace (str): Namespace of the pods matching the selector
+        selector (str): Label selector of the pods to delete, instead of
+            pod_objs
+        grace_period (int): Override of the termination grace period of the
+            pods in seconds
+        wait (bool): True to wait for the pods to be deleted
+        timeout (int): Time in seconds to wait for the pods to be deleted
+        sleep (int): Time in seconds between the checks of the pods
+
+    Returns:
+        dict: Namespace/name of the pod to the time in seconds from issuing
+            the deletion until the pod disappeared, empty if not waiting
+
+    Raises:
+        ValueError: If neither pod_objs nor selector is specified
+        CommandFailed: If some of pod_objs does not exist
+        TimeoutExpiredError: If not all the pods are deleted in time
+
+    """
+    if not pod_objs and not selector:
+        raise ValueError("Either pod_objs or selector has to be specified")
+    namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    options = " --wait=false"
+    if grace_period is not None:
+        options += f" --grace-period={grace_period}"
+
+    # (namespace, name) to UID of the deleted pods
+    deleted = {}
+    start = time.time()
+    if pod_objs:
+        # Pods are grouped by their threading lock as well, so the oc calls
+        # are serialized the same way as with OCS.delete of every pod
+        per_namespace = {}
+        for pod_obj in pod_objs:
+            lock = getattr(pod_obj, "threading_lock", None)
+            per_namespace.setdefault((pod_obj.namespace, lock), []).append(pod_obj)
+        for (pod_namespace, lock), namespace_pods in per_namespace.items():
+            ocp_obj = OCP(
+                kind=constants.POD, namespace=pod_namespace, threading_lock=lock
+            )
+            for i in range(0, len(namespace_pods), BULK_DELETE_CHUNK_SIZE):
+                chunk = namespace_pods[i : i + BULK_DELETE_CHUNK_SIZE]
+                names = " ".join(pod_obj.name for pod_obj in chunk)
+                logger.info(f"Deleting {len(chunk)} pods in {pod_namespace}")
+                ocp_obj.exec_oc_cmd(f"delete {constants.POD} {names}{options}")
+            for pod_obj in namespace_pods:
+                pod_obj._is_deleted = True
+                deleted[(pod_namespace, pod_obj.name)] = pod_obj.data.get(
+                    "metadata", {}
+                ).get("uid")
+    else:
+        ocp_obj = OCP(kind=constants.POD, namespace=namespace)
+        for pod_data in ocp_obj.get(selector=selector)["items"]:
+            deleted[(namespace, pod_data["metadata"]["name"])] = pod_data[
+                "metadata"
+            ].get("uid")
+        logger.info(f"Deleting {len(deleted)} pods with selector {selector}")
+        start = time.time()
+        ocp_obj.exec_oc_cmd(f"delete {constants.POD} -l {selector}{options}")
+    if not wait:
+        return {}
+
+    deletion_times = {}
+
+    def get_remaining_pods():
+        for pod_namespace in {pod_namespace for pod_namespace, _ in deleted}:
+            pods = OCP(kind=constants.POD, namespace=pod_namespace).get(
+                selector=selector
+            )["items"]
+            listed = {
+                pod_data["metadata"]["name"]: pod_data["metadata"].get("uid")
+                for pod_data in pods
+            }
+            now = time.time()
+            for (deleted_namespace, name), uid in deleted.items():
+                key = f"{deleted_namespace}/{name}"
+                if deleted_namespace != pod_namespace or key in deletion_times:
+                    continue
+                if name not in listed or (uid and listed[name] != uid):
+                    deletion_times[key] = now - start
+        return [
+            f"{pod_namespace}/{name}"
+            for pod_namespace, name in deleted
+            if f"{pod_namespace}/{name}" not in deletion_times
+        ]
+
+    remaining = [f"{pod_namespace}/{name}" for pod_namespace, name in deleted]
+    sampler = TimeoutSampler(timeout, sleep, get_remaining_pods)
+    try:
+        for remaining in sampler:
+            if not remaining:
+                break
+            logger.info(f"Waiting for deletion of {len(remaining)} pods")
+    except TimeoutExpiredError as ex:
+        raise TimeoutExpiredError(
+            remaining,
+            f"{len(remaining)} pods not deleted in {timeout} secs: {remaining[:50]}",
+        ) from (sampler.last_exception or ex)
+    if deletion_times:
+        times = sorted(deletion_times.values())
+        logger.info(
+            f"{len(times)} pods deleted in {time.time() - start:.0f}s, "
+            f"per pod: min {times[0]:.0f}s, median {times[len(times) // 2]:.0f}s, "
+            f"max {times[-1]:.0f}s"
+        )
+    return deletion_times
 
 
 def validate_pods_are_respinned_and_running_state(pod_objs_list):
@@ -0,0 +1,344 @@
+# -*- coding: utf8 -*-
+"""
+Rolling reboot of the cluster nodes in concurrent batches.
+
+Nodes of one failure domain (rack or zone of the storage cluster) are
+rebooted together, while the other failure domains keep serving. Master
+nodes are rebooted one at a time to keep the etcd quorum. Before each batch
+the orchestrator waits until the PodDisruptionBudgets in the cluster
+namespace allow disruption again, i.e. until Ceph recovered from the previous
+batch. Reboot of the nodes is detected from the change of their boot ID and
+their NotReady -> Ready transitions reported by a node watch, instead of
+fixed sleeps.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from prettytable import PrettyTable
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants, exceptions
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.node import (
+    NodeStatusWatch,
+    drain_nodes,
+    get_node_rack_or_zone_dict,
+    get_node_roles,
+    get_node_states,
+    schedule_nodes,
+    unschedule_nodes,
+)
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.executor import get_executor
+from ocs_ci.utility.utils import TimeoutSampler
+
+log = logging.getLogger(__name__)
+
+REBOOT_PHASES = [
+    "pdb_wait",
+    "cordon",
+    "drain",
+    "restart",
+    "shutdown",
+    "boot",
+    "uncordon",
+    "total",
+]
+
+
+def get_blocking_pdbs(namespace):
+    """
+    Get PodDisruptionBudgets which currently don't allow any disruption
+
+    Args:
+        namespace (str): Namespace of the PodDisruptionBudgets
+
+    Returns:
+        list: Names of the blocking PodDisruptionBudgets
+
+    """
+    pdbs = OCP(kind=constants.POD_DISRUPTION_BUDGET, namespace=namespace).get()
+    return [
+        pdb["metadata"]["name"]
+        for pdb in pdbs["items"]
+        if pdb.get("status", {}).get("expectedPods", 0) > 0
+        and pdb.get("status", {}).get("disruptionsAllowed", 0) == 0
+    ]
+
+
+def get_reboot_batches(node_dicts, failure_domains=None, max_parallel=None):
+    """
+    Split the nodes to batches which can be rebooted at the same time. Master
+    nodes and nodes without known failure domain are in batches of their
+    own, the other nodes are batched per failure domain.
+
+    Args:
+        node_dicts (list): Node resources
+        failure_domains (dict): Node name to its failure domain (rack/zone)
+        max_parallel (int): Maximum number of nodes in a batch, no limit if
+            not specified
+
+    Returns:
+        list: Batches, each a list of node names
+
+    """
+    failure_domains = failure_domains or {}
+    batches = []
+    domain_batches = OrderedDict()
+    for node_dict in node_dicts:
+        name = node_dict["metadata"]["name"]
+        roles = get_node_roles(node_dict)
+        domain = failure_domains.get(name)
+        if constants.MASTER_MACHINE in roles or not domain:
+            batches.append([name])
+        else:
+            domain_batches.setdefault(domain, []).append(name)
+    for names in domain_batches.values():
+        step = max_parallel or len(names)
+        batches += [names[i : i + step] for i in range(0, len(names), step)]
+    return batches
+
+
+class RollingRebootOrchestrator(object):
+    """
+    Reboot the nodes in batches and record the time of each phase per node
+    """
+
+    def __init__(
+        self,
+        node_objs,
+        disable_eviction=False,
+        max_parallel=None,
+        timeout=1800,
+        pdb_timeout=300,
+        sleep=10,
+    ):
+        """
+        Constructor of RollingRebootOrchestrator
+
+        Args:
+            node_objs (list): OCS objects of the nodes to reboot
+            disable_eviction (bool): On True will delete pods protected by PDB
+            max_parallel (int): Maximum number of nodes rebooted at the same
+                time, not limited if not specified
+            timeout (int): Time in seconds to wait for the nodes of a batch
+                to reboot and become Ready
+            pdb_timeout (int): Time in seconds to wait for the blocking
+                PodDisruptionBudgets before a batch
+            sleep (int): Time in seconds between checks of the nodes when the
+                node watch is not available
+
+        """
+        from ocs_ci.ocs import platform_nodes
+
+        self.node_objs = {node_obj.name: node_obj for node_obj in node_objs}
+        self.disable_eviction = disable_eviction
+        self.max_parallel = max_parallel
+        self.timeout = timeout
+        self.pdb_timeout = pdb_timeout
+        self.sleep = sleep
+        self.namespace = config.ENV_DATA["cluster_namespace"]
+        self.platform_nodes = platform_nodes.PlatformNodesFactory().get_nodes_platform()
+        self.timings = OrderedDict((name, OrderedDict()) for name in self.node_objs)
+        self._watch = None
+        self._wake_up = threading.Event()
+
+    def get_failure_domains(self):
+        """
+        Get failure domains (racks or zones) of the worker nodes
+
+        Returns:
+            dict: Node name to its rack or zone, empty if the failure domain
+                of the storage cluster can't be determined
+
+        """
+        from ocs_ci.helpers.helpers import get_failure_domain
+
+        try:
+            failure_domain = get_failure_domain()
+        except (CommandFailed, IndexError, KeyError) as e:
+            log.warning(f"Failed to get the failure domain: {e}")
+            return {}
+        if failure_domain not in ("rack", "zone"):
+            # With host failure domain every node is a failure domain
+            return {}
+        return get_node_rack_or_zone_dict(failure_domain)
+
+    def get_node_states(self):
+        """
+        Get statuses and boot IDs of the nodes, from the node watch if it is
+        running, otherwise from a node list. The node watch is restarted if
+        it ended.
+
+        Returns:
+            tuple: Dicts of node name to its status and to its boot ID
+
+        Raises:
+            CommandFailed: If the nodes can't be listed
+
+        """
+        if self._watch and not self._watch.is_alive():
+            # The API server closes the watch after a while, start a new one
+            # so that the rest of the reboot doesn't poll the node list
+            log.info(f"Node watch ended ({self._watch.error}), restarting it")
+            self._watch = NodeStatusWatch(on_change=self._wake_up.set)
+            self._watch.start()
+        if self._watch and self._watch.watching:
+            return self._watch.statuses, self._watch.boot_ids
+        return get_node_states(OCP(kind="node").get()["items"])
+
+    def wait_for_pdbs(self):
+        """
+        Wait until no PodDisruptionBudget in the cluster namespace blocks
+        disruption, e.g. because Ceph didn't recover from the previous batch
+        yet. On timeout only a warning is logged, the drain respects the
+        PodDisruptionBudgets anyway.
+        """
+        try:
+            for blocking_pdbs in TimeoutSampler(
+                self.pdb_timeout, self.sleep, get_blocking_pdbs, self.namespace
+            ):
+                if not blocking_pdbs:
+                    return
+                log.info(f"Waiting for blocking PodDisruptionBudgets {blocking_pdbs}")
+        except TimeoutExpiredError:
+            log.warning(
+                f"PodDisruptionBudgets still block disruption after "
+                f"{self.pdb_timeout}s, continuing"
+            )
+
+    def wait_for_reboot(self, node_names, boot_ids, start):
+        """
+        Wait until the nodes reboot and become Ready. A node is considered
+        rebooted when its boot ID changed or it was seen NotReady. The
+        shutdown phase is recorded only if the node was seen NotReady.
+
+        Args:
+            node_names (list): Names of the rebooted nodes
+            boot_ids (dict): Node name to its boot ID before the restart
+            start (float): Time of the restart
+
+        Raises:
+            ResourceWrongStatusException: If the nodes don't reboot in time
+
+        """
+        pending = set(node_names)
+        statuses = {}
+        while pending:
+            try:
+                statuses, current_boot_ids = self.get_node_states()
+            except CommandFailed as e:
+                # The API server may be unavailable for a while, e.g. when a
+                # master node reboots
+                log.warning(f"Failed to get node states: {e}")
+            else:
+                now = time.time()
+                for name in sorted(pending):
+                    status = statuses.get(name, "")
+                    timing = self.timings[name]
+                    if status.startswith(constants.NODE_NOT_READY):
+                        timing.setdefault("shutdown", now - start)
+                    rebooted = "shutdown" in timing or (
+                        current_boot_ids.get(name) != boot_ids.get(name)
+                    )
+                    if rebooted and status.startswith(constants.NODE_READY):
+                        timing["boot"] = now - start
+                        log.info(f"Node {name} rebooted in {timing['boot']:.0f}s")
+                        pending.discard(name)
+            if not pending:
+                break
+            if time.time() - start > self.timeout:
+                pending_statuses = {name: statuses.get(name) for name in pending}
+                raise exceptions.ResourceWrongStatusException(
+                    f"Nodes didn't reboot and become Ready in {self.timeout}s, "
+                    f"statuses: {pending_statuses}"
+                )
+            self._wake_up.wait(self.sleep)
+            self._wake_up.clear()
+
+    def reboot_batch(self, node_names):
+        """
+        Reboot the nodes of one batch
+
+        Args:
+            node_names (list): Names of the nodes
+
+        """
+        log.info(f"Rebooting nodes {node_names}")
+        batch_start = time.time()
+
+        def run_phase(phase, func, *args, **kwargs):
+            phase_start = time.time()
+            func(*args, **kwargs)
+            for name in node_names:
+                self.timings[name][phase] = time.time() - phase_start
+
+        run_phase("pdb_wait", self.wait_for_pdbs)
+        run_phase("cordon", unschedule_nodes, node_names)
+        try:
+            run_phase(
+                "drain",
+                get_executor().map,
+                lambda name: drain_nodes(
+                    node_names=[name], disable_eviction=self.disable_eviction
+                ),
+                node_names,
+                verb="drain",
+            )
+            _, boot_ids = self.get_node_states()
+            boot_ids = dict(boot_ids)
+            restart_start = time.time()
+            run_phase(
+                "restart",
+                self.platform_nodes.restart_nodes,
+                [self.node_objs[name] for name in node_names],
+                wait=False,
+            )
+            self.wait_for_reboot(node_names, boot_ids, restart_start)
+        finally:
+            # Don't leave the nodes cordoned if the reboot failed
+            run_phase("uncordon", schedule_nodes, node_names)
+        for name in node_names:
+            self.timings[name]["total"] = time.time() - batch_start
+
+    def log_timings(self):
+        """
+        Log table of the time of each phase per node
+        """
+        table = PrettyTable()
+        table.field_names = ["Node"] + [f"{phase} [s]" for phase in REBOOT_PHASES]
+        for name, timing in self.timings.items():
+            table.add_row(
+                [name]
+                + [
+                    f"{timing[phase]:.0f}" if phase in timing else "-"
+                    for phase in REBOOT_PHASES
+                ]
+            )
+        log.info(f"Node reboot phases:\n{table}")
+
+    def run(self):
+        """
+        Reboot all the nodes in batches
+
+        Returns:
+            dict: Node name to the time in seconds of each of its phases
+
+        """
+        node_dicts = [node_obj.data for node_obj in self.node_objs.values()]
+        batches = get_reboot_batches(
+            node_dicts, self.get_failure_domains(), self.max_parallel
+        )
+        log.info(f"Rebooting nodes in batches: {batches}")
+        self._watch = NodeStatusWatch(on_change=self._wake_up.set)
+        self._watch.start()
+        try:
+            for batch in batches:
+                self.reboot_batch(batch)
+        finally:
+            self._watch.stop()
+            self.log_timings()
+        return self.timings
@@ -19,7 +19,7 @@ from ocs_ci.ocs.resources.pvc import get_all_pvcs
 from ocs_ci.ocs.ocp import wait_for_cluster_connectivity
 from ocs_ci.utility.utils import ocsci_log_path, ceph_health_check
 from ocs_ci.ocs import constants, cluster, machine, node
-from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
+from ocs_ci.ocs.resources.objectconfigfile import KubeJobWaiter, ObjectConfFile
 from ocs_ci.ocs.exceptions import CommandFailed, ResourceWrongStatusException
 from ocs_ci.ocs.node import get_nodes, get_worker_nodes, wait_for_nodes_status
 from ocs_ci.ocs.exceptions import (
@@ -1278,43 +1278,17 @@ def check_all_pvc_reached_bound_state_in_kube_job(
         If not all PVC reached to Bound state.
 
     """
-    # Check all the PVC reached Bound state
-    pvc_bound_list, pvc_not_bound_list = ([], [])
-    while_iteration_count = 0
-    while True:
-        # Get kube_job obj and fetch either all PVC's are in Bound state
-        # If not bound adding those PVCs to pvc_not_bound_list
-        job_get_output = kube_job_obj.get(namespace=namespace)
-        for i in range(no_of_pvc):
-            status = job_get_output["items"][i]["status"]["phase"]
-            logger.info(
-                f"pvc {job_get_output['items'][i]['metadata']['name']} status {status}"
-            )
-            if status != "Bound":
-                pvc_not_bound_list.append(
-                    job_get_output["items"][i]["metadata"]["name"]
-                )
-
-        # Check the length of pvc_not_bound_list to decide either all PVCs reached Bound state
-        # If not then wait for timeout secs and re-iterate while loop
-        if len(pvc_not_bound_list):
-            time.sleep(timeout)
-            while_iteration_count += 1
-            # Breaking while loop after 10 Iteration i.e. after timeout*10 secs of wait_time
-            # And if PVCs still not in bound state then there will be assert.
-            if while_iteration_count >= 10:
-                assert logger.error(
-                    f" Listed PVCs took more than {timeout * 10} secs to bound {pvc_not_bound_list}"
-                )
-                break
-            pvc_not_bound_list.clear()
-            continue
-        elif not len(pvc_not_bound_list):
-            for i in range(no_of_pvc):
-                pvc_bound_list.append(job_get_output["items"][i]["metadata"]["name"])
-            logger.info("All PVCs in Bound state")
-            break
-    return pvc_bound_list
+    # Whole wait stays timeout * 10 secs as before, but the PVCs are checked
+    # more often and the wait ends as soon as all of them are Bound
+    waiter = KubeJobWaiter(timeout=timeout * 10, sleep=min(timeout, 10))
+    waiter.add(kube_job_obj, namespace)
+    if len(waiter.get_pending()) != no_of_pvc:
+        logger.warning(
+            f"Kube job has {len(waiter.get_pending())} PVCs, expected {no_of_pvc}"
+        )
+    waiter.wait()
+    logger.info("All PVCs in Bound state")
+    return waiter.get_ready_names(constants.PVC)
 
 
 def get_max_pvc_count():
@@ -1355,79 +1329,19 @@ def check_all_pod_reached_running_state_in_kube_job(
         If not all POD reached Running state.
 
     """
-
-    # Check all the POD reached Running state
-    pod_running_list, pod_not_running_list = ([], [])
-    while_iteration_count = 0
-    dc_pod = 0
-    while True:
-        # Get kube_job obj and fetch either all PODs are in Running state
-        # If not Running, adding those PODs to pod_not_running_list
-        job_get_output = kube_job_obj.get(namespace=namespace)
-        for i in range(no_of_pod):
-            if job_get_output["items"][0]["kind"] == constants.POD:
-                pod_type = constants.POD
-            else:
-                pod_type = None
-                dc_pod = 1
-            if pod_type:
-                status = job_get_output["items"][i]["status"]["phase"]
-                logger.info(
-                    f"POD {job_get_output['items'][i]['metadata']['name']} status {status}"
-                )
-                if status != "Running":
-                    pod_not_running_list.append(
-                        job_get_output["items"][i]["metadata"]["name"]
-                    )
-            else:
-                # For DC config there is no Running status so checking it based on
-                # availableReplicas, basically this will be 1 if pod is running and
-                # the value will be 0 in-case of pod not in running state
-                status = job_get_output["items"][i]["status"]["availableReplicas"]
-                logger.info(
-                    f"DC Config {job_get_output['items'][i]['metadata']['name']} "
-                    f"available running pods {status}"
-                )
-                if not status:
-                    pod_not_running_list.append(
-                        job_get_output["items"][i]["metadata"]["name"]
-                    )
-
-        # Check the length of pod_not_running_list to decide either all PODs reached
-        # Running state, If not then wait for 30secs and re-iterate while loop
-        if len(pod_not_running_list):
-            time.sleep(timeout)
-            while_iteration_count += 1
-
-            # Delete the dc pods which are not in running state
-            # To check either pods can come up after delete
-            if while_iteration_count == 10 and dc_pod:
-                ocp_obj = OCP()
-                for i in pod_not_running_list:
-                    try:
-                        cmd = f"delete pod {i} -n {namespace}"
-                        ocp_obj.exec_oc_cmd(command=cmd, timeout=120)
-                    except CommandFailed as e:
-                        logger.warning(
-                            f"Failed to delete the pod {i} due to the error {str(e)}"
-                        )
-
-            # Breaking while loop after 13 Iteration i.e. after 30*13 secs of wait_time
-            # And if PODs are still not in Running state then there will be assert.
-            if while_iteration_count >= 13:
-                assert logger.error(
-                    f" Listed PODs took more than 390secs for Running {pod_not_running_list}"
-                )
-                break
-            pod_not_running_list.clear()
-            continue
-        elif not len(pod_not_running_list):
-            for i in range(no_of_pod):
-                pod_running_list.append(job_get_output["items"][i]["metadata"]["name"])
-            logger.info("All PODs are in Running state")
-            break
-
-    return pod_running_list
+    # For DC config there is no Running status so it is checked based on
+    # availableReplicas. Whole wait stays timeout * 13 secs as before.
+    waiter = KubeJobWaiter(timeout=timeout * 13, sleep=min(timeout, 10))
+    waiter.add(kube_job_obj, namespace)
+    if len(waiter.get_pending()) != no_of_pod:
+        logger.warning(
+            f"Kube job has {len(waiter.get_pending())} PODs, expected {no_of_pod}"
+        )
+    waiter.wait()
+    logger.info("All PODs are in Running state")
+    return waiter.get_ready_names(constants.POD) + waiter.get_ready_names(
+        constants.DEPLOYMENTCONFIG
+    )
 
 
 def attach_multiple_pvc_to_pod_dict(
@@ -1919,24 +1833,21 @@ def collect_scale_data_in_file(
 
     pod_count = pvc_count / pvc_per_pod_count
 
-    # Get PVCs and PODs count and list
-    pod_running_list, pvc_bound_list = ([], [])
-    for pod_objs in kube_pod_obj_list:
-        pod_running_list.extend(
-            check_all_pod_reached_running_state_in_kube_job(
-                kube_job_obj=pod_objs,
-                namespace=namespace,
-                no_of_pod=int(pod_count / len(kube_pod_obj_list)),
-            )
-        )
-    for pvc_objs in kube_pvc_obj_list:
-        pvc_bound_list.extend(
-            check_all_pvc_reached_bound_state_in_kube_job(
-                kube_job_obj=pvc_objs,
-                namespace=namespace,
-                no_of_pvc=int(pvc_count / len(kube_pvc_obj_list)),
-            )
-        )
+    # Wait for PODs and PVCs of all the kube jobs together, each round lists
+    # the PODs and the PVCs of the namespace only once
+    waiter = KubeJobWaiter(timeout=390, sleep=10)
+    for kube_obj in kube_pod_obj_list + kube_pvc_obj_list:
+        waiter.add(kube_obj, namespace)
+    pending = waiter.get_pending()
+    logger.info(
+        f"Expected {int(pod_count)} PODs and {pvc_count} PVCs, "
+        f"kube jobs have {len(pending)} objects"
+    )
+    waiter.wait()
+    pod_running_list = waiter.get_ready_names(constants.POD) + waiter.get_ready_names(
+        constants.DEPLOYMENTCONFIG
+    )
+    pvc_bound_list = waiter.get_ready_names(constants.PVC)
 
     logger.info(
         f"Running PODs count {len(pod_running_list)} & "
@@ -9,6 +9,7 @@ from ocs_ci.utility import templating
 from ocs_ci.ocs import constants, ocp, platform_nodes
 from ocs_ci.ocs.utils import oc_get_all_obc_names
 from ocs_ci.ocs.resources import pod
+from ocs_ci.ocs.resources.objectconfigfile import KubeJobWaiter
 from ocs_ci.ocs.utils import get_pod_name_by_pattern
 from ocs_ci.ocs.exceptions import UnexpectedBehaviour, CommandFailed
 from ocs_ci.ocs.node import get_node_objs, wait_for_nodes_status
@@ -89,60 +90,17 @@ def check_all_obc_reached_bound_state_in_kube_job(
     Raises:
         AssertionError: If not all OBC reached to Bound state
     """
-    # Check all OBCs to reach Bound state
-    obc_bound_list, obc_not_bound_list = ([] for i in range(2))
-    while_iteration_count_1 = 0
-    while_iteration_count_2 = 0
-    while True:
-        # Get kube_job obj and check if all OBC's are in Bound state
-        # If not bound adding those OBCs to obc_not_bound_list
-        job_get_output = kube_job_obj.get(namespace=namespace).get("items")
-        if job_get_output is not None and len(job_get_output) == no_of_obc:
-            for i in range(no_of_obc):
-                try:
-                    # If the OBC status field is not yet populated and empty below line
-                    # throws KeyError. Handling it in try:except
-                    status = job_get_output[i]["status"]["phase"]
-                    log.info(
-                        f"obc {job_get_output[i]['metadata']['name']} status {status}"
-                    )
-                except KeyError as err:
-                    if (
-                        "status" in str(err)
-                        or not status
-                        or status != constants.STATUS_BOUND
-                    ):
-                        obc_not_bound_list.append(job_get_output[i]["metadata"]["name"])
-                        # Wait 20 secs to ensure the next obc on the list has status field populated
-                        time.sleep(30)
-                        job_get_output = kube_job_obj.get(namespace=namespace).get(
-                            "items"
-                        )
-        else:
-            while_iteration_count_1 += 1
-            time.sleep(timeout)
-            continue
-
-        # Check the length of obc_not_bound_list to decide either all OBCs reached Bound state
-        # If not then wait for timeout secs and re-iterate while loop
-        if len(obc_not_bound_list):
-            log.info(f"Number of OBCs are not in Bound state {len(obc_not_bound_list)}")
-            time.sleep(timeout)
-            while_iteration_count_2 += 1
-            if while_iteration_count_2 >= no_wait_time:
-                assert log.error(
-                    f" Listed OBCs took more than {timeout*no_wait_time} "
-                    f"secs to be bounded {obc_not_bound_list}"
-                )
-                break
-            obc_not_bound_list.clear()
-            continue
-        elif not len(obc_not_bound_list):
-            for i in range(no_of_obc):
-                obc_bound_list.append(job_get_output[i]["metadata"]["name"])
-            log.info("All OBCs in Bound state")
-            break
-    return obc_bound_list
+    # OBCs without populated status yet are simply not Bound, the wait ends
+    # as soon as all of them are Bound
+    waiter = KubeJobWaiter(timeout=timeout * no_wait_time, sleep=min(timeout, 10))
+    waiter.add(kube_job_obj, namespace)
+    if len(waiter.get_pending()) != no_of_obc:
+        log.warning(
+            f"Kube job has {len(waiter.get_pending())} OBCs, expected {no_of_obc}"
+        )
+    waiter.wait()
+    log.info("All OBCs in Bound state")
+    return waiter.get_ready_names(constants.OBC)
 
 
 def cleanup(namespace, obc_list=None):
@@ -205,6 +163,191 @@ def get_hpa_utilization(namespace):
     return hpa_cpu_utilization
 
 
+# Events of OBC creation and deletion in noobaa-operator log, each with
+# cheap prefilter substring and regex capturing the part of the line which
+# holds the OBC name
+OBC_LOG_EVENTS = {
+    "provisioning": ("provisioning", re.compile(r"provisioning.*?bucket(.*)")),
+    "bound": ("updating status", re.compile(r"updating status(.*)Bound")),
+    "removing": ("removing ObjectBucket", re.compile(r"removing ObjectBucket(.*)")),
+    "deleted": ("ObjectBucket deleted", re.compile(r"ObjectBucket deleted(.*)")),
+}
+# klog time prefix of the log lines, e.g. I0120 10:00:00.000000
+KLOG_TIME_PATTERN = re.compile(r"^[IWEF](\d{4} \d{2}:\d{2}:\d{2}\.\d+)")
+LOG_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9.-]*")
+# Overlap of the incremental log fetches, covers clock skew to the cluster
+LOG_FETCH_OVERLAP = datetime.timedelta(minutes=5)
+
+
+def get_log_name_keys(text):
+    """
+    Get keys under which the names in the log text are indexed - the names
+    and all their dash-aligned parts, so e.g. OBC name is found in the
+    generated bucket name or in the ObjectBucket name
+    (obc-<namespace>-<obc name>)
+
+    Args:
+        text (str): Part of the log line
+
+    Returns:
+        set: The keys
+
+    """
+    keys = set()
+    for name in LOG_NAME_PATTERN.findall(text):
+        parts = name.split("-")
+        for start in range(len(parts)):
+            for end in range(start + 1, len(parts) + 1):
+                keys.add("-".join(parts[start:end]))
+    return keys
+
+
+class NoobaaOperatorLogIndex(object):
+    """
+    Index of the OBC creation and deletion events in noobaa-operator log,
+    keyed by the OBC name. The log is read once and then fetched
+    incrementally with --since-time, so the lookup of an OBC event doesn't
+    depend on the size of the log.
+
+    """
+
+    def __init__(self, namespace=None):
+        """
+        Constructor of NoobaaOperatorLogIndex
+
+        Args:
+            namespace (str): Namespace of the noobaa-operator pod
+
+        """
+        self.namespace = namespace or config.ENV_DATA["cluster_namespace"]
+        # Event to the dict of the name key to the time of its first occurrence
+        self.events = {event: dict() for event in OBC_LOG_EVENTS}
+        self.pod_name = None
+        self.last_fetch = None
+        self.this_year = datetime.datetime.now().year
+
+    def add_lines(self, lines):
+        """
+        Index the events in the log lines
+
+        Args:
+            lines (list): Lines of the noobaa-operator log
+
+        """
+        for line in lines:
+            for event, (prefilter, pattern) in OBC_LOG_EVENTS.items():
+                if prefilter not in line:
+                    continue
+                match = pattern.search(line)
+                time_match = KLOG_TIME_PATTERN.match(line)
+                if not match or not time_match:
+                    continue
+                event_time = datetime.datetime.strptime(
+                    f"{self.this_year} {time_match.group(1)}", "%Y %m%d %H:%M:%S.%f"
+                )
+                for key in get_log_name_keys(match.group(1)):
+                    self.events[event].setdefault(key, event_time)
+
+    def refresh(self):
+        """
+        Fetch the noobaa-operator log written since the last fetch (whole
+        log on the first fetch or after the pod changed) and index it
+        """
+        pod_name = get_pod_name_by_pattern("noobaa-operator-", self.namespace)[0]
+        fetch_time = datetime.datetime.now(datetime.timezone.utc)
+        since_time = None
+        if pod_name == self.pod_name and self.last_fetch:
+            since_time = (self.last_fetch - LOG_FETCH_OVERLAP).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+        nb_pod_log = pod.get_pod_logs(
+            pod_name=pod_name, namespace=self.namespace, since_time=since_time
+        )
+        self.add_lines(nb_pod_log.split("\n"))
+        self.pod_name = pod_name
+        self.last_fetch = fetch_time
+
+    def get_durations(self, obc_names, start_event, end_event):
+        """
+        Get time between two events of the OBCs
+
+        Args:
+            obc_names (list): Names of the OBCs
+            start_event (str): Name of the start event, key of OBC_LOG_EVENTS
+            end_event (str): Name of the end event, key of OBC_LOG_EVENTS
+
+        Returns:
+            tuple: Dict of OBC name to the duration in seconds and list of
+                the OBCs without both events in the log
+
+        """
+        durations = dict()
+        no_data = list()
+        for obc_name in obc_names:
+            start = self.events[start_event].get(obc_name)
+            end = self.events[end_event].get(obc_name)
+            if start is None or end is None:
+                no_data.append(obc_name)
+                continue
+            durations[obc_name] = (end - start).total_seconds()
+        return durations, no_data
+
+    def measure(self, obc_names, start_event, end_event, timeout, tries=10):
+        """
+        Measure time between two events of the OBCs, wait for the events
+        which are not in the log yet
+
+        Args:
+            obc_names (list): Names of the OBCs
+            start_event (str): Name of the start event, key of OBC_LOG_EVENTS
+            end_event (str): Name of the end event, key of OBC_LOG_EVENTS
+            timeout (int): Wait time in seconds before fetching the log again
+            tries (int): Number of the log fetches after the first one
+
+        Returns:
+            dict: OBC name to the duration in seconds
+
+        Raises:
+            UnexpectedBehaviour: If the events of some OBCs are not in the log
+
+        """
+        self.refresh()
+        durations, no_data = self.get_durations(obc_names, start_event, end_event)
+        loop_cnt = 0
+        while no_data:
+            if loop_cnt >= tries:
+                log.info(f"Waited for {tries} log fetches but still no data")
+                raise UnexpectedBehaviour(
+                    f"There is no obc {start_event} and {end_event} data in "
+                    f"noobaa-operator logs for {no_data}"
+                )
+            time.sleep(timeout)
+            self.refresh()
+            durations, no_data = self.get_durations(obc_names, start_event, end_event)
+            loop_cnt += 1
+        for obc_name, duration in durations.items():
+            log.info(f"{obc_name}: {duration} sec")
+        return durations
+
+
+_nb_log_index = None
+
+
+def get_noobaa_operator_log_index():
+    """
+    Get the index of noobaa-operator log shared by the OBC measurements
+
+    Returns:
+        NoobaaOperatorLogIndex: The index
+
+    """
+    global _nb_log_index
+    namespace = config.ENV_DATA["cluster_namespace"]
+    if _nb_log_index is None or _nb_log_index.namespace != namespace:
+        _nb_log_index = NoobaaOperatorLogIndex(namespace)
+    return _nb_log_index
+
+
 def measure_obc_creation_time(obc_name_list, timeout=120):
     """
     Measure OBC creation time
@@ -215,69 +358,9 @@ def measure_obc_creation_time(obc_name_list, timeout=120):
         obc_dict (dict): Dictionary of obcs and creation time in second
 
     """
-    # Get obc creation logs
-    nb_pod_name = get_pod_name_by_pattern("noobaa-operator-")
-    nb_pod_log = pod.get_pod_logs(
-        pod_name=nb_pod_name[0], namespace=config.ENV_DATA["cluster_namespace"]
+    return get_noobaa_operator_log_index().measure(
+        obc_name_list, "provisioning", "bound", timeout
     )
-    nb_pod_log = nb_pod_log.split("\n")
-
-    loop_cnt = 0
-    while True:
-        no_data = list()
-        for obc_name in obc_name_list:
-            start = [
-                i
-                for i in nb_pod_log
-                if re.search(f"provisioning.*bucket.*{obc_name}", i)
-            ]
-            end = [
-                i
-                for i in nb_pod_log
-                if re.search(f"updating status.*{obc_name}.*Bound", i)
-            ]
-            if not start or not end:
-                no_data.append(obc_name)
-        if no_data:
-            time.sleep(timeout)
-            nb_pod_name = get_pod_name_by_pattern("noobaa-operator-")
-            nb_pod_log = pod.get_pod_logs(
-                pod_name=nb_pod_name[0], namespace=config.ENV_DATA["cluster_namespace"]
-            )
-            nb_pod_log = nb_pod_log.split("\n")
-            loop_cnt += 1
-            if loop_cnt >= 10:
-                log.info("Waited for more than 10 mins but still no data")
-                raise UnexpectedBehaviour(
-                    f"There is no obc creation data in noobaa-operator logs for {no_data}"
-                )
-            continue
-        else:
-            break
-    obc_dict = dict()
-    this_year = str(datetime.datetime.now().year)
-
-    for obc_name in obc_name_list:
-        # Extract obc creation start time
-        start_item = [
-            i for i in nb_pod_log if re.search(f"provisioning.*bucket.*{obc_name}", i)
-        ]
-        mon_day = " ".join(start_item[0].split(" ")[0:2])
-        start = f"{this_year} {mon_day}"
-        dt_start = datetime.datetime.strptime(start, "%Y I%m%d %H:%M:%S.%f")
-
-        # Extract obc creation end time
-        end_item = [
-            i for i in nb_pod_log if re.search(f"updating status.*{obc_name}.*Bound", i)
-        ]
-        mon_day = " ".join(end_item[0].split(" ")[0:2])
-        end = f"{this_year} {mon_day}"
-        dt_end = datetime.datetime.strptime(end, "%Y I%m%d %H:%M:%S.%f")
-        total = dt_end - dt_start
-        log.info(f"{obc_name}: {total.total_seconds()} sec")
-        obc_dict[obc_name] = total.total_seconds()
-
-    return obc_dict
 
 
 def measure_obc_deletion_time(obc_name_list, timeout=60):
@@ -290,69 +373,9 @@ def measure_obc_deletion_time(obc_name_list, timeout=60):
         obc_dict (dict): Dictionary of obcs and deletion time in second
 
     """
-    # Get obc deletion logs
-    nb_pod_name = get_pod_name_by_pattern("noobaa-operator-")
-    nb_pod_log = pod.get_pod_logs(
-        pod_name=nb_pod_name[0], namespace=config.ENV_DATA["cluster_namespace"]
+    return get_noobaa_operator_log_index().measure(
+        obc_name_list, "removing", "deleted", timeout
     )
-    nb_pod_log = nb_pod_log.split("\n")
-
-    loop_cnt = 0
-    while True:
-        no_data = list()
-        for obc_name in obc_name_list:
-            start = [
-                i
-                for i in nb_pod_log
-                if re.search(f"removing ObjectBucket.*{obc_name}", i)
-            ]
-            end = [
-                i
-                for i in nb_pod_log
-                if re.search(f"ObjectBucket deleted.*{obc_name}", i)
-            ]
-            if not start or not end:
-                no_data.append(obc_name)
-        if no_data:
-            time.sleep(timeout)
-            nb_pod_name = get_pod_name_by_pattern("noobaa-operator-")
-            nb_pod_log = pod.get_pod_logs(
-                pod_name=nb_pod_name[0], namespace=config.ENV_DATA["cluster_namespace"]
-            )
-            nb_pod_log = nb_pod_log.split("\n")
-            loop_cnt += 1
-            if loop_cnt >= 10:
-                log.info("Waited for more than 10 mins but still no data")
-                raise UnexpectedBehaviour(
-                    f"There is no obc deletion data in noobaa-operator logs for {no_data}"
-                )
-            continue
-        else:
-            break
-
-    obc_dict = dict()
-    this_year = str(datetime.datetime.now().year)
-    for obc_name in obc_name_list:
-        # Extract obc deletion start time
-        start_item = [
-            i for i in nb_pod_log if re.search(f"removing ObjectBucket.*{obc_name}", i)
-        ]
-        mon_day = " ".join(start_item[0].split(" ")[0:2])
-        start = f"{this_year} {mon_day}"
-        dt_start = datetime.datetime.strptime(start, "%Y I%m%d %H:%M:%S.%f")
-
-        # Extract obc deletion end time
-        end_item = [
-            i for i in nb_pod_log if re.search(f"ObjectBucket deleted.*{obc_name}", i)
-        ]
-        mon_day = " ".join(end_item[0].split(" ")[0:2])
-        end = f"{this_year} {mon_day}"
-        dt_end = datetime.datetime.strptime(end, "%Y I%m%d %H:%M:%S.%f")
-        total = dt_end - dt_start
-        log.info(f"{obc_name}: {total.total_seconds()} sec")
-        obc_dict[obc_name] = total.total_seconds()
-
-    return obc_dict
 
 
 def get_pod_obj(pod_name):
@@ -0,0 +1,117 @@
+# -*- coding: utf8 -*-
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.resources import pod
+
+
+@pytest.fixture
+def fake_cluster(monkeypatch):
+    """
+    Replace OCP in the pod module with fake one. The pods dict holds name
+    to list of UIDs listed in the subsequent rounds, None once the pod is
+    gone.
+    """
+    cluster = {"commands": [], "locks": [], "lists": 0, "pods": {}, "down": False}
+
+    class FakeOCP(object):
+        def __init__(self, kind, namespace, threading_lock=None):
+            self.namespace = namespace
+            self.threading_lock = threading_lock
+
+        def exec_oc_cmd(self, command):
+            cluster["commands"].append(command)
+            cluster["locks"].append(self.threading_lock)
+
+        def get(self, selector=None):
+            cluster["lists"] += 1
+            if cluster["down"]:
+                raise CommandFailed("The connection to the server was refused")
+            items = []
+            for name, uids in cluster["pods"].items():
+                uid = uids.pop(0) if len(uids) > 1 else uids[0]
+                if uid:
+                    items.append({"metadata": {"name": name, "uid": uid}})
+            return {"items": items}
+
+    monkeypatch.setattr(pod, "OCP", FakeOCP)
+    return cluster
+
+
+def get_pod_obj(name, uid, threading_lock=None):
+    return SimpleNamespace(
+        name=name,
+        namespace="ns",
+        data={"metadata": {"uid": uid}},
+        threading_lock=threading_lock,
+        _is_deleted=False,
+    )
+
+
+def test_bulk_delete_pods(fake_cluster, monkeypatch):
+    """
+    Deletion is issued in chunks without waiting, then all the pods are
+    waited for with one list per round. Pod recreated with the same name is
+    considered deleted.
+    """
+    monkeypatch.setattr(pod, "BULK_DELETE_CHUNK_SIZE", 2)
+    fake_cluster["pods"] = {
+        "a": ["uid-a", None],
+        "b": ["uid-b", "uid-b", None],
+        "c": ["uid-c", "uid-c2"],
+    }
+    pod_objs = [get_pod_obj(name, f"uid-{name}") for name in "abc"]
+    deletion_times = pod.bulk_delete_pods(pod_objs, grace_period=5, sleep=0)
+    assert fake_cluster["commands"] == [
+        "delete Pod a b --wait=false --grace-period=5",
+        "delete Pod c --wait=false --grace-period=5",
+    ]
+    assert sorted(deletion_times) == ["ns/a", "ns/b", "ns/c"]
+    assert fake_cluster["lists"] == 3
+    assert all(pod_obj._is_deleted for pod_obj in pod_objs)
+
+
+def test_bulk_delete_pods_selector_timeout(fake_cluster):
+    """
+    Pods matching the selector are deleted with one command and pods not
+    deleted in time are reported.
+    """
+    fake_cluster["pods"] = {"a": ["uid-a", None], "b": ["uid-b"]}
+    with pytest.raises(TimeoutExpiredError, match="ns/b"):
+        pod.bulk_delete_pods(
+            namespace="ns", selector="app=test", timeout=0.2, sleep=0.05
+        )
+    assert fake_cluster["commands"] == ["delete Pod -l app=test --wait=false"]
+
+
+def test_bulk_delete_pods_threading_lock(fake_cluster):
+    """
+    The oc delete takes the threading lock of the pods, pods with different
+    locks are deleted separately.
+    """
+    lock = threading.RLock()
+    fake_cluster["pods"] = {"a": [None], "b": [None], "c": [None]}
+    pod_objs = [get_pod_obj("a", "uid-a", lock), get_pod_obj("b", "uid-b", lock)]
+    pod_objs.append(get_pod_obj("c", "uid-c"))
+    pod.delete_pods(pod_objs)
+    assert fake_cluster["commands"] == [
+        "delete Pod a b --wait=false",
+        "delete Pod c --wait=false",
+    ]
+    assert fake_cluster["locks"] == [lock, None]
+
+
+def test_bulk_delete_pods_api_unavailable(fake_cluster):
+    """
+    When the pods can't be listed at all until the timeout, all of them are
+    reported as not deleted with the last failure as the cause.
+    """
+    fake_cluster["down"] = True
+    pod_objs = [get_pod_obj(name, f"uid-{name}") for name in "ab"]
+    with pytest.raises(TimeoutExpiredError, match="2 pods not deleted") as excinfo:
+        pod.bulk_delete_pods(pod_objs, timeout=0.2, sleep=0.05)
+    assert isinstance(excinfo.value.__cause__, CommandFailed)
@@ -0,0 +1,127 @@
+# -*- coding: utf8 -*-
+
+import os
+import stat
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.resources.pod import Pod, parse_ceph_batch_output
+
+FAKE_CEPH = """#!/bin/sh
+# Fake ceph returning the command as JSON, failing for "ceph fail"
+if [ "$1" = "fail" ]; then
+    echo "Error EINVAL: invalid command" >&2
+    exit 22
+fi
+echo "warning on stderr" >&2
+echo "{\\"cmd\\": \\"$1\\", \\"format\\": \\"$3\\"}"
+"""
+
+
+@pytest.fixture
+def fake_toolbox(tmp_path, monkeypatch):
+    """
+    Object with the toolbox pod attributes used by Pod.exec_ceph_cmds, which
+    runs the commands locally with fake ceph on PATH.
+    """
+    ceph = tmp_path / "ceph"
+    ceph.write_text(FAKE_CEPH)
+    ceph.chmod(ceph.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    execs = []
+
+    def exec_cmd_on_pod(command, out_yaml_format=True, timeout=600):
+        execs.append(command)
+        return subprocess.run(
+            command, shell=True, stdout=subprocess.PIPE, check=True
+        ).stdout.decode()
+
+    return SimpleNamespace(
+        labels={"app": "rook-ceph-tools"},
+        exec_cmd_on_pod=exec_cmd_on_pod,
+        execs=execs,
+    )
+
+
+def test_exec_ceph_cmds(fake_toolbox):
+    """
+    All the commands run in one exec and results are parsed per command.
+    """
+    results = Pod.exec_ceph_cmds(
+        fake_toolbox, ["ceph df", "ceph fail", "ceph status"], raise_on_failure=False
+    )
+    assert len(fake_toolbox.execs) == 1
+    assert results["ceph df"] == {
+        "output": {"cmd": "df", "format": "json"},
+        "returncode": 0,
+        "error": None,
+    }
+    assert results["ceph status"]["output"]["cmd"] == "status"
+    assert results["ceph fail"]["output"] is None
+    assert results["ceph fail"]["returncode"] == 22
+    assert "EINVAL" in results["ceph fail"]["error"]
+
+
+def test_exec_ceph_cmds_raises_on_failure(fake_toolbox):
+    """
+    Failure of any command is raised by default.
+    """
+    with pytest.raises(CommandFailed, match="ceph fail: Error EINVAL"):
+        Pod.exec_ceph_cmds(fake_toolbox, ["ceph df", "ceph fail"])
+
+
+def test_parse_ceph_batch_output_incomplete():
+    """
+    Command which didn't finish and invalid JSON are reported as failures.
+    """
+    output = "\n".join(
+        [
+            "M BEGIN 0",
+            "not json",
+            "M STDERR 0",
+            "M END 0 0",
+            "M BEGIN 1",
+            '{"partial":',
+        ]
+    )
+    results = parse_ceph_batch_output(output, ["ceph a", "ceph b"], "M")
+    assert results["ceph a"]["returncode"] == -1
+    assert "Failed to parse JSON" in results["ceph a"]["error"]
+    assert results["ceph b"] == {
+        "output": None,
+        "returncode": None,
+        "error": "Command didn't finish",
+    }
+
+
+def test_parse_ceph_batch_output_without_trailing_newline():
+    """
+    Output and stderr not ending with a newline don't hide the markers.
+    """
+    output = "\n".join(
+        [
+            "M BEGIN 0",
+            '{"a": 1}M STDERR 0',
+            "warningM END 0 0",
+            "M BEGIN 1",
+            "errorM STDERR 1",
+            "M END 1 2",
+        ]
+    )
+    results = parse_ceph_batch_output(output, ["ceph a", "ceph b"], "M")
+    assert results["ceph a"] == {"output": {"a": 1}, "returncode": 0, "error": None}
+    assert results["ceph b"] == {"output": None, "returncode": 2, "error": "error"}
+
+
+def test_exec_ceph_cmds_without_trailing_newline(fake_toolbox, tmp_path):
+    """
+    Command output without a trailing newline is parsed.
+    """
+    ceph = tmp_path / "ceph"
+    ceph.write_text('#!/bin/sh\nprintf \'{"cmd": "%s"}\' "$1"\n')
+    results = Pod.exec_ceph_cmds(fake_toolbox, ["ceph df", "ceph status"])
+    assert results["ceph df"]["output"] == {"cmd": "df"}
+    assert results["ceph status"]["output"] == {"cmd": "status"}
@@ -0,0 +1,110 @@
+# -*- coding: utf8 -*-
+
+import json
+import os
+import stat
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs import cluster
+from ocs_ci.ocs.cluster import CephHealthMonitor
+from ocs_ci.ocs.exceptions import CephHealthException
+
+FAKE_OC = """#!/bin/sh
+# Fake oc watch printing the events from $FAKE_WATCH_EVENTS, one per 0.1s
+[ -n "$FAKE_WATCH_FAIL" ] && echo "error: watch failed" >&2 && exit 1
+while IFS= read -r line; do
+    printf '%s\\n' "$line"
+    sleep 0.1
+done < "$FAKE_WATCH_EVENTS"
+sleep 30
+"""
+
+
+@pytest.fixture
+def fake_watch(tmp_path, monkeypatch):
+    """
+    Put fake oc, which prints the watch events written to the returned file,
+    to PATH and save the timelines to the temporary directory.
+    """
+    oc = tmp_path / "oc"
+    oc.write_text(FAKE_OC)
+    oc.chmod(oc.stat().st_mode | stat.S_IEXEC)
+    events = tmp_path / "events"
+    events.write_text("")
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_WATCH_EVENTS", str(events))
+    monkeypatch.setattr(cluster, "ocsci_log_path", lambda: str(tmp_path / "logs"))
+    cluster.pop_ceph_health_timelines()
+    return events
+
+
+@pytest.fixture
+def ceph_cluster():
+    """
+    Object with the CephCluster attributes used by the monitor.
+    """
+    return SimpleNamespace(
+        namespace="openshift-storage",
+        cluster_name="ocs-storagecluster-cephcluster",
+        get_ceph_status=lambda: "HEALTH_ERROR status",
+        get_ceph_health=lambda detail=False: "HEALTH_OK",
+    )
+
+
+def wait_for_timeline(monitor, length, timeout=5):
+    """
+    Wait until the monitor records the number of health transitions.
+    """
+    end = time.time() + timeout
+    while len(monitor.timeline) < length and time.time() < end:
+        time.sleep(0.05)
+
+
+def test_watch_health_transitions(fake_watch, ceph_cluster):
+    """
+    Health transitions from the CephCluster watch are recorded in the timeline
+    without executing anything in the toolbox.
+    """
+    warn = {"MON_DOWN": {"message": "1/3 mons down", "severity": "HEALTH_WARN"}}
+    fake_watch.write_text(
+        "HEALTH_OK\t\nHEALTH_OK\t\n" f"HEALTH_WARN\t{json.dumps(warn)}\nHEALTH_OK\t\n"
+    )
+    ceph_cluster.get_ceph_health = None
+    with CephHealthMonitor(ceph_cluster, mode="watch") as monitor:
+        wait_for_timeline(monitor, 3)
+    assert [t["health"] for t in monitor.timeline] == [
+        "HEALTH_OK",
+        "HEALTH_WARN",
+        "HEALTH_OK",
+    ]
+    assert monitor.timeline[1]["details"] == warn
+    assert {t["source"] for t in monitor.timeline} == {"watch"}
+    assert not monitor.is_alive()
+    assert cluster.pop_ceph_health_timelines() == [monitor.timeline]
+    timelines_dir = os.path.join(cluster.ocsci_log_path(), "ceph_health_timelines")
+    assert len(os.listdir(timelines_dir)) == 1
+
+
+def test_watch_health_error(fake_watch, ceph_cluster):
+    """
+    HEALTH_ERROR from the watch is raised at the exit of the monitor.
+    """
+    fake_watch.write_text("HEALTH_OK\t\nHEALTH_ERROR\t\n")
+    with pytest.raises(CephHealthException, match="HEALTH_ERROR status"):
+        with CephHealthMonitor(ceph_cluster, mode="watch") as monitor:
+            wait_for_timeline(monitor, 2)
+
+
+def test_watch_fallback_to_exec(fake_watch, ceph_cluster, monkeypatch):
+    """
+    Repeatedly failing watch falls back to ceph health in the toolbox.
+    """
+    monkeypatch.setenv("FAKE_WATCH_FAIL", "1")
+    with CephHealthMonitor(ceph_cluster, sleep=0.1, mode="watch") as monitor:
+        wait_for_timeline(monitor, 1)
+    assert monitor.mode == "exec"
+    assert monitor.timeline[0]["health"] == "HEALTH_OK"
+    assert monitor.timeline[0]["source"] == "exec"
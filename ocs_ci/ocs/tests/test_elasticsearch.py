@@ -0,0 +1,108 @@
+# -*- coding: utf8 -*-
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from elasticsearch import Elasticsearch
+
+from ocs_ci.ocs.elasticsearch import get_docs_from_file, load_file_into_elasticsearch
+
+
+class FakeBulkHandler(BaseHTTPRequestHandler):
+    """
+    Minimal in-process implementation of the elasticsearch _bulk endpoint.
+    Documents with "fail" key are rejected.
+    """
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        lines = [json.loads(line) for line in body.splitlines() if line]
+        items = []
+        self.server.requests.append(len(lines) // 2)
+        for action, doc in zip(lines[::2], lines[1::2]):
+            index = action["index"].get("_index", self.path.split("/")[1])
+            if "fail" in doc:
+                items.append({"index": {"_index": index, "status": 400}})
+            else:
+                self.server.docs.append(doc)
+                items.append({"index": {"_index": index, "status": 201}})
+        response = json.dumps(
+            {
+                "took": 1,
+                "errors": any(i["index"]["status"] >= 300 for i in items),
+                "items": items,
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    do_PUT = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_es_server():
+    """
+    Start the fake bulk endpoint and return the server object.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeBulkHandler)
+    server.docs = []
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """
+    Results file with 1000 documents, an empty line, an invalid line and one
+    document which the server rejects.
+    """
+    file_name = tmp_path / "ripsaw-fio-results.data.json"
+    with open(file_name, "w") as fd:
+        for num in range(1000):
+            fd.write(json.dumps({"num": num}) + "\n")
+        fd.write("\n{not a json}\n")
+        fd.write(json.dumps({"fail": True}) + "\n")
+    return str(file_name)
+
+
+def test_get_docs_from_file_skips_invalid_lines(data_file):
+    """
+    Documents are streamed from the file and invalid lines are skipped.
+    """
+    docs = list(get_docs_from_file(data_file))
+    assert len(docs) == 1001
+    assert docs[0] == {"num": 0}
+
+
+@pytest.mark.parametrize("thread_count", [1, 3])
+def test_load_file_into_elasticsearch(fake_es_server, data_file, thread_count):
+    """
+    Documents are loaded in chunks and failures are counted.
+    """
+    host, port = fake_es_server.server_address
+    connection = Elasticsearch([f"http://{host}:{port}"])
+    stats = load_file_into_elasticsearch(
+        connection,
+        data_file,
+        "ripsaw-fio-results",
+        chunk_size=100,
+        thread_count=thread_count,
+    )
+    assert stats["indexed"] == 1000
+    assert stats["failed"] == 1
+    assert stats["bytes"] > 0
+    assert len(fake_es_server.docs) == 1000
+    assert max(fake_es_server.requests) == 100
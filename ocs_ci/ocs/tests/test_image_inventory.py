@@ -0,0 +1,90 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import image_inventory, version
+from ocs_ci.ocs.image_inventory import ImageInventory
+
+
+def get_pod(namespace, name, images, statuses=True, labels=None):
+    """
+    Get pod resource with containers running the images.
+    """
+    containers = [{"name": f"c{i}", "image": image} for i, image in enumerate(images)]
+    pod_data = {
+        "metadata": {"namespace": namespace, "name": name, "labels": labels or {}},
+        "spec": {"containers": containers},
+        "status": {},
+    }
+    if statuses:
+        pod_data["status"]["containerStatuses"] = [
+            {
+                "name": container["name"],
+                "image": container["image"],
+                "imageID": f"{container['image']}@sha256:1",
+            }
+            for container in containers
+        ]
+    return pod_data
+
+
+PODS = [
+    get_pod("openshift-storage", "rook", ["rook:1", "ceph:1"], labels={"app": "r"}),
+    get_pod("openshift-storage", "noobaa", ["noobaa:1"], statuses=False),
+    get_pod("openshift-cluster-storage-operator", "cso", ["cso:1"]),
+    get_pod("default", "app", ["app:1"]),
+]
+
+
+@pytest.fixture
+def list_calls(monkeypatch):
+    """
+    Replace OCP in image_inventory with fake listing PODS and count the
+    lists.
+    """
+    calls = []
+
+    class FakeOCP(object):
+        def __init__(self, kind):
+            pass
+
+        def get(self, all_namespaces=False):
+            calls.append(all_namespaces)
+            return {"items": PODS}
+
+    monkeypatch.setattr(image_inventory, "OCP", FakeOCP)
+    image_inventory.clear_image_inventory_cache()
+    yield calls
+    image_inventory.clear_image_inventory_cache()
+
+
+def test_image_inventory():
+    inventory = ImageInventory(PODS)
+    assert inventory.get_storage_image_ids() == {
+        "openshift-cluster-storage-operator": {"cso:1": {"cso:1@sha256:1"}},
+        "openshift-storage": {
+            "rook:1": {"rook:1@sha256:1"},
+            "ceph:1": {"ceph:1@sha256:1"},
+        },
+    }
+    assert [
+        record["container"]
+        for record in inventory.get_containers(selector={"app": "r"})
+    ] == ["c0", "c1"]
+    assert inventory.find_images("^(rook|noobaa)") == ["noobaa:1", "rook:1"]
+
+
+def test_ocs_version_from_cached_inventory(list_calls):
+    """
+    Version report and other consumers share one list of the pods from all
+    namespaces until refresh is requested.
+    """
+    image_dict = version.get_ocs_version()
+    assert list(image_dict) == [
+        "openshift-cluster-storage-operator",
+        "openshift-storage",
+    ]
+    image_inventory.get_image_inventory().find_images("rook")
+    assert list_calls == [True]
+    version.get_ocs_version(refresh=True)
+    assert list_calls == [True, True]
@@ -0,0 +1,111 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.resources import objectconfigfile
+from ocs_ci.ocs.resources.objectconfigfile import KubeJobWaiter, ObjectConfFile
+
+
+def get_obj(kind, name, ready=True):
+    """
+    Get listed object of the kind, ready or not.
+    """
+    obj = {
+        "kind": kind,
+        "metadata": {"name": name, "creationTimestamp": "2020-01-01T00:00:00Z"},
+        "status": {},
+    }
+    if kind == "DeploymentConfig":
+        obj["status"]["availableReplicas"] = 1 if ready else 0
+    elif kind == constants.POD:
+        obj["status"]["phase"] = "Running" if ready else "Pending"
+    elif ready:
+        obj["status"]["phase"] = "Bound"
+    return obj
+
+
+@pytest.fixture
+def fake_cluster(monkeypatch):
+    """
+    Replace OCP in objectconfigfile with fake listing objects of the cluster
+    dict (kind -> list of lists of objects returned by subsequent calls) and
+    recording the calls.
+    """
+    cluster = {"calls": []}
+
+    class FakeOCP(object):
+        def __init__(self, kind, namespace):
+            self.kind = kind
+            self.namespace = namespace
+
+        def get(self, selector=None):
+            cluster["calls"].append((self.kind, self.namespace))
+            rounds = cluster[self.kind]
+            items = rounds.pop(0) if len(rounds) > 1 else rounds[0]
+            return {"items": items}
+
+    monkeypatch.setattr(objectconfigfile, "OCP", FakeOCP)
+    return cluster
+
+
+def get_kube_job(tmp_path, name, kind, count):
+    """
+    Get kube job with count of objects of the kind.
+    """
+    return ObjectConfFile(
+        name,
+        [get_obj(kind, f"{name}-{i}") for i in range(count)],
+        "namespace",
+        tmp_path,
+    )
+
+
+def test_one_list_per_kind(fake_cluster, tmp_path):
+    """
+    Objects of several kube jobs are checked with one list per kind and
+    namespace in every round, and the wait ends when all are ready.
+    """
+    pvc_jobs = [get_kube_job(tmp_path, f"pvc{j}", constants.PVC, 50) for j in range(3)]
+    pod_job = get_kube_job(tmp_path, "pod", constants.POD, 20)
+    pvcs = [get_obj(constants.PVC, f"pvc{j}-{i}") for j in range(3) for i in range(50)]
+    pods_pending = [get_obj(constants.POD, f"pod-{i}", i < 10) for i in range(20)]
+    pods = [get_obj(constants.POD, f"pod-{i}") for i in range(20)]
+    fake_cluster["persistentvolumeclaim"] = [pvcs]
+    fake_cluster["pod"] = [pods_pending, pods]
+
+    waiter = KubeJobWaiter(timeout=10, sleep=0)
+    for kube_job in pvc_jobs + [pod_job]:
+        waiter.add(kube_job, "namespace")
+    waiter.wait()
+
+    # PVCs are all Bound in the first round, pods in the second one
+    assert fake_cluster["calls"] == [
+        ("persistentvolumeclaim", "namespace"),
+        ("pod", "namespace"),
+        ("pod", "namespace"),
+    ]
+    assert waiter.get_ready_names(constants.PVC) == [
+        f"pvc{j}-{i}" for j in range(3) for i in range(50)
+    ]
+    assert len(waiter.get_ready_names(constants.POD)) == 20
+    summary = waiter.get_summary()
+    assert summary["persistentvolumeclaim"]["count"] == 150
+    assert summary["pod"]["p50"] > 0
+
+
+def test_not_ready_in_time(fake_cluster, tmp_path):
+    """
+    Objects not ready in time are reported in the AssertionError.
+    """
+    fake_cluster["deploymentconfig"] = [
+        [
+            get_obj("DeploymentConfig", "dc-0"),
+            get_obj("DeploymentConfig", "dc-1", False),
+        ]
+    ]
+    waiter = KubeJobWaiter(timeout=0.2, sleep=0.05)
+    waiter.add(get_kube_job(tmp_path, "dc", "DeploymentConfig", 2), "namespace")
+    with pytest.raises(AssertionError, match="dc-1"):
+        waiter.wait()
+    assert waiter.get_ready_names(constants.DEPLOYMENTCONFIG) == ["dc-0"]
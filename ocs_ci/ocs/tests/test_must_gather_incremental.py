@@ -0,0 +1,76 @@
+# -*- coding: utf8 -*-
+
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs import utils
+
+
+@pytest.fixture
+def clusters(monkeypatch):
+    """
+    Two clusters and clean collection times.
+    """
+    monkeypatch.setattr(
+        utils.ocsci_config,
+        "clusters",
+        [
+            SimpleNamespace(ENV_DATA={"cluster_name": "c1"}),
+            SimpleNamespace(ENV_DATA={"cluster_name": "c2"}),
+        ],
+    )
+    monkeypatch.setattr(utils.ocsci_config, "cur_index", 0)
+    monkeypatch.setattr(utils, "mg_last_collection_time", dict())
+
+
+def fake_collect(results, calls):
+    """
+    Fake _collect_ocs_logs which returns the given results per
+    (cluster name, gatherer) and records the since times.
+    """
+
+    def collect(cluster_config, ocp, ocs, mcg, since_time, **kwargs):
+        gatherer = "ocp" if ocp else "ocs" if ocs else "mcg"
+        key = (cluster_config.ENV_DATA["cluster_name"], gatherer)
+        calls[key] = since_time
+        result = results.get(key, True)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return collect
+
+
+def test_collection_time_per_gatherer(clusters, monkeypatch):
+    calls = {}
+    monkeypatch.setattr(
+        utils, "_collect_ocs_logs", fake_collect({("c1", "ocs"): False}, calls)
+    )
+    utils.collect_ocs_logs("test", ocp=True, ocs=True, incremental=True)
+    assert set(utils.mg_last_collection_time) == {
+        ("c1", "ocp"),
+        ("c2", "ocp"),
+        ("c2", "ocs"),
+    }
+    assert all(since_time is None for since_time in calls.values())
+
+    first_collection_time = dict(utils.mg_last_collection_time)
+    calls.clear()
+    utils.collect_ocs_logs("test", ocp=True, ocs=True, incremental=True)
+    # The failed gatherer collects all the logs again
+    assert calls[("c1", "ocs")] is None
+    assert calls[("c1", "ocp")] == first_collection_time[("c1", "ocp")]
+    assert calls[("c2", "ocs")] == first_collection_time[("c2", "ocs")]
+
+
+def test_failed_gatherer_not_recorded(clusters, monkeypatch):
+    calls = {}
+    monkeypatch.setattr(
+        utils,
+        "_collect_ocs_logs",
+        fake_collect({("c2", "ocp"): ValueError("failed")}, calls),
+    )
+    with pytest.raises(ValueError):
+        utils.collect_ocs_logs("test", ocp=True, ocs=False, incremental=True)
+    assert set(utils.mg_last_collection_time) == {("c1", "ocp")}
@@ -0,0 +1,108 @@
+# -*- coding: utf8 -*-
+
+import logging
+import os
+import tarfile
+import time
+
+import pytest
+
+from ocs_ci.ocs.must_gather.must_gather_index import MustGatherIndex
+
+log = logging.getLogger(__name__)
+
+NAMESPACES = 50
+FILES_PER_NAMESPACE = 100
+
+
+@pytest.fixture(scope="module")
+def mg_tree(tmp_path_factory):
+    """
+    Synthetic must-gather tree with pod logs, an empty file and a tarball.
+    """
+    root = tmp_path_factory.mktemp("mg") / "ocs_must_gather"
+    for ns in range(NAMESPACES):
+        pods_dir = root / "namespaces" / f"ns-{ns}" / "pods"
+        pods_dir.mkdir(parents=True)
+        for num in range(FILES_PER_NAMESPACE):
+            (pods_dir / f"pod-{ns}-{num}.log").write_text("log line\n")
+    (root / "empty.log").write_text("")
+    ceph_dir = root / "ceph"
+    ceph_dir.mkdir()
+    (ceph_dir / "ceph_status").write_text("HEALTH_OK\n")
+    member = root / "member.yaml"
+    member.write_text("kind: Pod\n")
+    with tarfile.open(root / "ceph" / "noobaa_diagnostics.tar.gz", "w:gz") as tar:
+        tar.add(member, arcname="noobaa_diagnostics/logs/member.yaml")
+    member.unlink()
+    return str(root)
+
+
+def test_must_gather_index(mg_tree):
+    """
+    Files, directories and tarball members are indexed with their sizes.
+    """
+    index = MustGatherIndex(mg_tree)
+    assert index.find("ceph_status") == os.path.join(mg_tree, "ceph", "ceph_status")
+    assert index.find("pods") in index.dirs
+    assert len(index.basenames["pods"]) == NAMESPACES
+    assert index.find("member.yaml") == "noobaa_diagnostics/logs/member.yaml"
+    assert "noobaa_diagnostics/logs" in index.paths
+    assert index.find("missing") is None
+    sizes = dict(index.files_on_disk())
+    assert len(sizes) == NAMESPACES * FILES_PER_NAMESPACE + 3
+    assert sizes[os.path.join(mg_tree, "empty.log")] == 0
+    assert "noobaa_diagnostics/logs/member.yaml" not in sizes
+
+
+def test_must_gather_index_update(mg_tree, tmp_path):
+    """
+    Update adds only new paths, e.g. of an extracted archive.
+    """
+    index = MustGatherIndex(mg_tree)
+    paths_count = len(index.paths)
+    index.update(mg_tree)
+    assert len(index.paths) == paths_count
+    extracted = os.path.join(mg_tree, "ceph", "extracted.log")
+    with open(extracted, "w") as fd:
+        fd.write("log\n")
+    try:
+        index.update(os.path.join(mg_tree, "ceph"))
+        assert index.find("extracted.log") == extracted
+        assert len(index.paths) == paths_count + 1
+    finally:
+        os.remove(extracted)
+
+
+def test_must_gather_index_benchmark(mg_tree):
+    """
+    Benchmark lookups of expected files with one walk of the tree against a
+    walk of the tree per lookup.
+    """
+    expected_files = [
+        f"pod-{ns}-{num}.log" for ns in range(NAMESPACES) for num in range(0, 100, 25)
+    ] + ["ceph_status", "missing"]
+
+    start = time.perf_counter()
+    walk_results = {}
+    for file in expected_files:
+        for root_dir, _, files in os.walk(mg_tree):
+            if file in files:
+                walk_results[file] = os.path.join(root_dir, file)
+                break
+    walk_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = MustGatherIndex(mg_tree)
+    index_results = {
+        file: index.find(file) for file in expected_files if index.find(file)
+    }
+    index_duration = time.perf_counter() - start
+
+    log.info(
+        f"{len(expected_files)} lookups in {len(index.paths)} paths: "
+        f"walk per lookup {walk_duration:.3f}s, single walk index "
+        f"{index_duration:.3f}s"
+    )
+    assert index_results == walk_results
+    assert index_duration < walk_duration
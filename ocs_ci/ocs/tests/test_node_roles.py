@@ -0,0 +1,91 @@
+# -*- coding: utf8 -*-
+
+import os
+
+import pytest
+import yaml
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants, node
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+@pytest.fixture(scope="module")
+def recorded_nodes():
+    """
+    Node list recorded from clusters with the expected ROLES column.
+    """
+    with open(os.path.join(HERE, "nodes.yaml")) as fd:
+        return yaml.safe_load(fd)
+
+
+@pytest.fixture
+def fake_node_api(recorded_nodes, monkeypatch):
+    """
+    Serve the recorded node list instead of executing oc, counting the calls.
+    """
+    calls = []
+
+    class FakeOCP(object):
+        def __init__(self, kind=None, **kwargs):
+            self.kind = kind
+
+        def get(self, **kwargs):
+            calls.append((self.kind, kwargs))
+            return recorded_nodes
+
+    monkeypatch.setattr(node, "OCP", FakeOCP)
+    monkeypatch.setitem(config.ENV_DATA, "platform", constants.VSPHERE_PLATFORM)
+    monkeypatch.setitem(config.ENV_DATA, "cluster_type", "")
+    return calls
+
+
+def test_node_roles_column(recorded_nodes):
+    """
+    Roles computed from the labels match the ROLES column of oc get nodes.
+    """
+    for node_dict in recorded_nodes["items"]:
+        expected = node_dict["metadata"]["annotations"]["ocs-ci/roles"]
+        assert node.get_node_roles_column(node_dict) == expected
+
+
+@pytest.mark.parametrize(
+    "node_type, platform, cluster_type, expected",
+    [
+        (
+            constants.WORKER_MACHINE,
+            constants.VSPHERE_PLATFORM,
+            "",
+            ["compute-0", "compute-1", "control-plane-1", "legacy-node"],
+        ),
+        (
+            constants.MASTER_MACHINE,
+            constants.VSPHERE_PLATFORM,
+            "",
+            ["control-plane-0", "control-plane-1"],
+        ),
+        (
+            constants.WORKER_MACHINE,
+            constants.ROSA_PLATFORM,
+            "",
+            ["compute-0", "control-plane-1", "legacy-node"],
+        ),
+        (
+            constants.WORKER_MACHINE,
+            constants.HCI_BAREMETAL,
+            constants.HCI_PROVIDER,
+            ["compute-0", "compute-1", "legacy-node"],
+        ),
+    ],
+)
+def test_get_nodes(fake_node_api, node_type, platform, cluster_type, expected):
+    """
+    Nodes are filtered by their roles with a single node list call.
+    """
+    config.ENV_DATA["platform"] = platform
+    config.ENV_DATA["cluster_type"] = cluster_type
+    nodes = node.get_nodes(node_type=node_type)
+    assert [n.name for n in nodes] == expected
+    assert len(fake_node_api) == 1
+    assert node.get_nodes(node_type=node_type, num_of_nodes=1)[0].name == expected[0]
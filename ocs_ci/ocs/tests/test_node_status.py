@@ -0,0 +1,180 @@
+# -*- coding: utf8 -*-
+
+import os
+import stat
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from ocs_ci.ocs import constants, exceptions, node
+
+FAKE_OC = """#!/bin/sh
+# Fake oc node watch, reports worker-1 Ready after a short delay
+printf 'worker-0\\t\\tTrue\\nworker-1\\t\\tFalse\\n'
+sleep 0.3
+printf 'worker-1\\t\\tTrue\\n'
+sleep 30
+"""
+
+
+def node_dict(name, ready, unschedulable=None):
+    """
+    Node resource with the Ready condition status and spec.unschedulable.
+    """
+    conditions = [{"type": "MemoryPressure", "status": "False"}]
+    if ready is not None:
+        conditions.append({"type": "Ready", "status": ready})
+    spec = {} if unschedulable is None else {"unschedulable": unschedulable}
+    return {
+        "metadata": {"name": name},
+        "spec": spec,
+        "status": {"conditions": conditions},
+    }
+
+
+@pytest.fixture
+def node_lists(monkeypatch):
+    """
+    Serve the node lists appended to the returned list one per oc get call,
+    the last one is repeated.
+    """
+    lists = []
+    calls = []
+
+    class FakeOCP(object):
+        def __init__(self, kind=None, **kwargs):
+            pass
+
+        def get(self, **kwargs):
+            calls.append(kwargs)
+            return {"items": lists[min(len(calls), len(lists)) - 1]}
+
+    monkeypatch.setattr(node, "OCP", FakeOCP)
+    return lists, calls
+
+
+@pytest.mark.parametrize(
+    "ready, unschedulable, expected",
+    [
+        ("True", None, constants.NODE_READY),
+        ("False", None, constants.NODE_NOT_READY),
+        ("Unknown", False, constants.NODE_NOT_READY),
+        ("True", True, constants.NODE_READY_SCHEDULING_DISABLED),
+        ("False", True, constants.NODE_NOT_READY_SCHEDULING_DISABLED),
+        (None, None, "Unknown"),
+    ],
+)
+def test_node_status_from_dict(ready, unschedulable, expected):
+    """
+    Status matches the STATUS column of oc get node.
+    """
+    assert node.get_node_status_from_dict(node_dict("n", ready, unschedulable)) == (
+        expected
+    )
+
+
+def test_get_node_states():
+    """
+    Statuses and boot IDs are taken from the node resources.
+    """
+    rebooted = node_dict("worker-1", "False", True)
+    rebooted["status"]["nodeInfo"] = {"bootID": "b1"}
+    assert node.get_node_states([node_dict("worker-0", "True"), rebooted]) == (
+        {
+            "worker-0": constants.NODE_READY,
+            "worker-1": constants.NODE_NOT_READY_SCHEDULING_DISABLED,
+        },
+        {"worker-0": None, "worker-1": "b1"},
+    )
+
+
+def test_wait_for_nodes_status(node_lists):
+    """
+    Statuses of all the nodes are evaluated from one node list per attempt.
+    """
+    lists, calls = node_lists
+    lists.append([node_dict("worker-0", "True"), node_dict("worker-1", "False")])
+    lists.append([node_dict("worker-0", "False"), node_dict("worker-1", "True")])
+    node.wait_for_nodes_status(["worker-0", "worker-1"], timeout=10, sleep=0.01)
+    assert len(calls) == 2
+
+
+def test_wait_for_nodes_status_timeout(node_lists, monkeypatch):
+    """
+    Timeout is raised with the nodes which haven't reached the status.
+    """
+    lists, _ = node_lists
+    lists.append([node_dict("worker-0", "False")])
+    monkeypatch.setattr(node, "get_node_objs", lambda names: [])
+    with pytest.raises(exceptions.ResourceWrongStatusException):
+        node.wait_for_nodes_status(["worker-0"], timeout=0.1, sleep=0.01)
+
+
+def test_wait_for_nodes_status_watch(node_lists, tmp_path, monkeypatch):
+    """
+    Status change from the node watch is evaluated immediately.
+    """
+    oc = tmp_path / "oc"
+    oc.write_text(FAKE_OC)
+    oc.chmod(oc.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    lists, calls = node_lists
+    lists.append([node_dict("worker-0", "True"), node_dict("worker-1", "False")])
+    start = time.time()
+    node.wait_for_nodes_status(
+        ["worker-0", "worker-1"], timeout=60, sleep=30, watch=True
+    )
+    assert time.time() - start < 10
+    assert len(calls) == 1
+
+
+def test_node_status_watch_config_context(node_lists, tmp_path, monkeypatch):
+    """
+    The watch runs in the config context of the thread which created it.
+    """
+    oc = tmp_path / "oc"
+    oc.write_text("#!/bin/sh\n")
+    oc.chmod(oc.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    lists, _ = node_lists
+    lists.append([node_dict("worker-0", "True")])
+    contexts = []
+
+    @contextmanager
+    def config_context(config_index):
+        contexts.append((config_index, threading.current_thread()))
+        yield
+
+    monkeypatch.setattr(node, "get_config_index", lambda: 3)
+    monkeypatch.setattr(node, "config_context", config_context)
+    node_watch = node.NodeStatusWatch()
+    node_watch.start()
+    node_watch.join(timeout=10)
+    assert contexts == [(3, node_watch)]
+    assert node_watch.error == "Watch of node status ended"
+
+
+def test_node_status_watch_verbose_stderr(node_lists, tmp_path, monkeypatch):
+    """
+    Lots of warnings on stderr don't block the watch.
+    """
+    oc = tmp_path / "oc"
+    oc.write_text(
+        "#!/bin/sh\n"
+        "head -c 200000 /dev/zero | tr '\\0' 'w' >&2\n"
+        "printf 'worker-0\\t\\tFalse\\n'\n"
+        "echo 'error: watch closed' >&2\n"
+        "exit 1\n"
+    )
+    oc.chmod(oc.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    lists, _ = node_lists
+    lists.append([node_dict("worker-0", "True")])
+    node_watch = node.NodeStatusWatch()
+    node_watch.start()
+    node_watch.join(timeout=10)
+    assert not node_watch.is_alive()
+    assert node_watch.statuses == {"worker-0": constants.NODE_NOT_READY}
+    assert node_watch.error.endswith("error: watch closed")
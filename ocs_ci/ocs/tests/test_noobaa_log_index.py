@@ -0,0 +1,89 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs import scale_noobaa_lib
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.ocs.scale_noobaa_lib import NoobaaOperatorLogIndex
+
+
+def obc_log(obc_name, second, namespace="ns"):
+    """
+    noobaa-operator log lines of creation and deletion of the OBC.
+    """
+    return [
+        f'I0120 10:00:{second:02d}.000000       1 provisioner.go:100] "msg"="provisioning" '
+        f'"bucket"="{obc_name}-6c1f0c2e-4b2a"',
+        f'I0120 10:00:{second + 2:02d}.500000       1 controller.go:200] "msg"="updating status" '
+        f'"obc"="{namespace}/{obc_name}" "old status"="Pending" "new status"="Bound"',
+        f'I0120 10:01:{second:02d}.000000       1 controller.go:300] "msg"="removing ObjectBucket" '
+        f'"name"="obc-{namespace}-{obc_name}"',
+        f'I0120 10:01:{second + 1:02d}.000000       1 controller.go:310] "msg"="ObjectBucket deleted" '
+        f'"name"="obc-{namespace}-{obc_name}"',
+    ]
+
+
+@pytest.fixture
+def fake_logs(monkeypatch):
+    """
+    Serve the noobaa-operator logs appended to the returned list, one per
+    fetch, and record the fetch arguments.
+    """
+    logs = []
+    fetches = []
+
+    def get_pod_logs(pod_name, namespace=None, since_time=None):
+        fetches.append(since_time)
+        return "\n".join(logs[min(len(fetches), len(logs)) - 1])
+
+    monkeypatch.setattr(scale_noobaa_lib.pod, "get_pod_logs", get_pod_logs)
+    monkeypatch.setattr(
+        scale_noobaa_lib,
+        "get_pod_name_by_pattern",
+        lambda pattern, namespace: ["noobaa-operator-abc"],
+    )
+    monkeypatch.setattr(scale_noobaa_lib.time, "sleep", lambda seconds: None)
+    return logs, fetches
+
+
+def test_log_index_durations():
+    """
+    Creation and deletion times are found by the OBC name, which is not
+    confused with names it is a prefix of.
+    """
+    index = NoobaaOperatorLogIndex(namespace="ns")
+    index.add_lines(obc_log("obc-1", 10) + obc_log("obc-10", 20) + ["garbage"])
+    durations, no_data = index.get_durations(
+        ["obc-1", "obc-10", "obc-2"], "provisioning", "bound"
+    )
+    assert durations == {"obc-1": 2.5, "obc-10": 2.5}
+    assert no_data == ["obc-2"]
+    durations, _ = index.get_durations(["obc-1"], "removing", "deleted")
+    assert durations == {"obc-1": 1.0}
+
+
+def test_log_index_measure_incremental(fake_logs):
+    """
+    Log is fetched again with since-time until all the events are in it.
+    """
+    logs, fetches = fake_logs
+    logs.append(obc_log("obc-a", 10)[:1])
+    logs.append(obc_log("obc-a", 10)[1:])
+    index = NoobaaOperatorLogIndex(namespace="ns")
+    assert index.measure(["obc-a"], "provisioning", "bound", timeout=0) == {
+        "obc-a": 2.5
+    }
+    assert fetches[0] is None
+    assert fetches[1].endswith("Z")
+
+
+def test_log_index_measure_no_data(fake_logs):
+    """
+    Missing events are raised after the number of tries.
+    """
+    logs, fetches = fake_logs
+    logs.append(obc_log("obc-a", 10))
+    index = NoobaaOperatorLogIndex(namespace="ns")
+    with pytest.raises(UnexpectedBehaviour, match="obc-b"):
+        index.measure(["obc-a", "obc-b"], "removing", "deleted", timeout=0, tries=2)
+    assert len(fetches) == 3
@@ -0,0 +1,103 @@
+# -*- coding: utf8 -*-
+
+import hashlib
+import os
+import stat
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutException
+from ocs_ci.ocs.pod_exec import copy_file_from_pod, stream_from_pod
+
+FAKE_OC = """#!/bin/sh
+# Fake oc which runs the command after "--" locally
+while [ "$1" != "--" ]; do shift; done
+shift
+exec "$@"
+"""
+
+
+@pytest.fixture
+def fake_oc(tmp_path, monkeypatch):
+    """
+    Put fake oc binary, which runs the exec command locally, to PATH.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    oc = bin_dir / "oc"
+    oc.write_text(FAKE_OC)
+    oc.chmod(oc.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+@pytest.fixture
+def binary_file(tmp_path):
+    """
+    Binary file of 3 MB with all the byte values.
+    """
+    src = tmp_path / "src.bin"
+    src.write_bytes(bytes(range(256)) * 4096 * 3)
+    return src
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_copy_file_from_pod(fake_oc, binary_file, tmp_path, compress):
+    """
+    Binary file is copied byte by byte and the checksum is verified.
+    """
+    target = tmp_path / "target.bin"
+    stats = copy_file_from_pod(
+        "pod", "ns", str(binary_file), str(target), compress=compress
+    )
+    assert target.read_bytes() == binary_file.read_bytes()
+    assert stats["bytes"] == binary_file.stat().st_size
+    assert stats["sha256"] == hashlib.sha256(binary_file.read_bytes()).hexdigest()
+    if compress:
+        assert stats["transferred_bytes"] < stats["bytes"]
+    assert not os.path.exists(f"{target}.part")
+
+
+def test_copy_missing_file_from_pod(fake_oc, tmp_path):
+    """
+    Failure of the command is raised and no partial file is left.
+    """
+    target = tmp_path / "target.bin"
+    with pytest.raises(CommandFailed, match="No such file"):
+        copy_file_from_pod("pod", "ns", str(tmp_path / "missing"), str(target))
+    assert not target.exists()
+    assert not os.path.exists(f"{target}.part")
+
+
+def test_stream_from_pod_timeout(fake_oc, tmp_path):
+    """
+    Command running longer than the timeout is killed.
+    """
+    with open(tmp_path / "out", "wb") as output:
+        with pytest.raises(TimeoutException):
+            stream_from_pod("pod", "ns", "sleep 10", output, timeout=0.5)
+
+
+def test_copy_missing_file_from_pod_compressed(fake_oc, tmp_path):
+    """
+    Failure of the command is raised also when the output is compressed,
+    although gzip succeeds.
+    """
+    target = tmp_path / "target.bin"
+    with pytest.raises(CommandFailed, match="No such file"):
+        copy_file_from_pod(
+            "pod", "ns", str(tmp_path / "missing"), str(target), compress=True
+        )
+    assert not target.exists()
+    assert not os.path.exists(f"{target}.part")
+
+
+def test_stream_from_pod_incomplete_compressed_output(fake_oc, tmp_path):
+    """
+    Compressed stream which is cut, e.g. when gzip fails, is detected.
+    """
+    gzip = tmp_path / "bin" / "gzip"
+    gzip.write_text("#!/bin/sh\nprintf '\\037\\213\\010'\n")
+    gzip.chmod(gzip.stat().st_mode | stat.S_IEXEC)
+    with open(tmp_path / "out", "wb") as output:
+        with pytest.raises(CommandFailed, match="incomplete"):
+            stream_from_pod("pod", "ns", "echo data", output, compress=True)
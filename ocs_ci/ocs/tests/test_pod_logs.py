@@ -0,0 +1,207 @@
+# -*- coding: utf8 -*-
+
+import os
+import stat
+import time
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.pod_exec import (
+    grep_lines,
+    match_events,
+    match_lines,
+    search_pod_log_events,
+    search_pod_logs,
+    stream_pod_logs,
+)
+from ocs_ci.ocs.resources.pod import get_pod_logs
+from ocs_ci.utility.tracing import tracer
+
+FAKE_OC = """#!/bin/sh
+# Fake oc printing the log of the pod from $FAKE_LOG_DIR/<pod>.log and
+# following it forever if --follow is set
+echo "$@" >> "$FAKE_LOG_DIR/args"
+for arg; do
+    case "$arg" in
+        logs) after_logs=1 ;;
+        --follow) follow=1 ;;
+        -*) ;;
+        *) [ -n "$after_logs" ] && [ -z "$pod" ] && pod="$arg" ;;
+    esac
+done
+cat "$FAKE_LOG_DIR/$pod.log" || exit 1
+[ -n "$follow" ] && exec sleep 60
+exit 0
+"""
+
+LOG = [f"line {i} pvc-{i} started" for i in range(1000)] + [
+    "ERROR something failed",
+    "line after error",
+]
+
+
+@pytest.fixture
+def fake_logs(tmp_path, monkeypatch):
+    """
+    Put fake oc, which prints logs from the returned directory, to PATH.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    oc = bin_dir / "oc"
+    oc.write_text(FAKE_OC)
+    oc.chmod(oc.stat().st_mode | stat.S_IEXEC)
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "pod-a.log").write_text("\n".join(LOG) + "\n")
+    (log_dir / "pod-b.log").write_text("pvc-x started\npvc-5 started again\n")
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_LOG_DIR", str(log_dir))
+    return log_dir
+
+
+def test_stream_pod_logs(fake_logs):
+    lines = list(stream_pod_logs("pod-a", "ns", since_time="2024-01-20T10:00:00Z"))
+    assert lines == LOG
+    assert "--since-time=2024-01-20T10:00:00Z" in (fake_logs / "args").read_text()
+    with pytest.raises(CommandFailed):
+        list(stream_pod_logs("missing", "ns"))
+
+
+def test_search_stops_early(fake_logs):
+    """
+    Followed log is not read to the end once all the patterns match.
+    """
+    start = time.time()
+    matches = search_pod_logs(
+        ["pod-a"],
+        "ns",
+        {"five": r"pvc-5\b", "error": "ERROR"},
+        max_matches=1,
+        follow=True,
+        timeout=30,
+    )
+    assert time.time() - start < 10
+    assert matches == {"five": ["line 5 pvc-5 started"], "error": [LOG[1000]]}
+
+
+def test_search_multiple_pods(fake_logs):
+    matches = search_pod_logs(
+        ["pod-a", "pod-b"], "ns", {"x": "pvc-x", "5": r"pvc-5\b"}, max_matches=1
+    )
+    assert matches == {"x": ["pvc-x started"], "5": ["line 5 pvc-5 started"]}
+
+
+def test_match_lines():
+    lines = ["a1", "b1", "ab", "c"]
+    assert list(match_lines(lines, {"a": "a", "b": "B"}, ignore_case=True)) == [
+        ("a", "a1"),
+        ("b", "b1"),
+        ("a", "ab"),
+        ("b", "ab"),
+    ]
+
+
+def test_match_lines_max_matches():
+    lines = ["a1", "b1", "ab", "a2", "b2", "c"]
+    patterns = {"a": "a", "b": "b"}
+    assert list(match_lines(lines, patterns, max_matches=2)) == [
+        ("a", "a1"),
+        ("b", "b1"),
+        ("a", "ab"),
+        ("b", "ab"),
+    ]
+    assert list(match_lines(lines, {"a": "a", "c": "c"}, max_matches=1)) == [
+        ("a", "a1"),
+        ("c", "c"),
+    ]
+
+
+def test_match_events():
+    """
+    The name is taken from the line and only the first line of every
+    requested name and event is returned.
+    """
+    lines = [
+        'provision "ns/pvc-10" class "sc": started',
+        'provision "ns/pvc-1" class "sc": started',
+        'provision "ns/pvc-1" class "sc": started',
+        'provision "ns/pvc-1" class "sc": succeeded',
+        'provision "ns/pvc-2" class "sc": succeeded',
+        "not read",
+    ]
+    events = {
+        "start": r'provision "(?:[^"/]*/)?(?P<name>[^"]+)".*started',
+        "end": r'provision "(?:[^"/]*/)?(?P<name>[^"]+)".*succeeded',
+    }
+    keys = [("pvc-1", "start"), ("pvc-1", "end"), ("pvc-2", "end")]
+    iterated = []
+
+    def get_lines():
+        for line in lines:
+            iterated.append(line)
+            yield line
+
+    assert list(match_events(get_lines(), events, keys)) == [
+        (("pvc-1", "start"), lines[1]),
+        (("pvc-1", "end"), lines[3]),
+        (("pvc-2", "end"), lines[4]),
+    ]
+    assert "not read" not in iterated
+
+
+def test_search_pod_log_events(fake_logs):
+    matches = search_pod_log_events(
+        ["pod-a", "pod-b"],
+        "ns",
+        {"started": r"(?P<name>pvc-\w+) started"},
+        ["pvc-5", "pvc-x", "pvc-y"],
+    )
+    assert matches == {
+        ("pvc-5", "started"): "line 5 pvc-5 started",
+        ("pvc-x", "started"): "pvc-x started",
+        ("pvc-y", "started"): None,
+    }
+
+
+def test_grep_lines():
+    lines = [str(i) for i in range(10)]
+    assert list(grep_lines(lines, "^[27]$", context=1)) == [
+        "1",
+        "2",
+        "3",
+        "--",
+        "6",
+        "7",
+        "8",
+    ]
+    assert list(grep_lines(lines, "[0-9]", max_count=2)) == ["0", "1"]
+
+
+def test_get_pod_logs_grep(fake_logs):
+    assert (
+        get_pod_logs("pod-a", namespace="ns", grep="error", context=1)
+        == "line 999 pvc-999 started\nERROR something failed\nline after error\n"
+    )
+    assert get_pod_logs("pod-a", namespace="ns", grep="missing") == ""
+    with pytest.raises(CommandFailed):
+        get_pod_logs("pod-a", namespace="ns", grep="missing", return_empty_string=False)
+
+
+def test_stream_pod_logs_traced(fake_logs, monkeypatch):
+    """
+    Streamed log is recorded by the tracer, also when the search stops early.
+    """
+    monkeypatch.setitem(config.RUN, "trace_oc_calls", True)
+    tracer.reset()
+    try:
+        assert len(list(stream_pod_logs("pod-b", "ns"))) == 2
+        search_pod_logs(["pod-a"], "ns", {"first": "line 0 "}, max_matches=1)
+        calls = list(tracer.calls)
+    finally:
+        tracer.reset()
+    assert [call["verb"] for call in calls] == ["logs", "logs"]
+    assert calls[0]["returncode"] == 0
+    assert calls[0]["output_bytes"] == len("pvc-x started\npvc-5 started again\n")
+    assert calls[0]["call_site"].startswith("ocs_ci/ocs/tests/test_pod_logs.py")
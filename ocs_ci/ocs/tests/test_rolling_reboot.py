@@ -0,0 +1,262 @@
+# -*- coding: utf8 -*-
+
+import time
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants, platform_nodes, rolling_reboot
+from ocs_ci.ocs.resources.ocs import OCS
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.rolling_reboot import RollingRebootOrchestrator, get_reboot_batches
+
+# Not replaced by the fake cluster
+get_node_states = RollingRebootOrchestrator.get_node_states
+
+
+def node_dict(name, role=constants.WORKER_MACHINE):
+    """
+    Node resource with the role label.
+    """
+    return {
+        "kind": "Node",
+        "metadata": {
+            "name": name,
+            "labels": {f"{constants.NODE_ROLE_LABEL_PREFIX}{role}": ""},
+        },
+    }
+
+
+NODES = [
+    node_dict("master-0", constants.MASTER_MACHINE),
+    node_dict("master-1", constants.MASTER_MACHINE),
+    node_dict("worker-0"),
+    node_dict("worker-1"),
+    node_dict("worker-2"),
+    node_dict("worker-3"),
+    node_dict("infra-0", constants.INFRA_MACHINE),
+]
+FAILURE_DOMAINS = {
+    "worker-0": "rack0",
+    "worker-1": "rack1",
+    "worker-2": "rack0",
+    "worker-3": "rack1",
+}
+
+
+class FakeCluster(object):
+    """
+    Nodes which go NotReady shortly after the restart and come back Ready
+    with a new boot ID.
+    """
+
+    def __init__(self, down_time=0.05, up_time=0.1):
+        self.down_time = down_time
+        self.up_time = up_time
+        self.restarts = {}
+        self.batches = []
+        # Number of the following node state calls which fail
+        self.failures = 0
+
+    def restart_nodes(self, nodes, wait=True):
+        self.batches.append(sorted(node.name for node in nodes))
+        for node in nodes:
+            self.restarts[node.name] = time.time()
+
+    def get_node_states(self):
+        if self.failures:
+            self.failures -= 1
+            raise CommandFailed("Unable to connect to the server")
+        now = time.time()
+        statuses, boot_ids = {}, {}
+        for node in NODES:
+            name = node["metadata"]["name"]
+            restart = self.restarts.get(name)
+            boot_ids[name] = "boot-0"
+            statuses[name] = constants.NODE_READY
+            if restart and now - restart > self.up_time:
+                boot_ids[name] = "boot-1"
+            elif restart and now - restart > self.down_time:
+                statuses[name] = constants.NODE_NOT_READY
+        return statuses, boot_ids
+
+
+@pytest.fixture
+def fake_cluster(monkeypatch):
+    """
+    Orchestrator dependencies replaced by the fake cluster.
+    """
+    cluster = FakeCluster()
+
+    class FakeFactory(object):
+        def get_nodes_platform(self):
+            return cluster
+
+    class FakeWatch(object):
+        watching = False
+
+        def __init__(self, on_change=None):
+            pass
+
+        def start(self):
+            pass
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(platform_nodes, "PlatformNodesFactory", FakeFactory)
+    monkeypatch.setattr(rolling_reboot, "NodeStatusWatch", FakeWatch)
+    monkeypatch.setattr(rolling_reboot, "get_blocking_pdbs", lambda ns: [])
+    for func in ("unschedule_nodes", "schedule_nodes", "drain_nodes"):
+        monkeypatch.setattr(rolling_reboot, func, lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        RollingRebootOrchestrator,
+        "get_node_states",
+        lambda self: cluster.get_node_states(),
+    )
+    monkeypatch.setattr(
+        RollingRebootOrchestrator, "get_failure_domains", lambda self: FAILURE_DOMAINS
+    )
+    monkeypatch.setitem(config.ENV_DATA, "cluster_namespace", "openshift-storage")
+    return cluster
+
+
+def test_reboot_batches():
+    """
+    Masters and nodes without failure domain are rebooted alone, the other
+    nodes together with the nodes of the same failure domain.
+    """
+    assert get_reboot_batches(NODES, FAILURE_DOMAINS) == [
+        ["master-0"],
+        ["master-1"],
+        ["infra-0"],
+        ["worker-0", "worker-2"],
+        ["worker-1", "worker-3"],
+    ]
+    assert get_reboot_batches(NODES, FAILURE_DOMAINS, max_parallel=1)[3:] == [
+        ["worker-0"],
+        ["worker-2"],
+        ["worker-1"],
+        ["worker-3"],
+    ]
+
+
+def test_rolling_reboot(fake_cluster):
+    """
+    All the nodes are rebooted in batches and the phases are timed.
+    """
+    orchestrator = RollingRebootOrchestrator(
+        [OCS(**node) for node in NODES], sleep=0.01
+    )
+    start = time.time()
+    timings = orchestrator.run()
+    assert fake_cluster.batches[-2:] == [
+        ["worker-0", "worker-2"],
+        ["worker-1", "worker-3"],
+    ]
+    assert len(fake_cluster.batches) == 5
+    assert time.time() - start < 5
+    for timing in timings.values():
+        assert fake_cluster.down_time <= timing["shutdown"] <= timing["boot"]
+        assert timing["boot"] <= timing["total"]
+
+
+def test_rolling_reboot_timeout(fake_cluster):
+    """
+    Nodes which don't come back in time fail the reboot.
+    """
+    fake_cluster.up_time = 60
+    orchestrator = RollingRebootOrchestrator([OCS(**NODES[2])], timeout=0.3, sleep=0.01)
+    with pytest.raises(rolling_reboot.exceptions.ResourceWrongStatusException):
+        orchestrator.run()
+
+
+def test_rolling_reboot_api_unavailable(fake_cluster):
+    """
+    Failures to get the node states while the nodes reboot are tolerated.
+    """
+    orchestrator = RollingRebootOrchestrator([OCS(**NODES[2])], sleep=0.01)
+    restart_nodes = fake_cluster.restart_nodes
+
+    def restart_and_fail(nodes, wait=True):
+        restart_nodes(nodes, wait)
+        fake_cluster.failures = 5
+
+    fake_cluster.restart_nodes = restart_and_fail
+    timings = orchestrator.run()
+    assert fake_cluster.failures == 0
+    assert "boot" in timings["worker-0"]
+
+
+def test_rolling_reboot_uncordon_on_failure(fake_cluster, monkeypatch):
+    """
+    Nodes are uncordoned also when the reboot fails.
+    """
+    uncordoned = []
+    monkeypatch.setattr(
+        rolling_reboot, "schedule_nodes", lambda names: uncordoned.extend(names)
+    )
+    fake_cluster.up_time = 60
+    orchestrator = RollingRebootOrchestrator([OCS(**NODES[2])], timeout=0.1, sleep=0.01)
+    with pytest.raises(rolling_reboot.exceptions.ResourceWrongStatusException):
+        orchestrator.run()
+    assert uncordoned == ["worker-0"]
+    assert "uncordon" in orchestrator.timings["worker-0"]
+
+
+def test_node_watch_restarted(fake_cluster, monkeypatch):
+    """
+    Node watch which ended is restarted instead of listing the nodes.
+    """
+    watches = []
+
+    class FakeWatch(object):
+        def __init__(self, on_change=None):
+            self.statuses = {"worker-0": constants.NODE_READY}
+            self.boot_ids = {"worker-0": f"boot-{len(watches)}"}
+            self.error = None
+            self.alive = False
+            watches.append(self)
+
+        def start(self):
+            self.alive = True
+
+        def is_alive(self):
+            return self.alive
+
+        @property
+        def watching(self):
+            return self.alive
+
+    monkeypatch.setattr(rolling_reboot, "NodeStatusWatch", FakeWatch)
+    orchestrator = RollingRebootOrchestrator([OCS(**NODES[2])])
+    orchestrator._watch = FakeWatch()
+    orchestrator._watch.start()
+    assert get_node_states(orchestrator)[1] == {"worker-0": "boot-0"}
+    # The API server closed the watch
+    watches[0].alive = False
+    assert get_node_states(orchestrator)[1] == {"worker-0": "boot-1"}
+    assert len(watches) == 2
+
+
+def test_gracefully_reboot_nodes_serial(fake_cluster, monkeypatch):
+    """
+    Nodes are rebooted one at a time by default, failure domain batches are
+    opt-in.
+    """
+    from ocs_ci.ocs import node
+
+    monkeypatch.setattr(node, "get_node_objs", lambda: [OCS(**n) for n in NODES])
+    created = []
+
+    class Orchestrator(RollingRebootOrchestrator):
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs)
+            super(Orchestrator, self).__init__(*args, sleep=0.01, **kwargs)
+
+    monkeypatch.setattr(rolling_reboot, "RollingRebootOrchestrator", Orchestrator)
+    node.gracefully_reboot_nodes()
+    assert created[0]["max_parallel"] == 1
+    assert created[0]["pdb_timeout"] == 300
+    assert all(len(batch) == 1 for batch in fake_cluster.batches)
+    assert len(fake_cluster.batches) == len(NODES)
@@ -0,0 +1,191 @@
+# -*- coding: utf8 -*-
+
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+
+from ocs_ci.ocs import utilization
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.utilization import (
+    UtilizationMonitor,
+    UtilizationSampler,
+    parse_quantity,
+)
+
+NODES = {
+    "items": [
+        {
+            "metadata": {"name": f"worker-{num}"},
+            "status": {"allocatable": {"cpu": "3500m", "memory": "16Gi"}},
+        }
+        for num in range(2)
+    ]
+}
+NODE_METRICS = {
+    "items": [
+        {"metadata": {"name": "worker-0"}, "usage": {"cpu": "875m", "memory": "8Gi"}},
+        {"metadata": {"name": "worker-1"}, "usage": {"cpu": "350000000n"}},
+    ]
+}
+PODS = {
+    "items": [
+        {
+            "metadata": {"name": "app", "namespace": "ns"},
+            "spec": {
+                "nodeName": "worker-0",
+                "containers": [
+                    {"resources": {"requests": {"cpu": "250m", "memory": "1Gi"}}},
+                    {"resources": {"requests": {"cpu": "250m", "memory": "1Gi"}}},
+                ],
+                "initContainers": [
+                    {"resources": {"requests": {"cpu": "1", "memory": "512Mi"}}}
+                ],
+            },
+        },
+        {
+            "metadata": {"name": "besteffort", "namespace": "ns"},
+            "spec": {"nodeName": "worker-1", "containers": [{"resources": {}}]},
+        },
+        {
+            "metadata": {"name": "pending", "namespace": "ns"},
+            "spec": {"containers": []},
+        },
+    ]
+}
+POD_METRICS = {
+    "items": [
+        {
+            "metadata": {"name": "app", "namespace": "ns"},
+            "containers": [
+                {"usage": {"cpu": "100m", "memory": "100Mi"}},
+                {"usage": {"cpu": "50m", "memory": "28Mi"}},
+            ],
+        }
+    ]
+}
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """
+    Serve canned API responses instead of executing oc, counting the calls.
+    """
+    responses = {
+        "get nodes -o json": NODES,
+        f"get --raw {utilization.METRICS_API_PATH}/nodes": NODE_METRICS,
+        f"get --raw {utilization.METRICS_API_PATH}/pods": POD_METRICS,
+    }
+    calls = []
+
+    def get_json(self, command):
+        calls.append(command)
+        if command.startswith("get pods -A"):
+            return PODS
+        return responses[command]
+
+    monkeypatch.setattr(utilization, "OCP", lambda: None)
+    monkeypatch.setattr(UtilizationSampler, "_get_json", get_json)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "quantity, value",
+    [("500m", 0.5), ("2", 2), ("1Ki", 1024), ("1.5Gi", 1.5 * 2**30), ("1e3", 1000)],
+)
+def test_parse_quantity(quantity, value):
+    assert parse_quantity(quantity) == value
+
+
+def test_parse_invalid_quantity():
+    with pytest.raises(ValueError):
+        parse_quantity("10Xi")
+
+
+def test_utilization_sample(fake_api):
+    """
+    Usage and requests of all the nodes are sampled with one call per list.
+    """
+    sample = UtilizationSampler(include_pods=True).sample()
+    assert len(fake_api) == 4
+    assert sample["worker-0"]["cpu_percent"] == 25
+    assert sample["worker-0"]["memory_percent"] == 50
+    # Init container requests more CPU than the sum of the containers
+    assert sample["worker-0"]["cpu_requests"] == 1
+    assert sample["worker-0"]["memory_requests"] == 2 * 2**30
+    assert sample["worker-0"]["pods"] == 1
+    assert sample["worker-0"]["pod_usage"]["ns/app"] == {
+        "cpu_usage": pytest.approx(0.15),
+        "memory_usage": 128 * 2**20,
+    }
+    assert sample["worker-1"]["cpu_percent"] == 10
+    assert sample["worker-1"]["memory_usage"] == 0
+    assert sample["worker-1"]["cpu_requests"] == 0
+    assert sample["worker-1"]["pods"] == 1
+
+
+def test_utilization_monitor(fake_api, tmp_path):
+    """
+    Background monitor writes the time series per node.
+    """
+    output = tmp_path / "utilization.csv"
+    with UtilizationMonitor(str(output), interval=0.05, node_names=["worker-1"]):
+        pass
+    df = pd.read_csv(output)
+    assert list(df.columns) == utilization.UTILIZATION_COLUMNS
+    assert set(df["node"]) == {"worker-1"}
+    assert len(df) >= 1
+
+
+def test_utilization_monitor_appends_samples(fake_api, tmp_path):
+    """
+    Samples are appended to the file while the monitor is running.
+    """
+    output = tmp_path / "utilization.csv"
+    with UtilizationMonitor(str(output), interval=0.05) as monitor:
+        end = time.time() + 5
+        while monitor.samples < 2 and time.time() < end:
+            time.sleep(0.05)
+        df = monitor.get_dataframe()
+        assert len(df) >= 4
+        assert set(df["node"]) == {"worker-0", "worker-1"}
+    assert len(pd.read_csv(output)) == 2 * monitor.samples
+
+
+def test_utilization_monitor_config_context(fake_api, tmp_path, monkeypatch):
+    """
+    Samples are taken in the config context of the thread which created the
+    monitor.
+    """
+    contexts = []
+
+    @contextmanager
+    def config_context(config_index):
+        contexts.append((config_index, threading.current_thread()))
+        yield
+
+    monkeypatch.setattr(utilization, "get_config_index", lambda: 5)
+    monkeypatch.setattr(utilization, "config_context", config_context)
+    with UtilizationMonitor(str(tmp_path / "utilization.csv"), interval=1) as monitor:
+        pass
+    assert contexts == [(5, monitor)]
+
+
+def test_utilization_monitor_rejects_parquet(tmp_path):
+    with pytest.raises(ValueError, match="CSV"):
+        UtilizationMonitor(str(tmp_path / "utilization.parquet"))
+
+
+def test_node_utilization_missing_node(fake_api):
+    """
+    Missing node is reported like by oc describe node.
+    """
+    from ocs_ci.ocs import node
+
+    assert node.get_node_resource_utilization_from_oc_describe("worker-0") == {
+        "worker-0": {"cpu": 28, "memory": 12}
+    }
+    with pytest.raises(CommandFailed, match="missing"):
+        node.get_node_resource_utilization_from_oc_describe("missing")
@@ -0,0 +1,90 @@
+# -*- coding: utf8 -*-
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from ocs_ci.ocs import vector_utils
+
+
+def test_generate_vector_array_is_reproducible():
+    """
+    Vectors generated with the same seed are identical and within bounds.
+    """
+    first = vector_utils.generate_vector_array(8, 100, seed=42)
+    second = vector_utils.generate_vector_array(8, 100, seed=42)
+    assert first.shape == (100, 8)
+    assert first.dtype == np.float32
+    assert np.array_equal(first, second)
+    assert first.min() >= 0.0 and first.max() < 2.0
+
+
+def test_generate_test_vectors_with_metadata_format():
+    """
+    Generated vector objects keep the reference format.
+    """
+    vectors = vector_utils.generate_test_vectors_with_metadata(3, 6, seed=1)
+    assert len(vectors) == 6
+    assert vectors[0]["key"] == "vector_key_1"
+    assert len(vectors[0]["data"]["float32"]) == 3
+    assert vectors[5]["metadata"] == {
+        "genre": "scifi",
+        "source_text": "i am source text 6",
+        "price": 60,
+    }
+
+
+def test_put_vectors_in_batches():
+    """
+    Vectors are uploaded in chunks of the batch size.
+    """
+    client = Mock()
+    vectors = vector_utils.iter_vectors_with_metadata(
+        vector_utils.generate_vector_array(4, 1201, seed=3)
+    )
+    stored = vector_utils.put_vectors_in_batches(
+        client, vectors, vectorBucketName="bucket", indexName="index"
+    )
+    assert stored == 1201
+    batch_sizes = [
+        len(call.kwargs["vectors"]) for call in client.put_vectors.call_args_list
+    ]
+    assert batch_sizes == [500, 500, 201]
+    assert client.put_vectors.call_args.kwargs["indexName"] == "index"
+
+
+@pytest.mark.parametrize("distance_metric", ["euclidean", "cosine"])
+def test_compute_exact_nearest_neighbors(distance_metric):
+    """
+    Brute force nearest neighbors match a naive reference implementation.
+    """
+    vectors = vector_utils.generate_vector_array(16, 500, seed=7)
+    query = vector_utils.generate_vector_array(16, 1, seed=8)[0]
+    if distance_metric == "euclidean":
+        reference = [np.linalg.norm(vector - query) for vector in vectors]
+    else:
+        reference = [
+            1 - np.dot(vector, query) / (np.linalg.norm(vector) * np.linalg.norm(query))
+            for vector in vectors
+        ]
+    nearest, distances = vector_utils.compute_exact_nearest_neighbors(
+        vectors, query.tolist(), 10, distance_metric
+    )
+    assert list(nearest) == list(np.argsort(reference)[:10])
+    assert np.allclose(distances, np.sort(reference)[:10], atol=1e-4)
+
+
+def test_calculate_query_recall():
+    """
+    Recall is the fraction of the exact nearest neighbors returned by query.
+    """
+    vectors = vector_utils.generate_vector_array(8, 200, seed=5)
+    query = vectors[10].tolist()
+    nearest, _ = vector_utils.compute_exact_nearest_neighbors(vectors, query, 4)
+    assert nearest[0] == 10
+    keys = [vector_utils.get_vector_key(int(i)) for i in nearest]
+    response = {"vectors": [{"key": key} for key in keys]}
+    assert vector_utils.calculate_query_recall(response, vectors, query, 4) == 1.0
+    response = {"vectors": [{"key": key} for key in keys[:3]] + [{"key": "other"}]}
+    assert vector_utils.calculate_query_recall(response, vectors, query, 4) == 0.75
@@ -0,0 +1,415 @@
+# -*- coding: utf8 -*-
+"""
+Module for sampling of node and pod resource utilization from the metrics API
+(metrics.k8s.io NodeMetrics and PodMetrics) and of resource requests from the
+pod specs. Every sample takes one list call of nodes, node metrics, pods and
+pod metrics for the whole cluster, so the cost doesn't grow with the number
+of the nodes.
+"""
+
+import json
+import logging
+import os
+import re
+from collections import defaultdict
+from datetime import datetime
+from threading import Timer
+
+import pandas as pd
+
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.executor import config_context, get_config_index
+
+log = logging.getLogger(__name__)
+
+METRICS_API_PATH = "/apis/metrics.k8s.io/v1beta1"
+
+# Suffixes of the Kubernetes resource quantities with their multipliers
+QUANTITY_SUFFIXES = {
+    "n": 10**-9,
+    "u": 10**-6,
+    "m": 10**-3,
+    "k": 10**3,
+    "K": 10**3,
+    "M": 10**6,
+    "G": 10**9,
+    "T": 10**12,
+    "P": 10**15,
+    "E": 10**18,
+    "Ki": 2**10,
+    "Mi": 2**20,
+    "Gi": 2**30,
+    "Ti": 2**40,
+    "Pi": 2**50,
+    "Ei": 2**60,
+}
+QUANTITY_PATTERN = re.compile(r"^([+-]?[0-9.]+(?:[eE][+-]?[0-9]+)?)([a-zA-Z]*)$")
+
+# Columns of the time series written by UtilizationMonitor
+UTILIZATION_COLUMNS = [
+    "timestamp",
+    "node",
+    "cpu_usage",
+    "cpu_percent",
+    "memory_usage",
+    "memory_percent",
+    "cpu_requests",
+    "cpu_requests_percent",
+    "memory_requests",
+    "memory_requests_percent",
+    "pods",
+]
+
+
+def parse_quantity(quantity):
+    """
+    Parse Kubernetes resource quantity, e.g. 500m or 31948256Ki
+
+    Args:
+        quantity (str): The quantity
+
+    Returns:
+        float: Value of the quantity in base units (cores or bytes)
+
+    Raises:
+        ValueError: If the quantity has invalid format
+
+    """
+    if quantity is None:
+        return 0.0
+    match = QUANTITY_PATTERN.match(str(quantity).strip())
+    if not match or (match.group(2) and match.group(2) not in QUANTITY_SUFFIXES):
+        raise ValueError(f"Invalid resource quantity: {quantity}")
+    number, suffix = match.groups()
+    return float(number) * QUANTITY_SUFFIXES.get(suffix, 1)
+
+
+def get_pod_requests(pod_data):
+    """
+    Get effective CPU and memory requests of the pod, computed the same way
+    as the scheduler does - the bigger of the sum of the containers requests
+    and the biggest init container request, plus the pod overhead
+
+    Args:
+        pod_data (dict): The pod resource
+
+    Returns:
+        tuple: CPU requests in cores and memory requests in bytes
+
+    """
+    spec = pod_data.get("spec", {})
+    requests = []
+    for resource in ("cpu", "memory"):
+        containers = sum(
+            parse_quantity(
+                (container.get("resources") or {}).get("requests", {}).get(resource)
+            )
+            for container in spec.get("containers") or []
+        )
+        init_containers = max(
+            [
+                parse_quantity(
+                    (container.get("resources") or {}).get("requests", {}).get(resource)
+                )
+                for container in spec.get("initContainers") or []
+            ]
+            or [0.0]
+        )
+        overhead = parse_quantity((spec.get("overhead") or {}).get(resource))
+        requests.append(max(containers, init_containers) + overhead)
+    return tuple(requests)
+
+
+def aggregate_pod_requests(pods, node_names=None):
+    """
+    Aggregate CPU and memory requests of the pods per node
+
+    Args:
+        pods (list): Pod resources
+        node_names (list): Names of the nodes to include, all the nodes if
+            not specified
+
+    Returns:
+        dict: Node name to tuple of CPU requests in cores, memory requests
+            in bytes and number of the pods
+
+    """
+    requests = defaultdict(lambda: [0.0, 0.0, 0])
+    for pod_data in pods:
+        node = pod_data.get("spec", {}).get("nodeName")
+        if not node or (node_names and node not in node_names):
+            continue
+        cpu, memory = get_pod_requests(pod_data)
+        requests[node][0] += cpu
+        requests[node][1] += memory
+        requests[node][2] += 1
+    return {node: tuple(values) for node, values in requests.items()}
+
+
+def get_percent(value, total):
+    """
+    Get the value in percent of the total, rounded down as in oc adm top
+
+    Args:
+        value (float): The value
+        total (float): The total
+
+    Returns:
+        int: The percentage, 0 if the total is unknown
+
+    """
+    return int(value / total * 100) if total else 0
+
+
+class UtilizationSampler(object):
+    """
+    Sampler of node and pod resource utilization and requests
+    """
+
+    def __init__(self, include_pods=False):
+        """
+        Constructor of UtilizationSampler
+
+        Args:
+            include_pods (bool): True to include usage of the individual pods
+                (from PodMetrics) in the samples
+
+        """
+        self.include_pods = include_pods
+        self.ocp = OCP()
+
+    def _get_json(self, command):
+        """
+        Execute oc command and load its JSON output
+
+        Args:
+            command (str): The oc command without the initial 'oc'
+
+        Returns:
+            dict: The loaded output
+
+        """
+        return json.loads(self.ocp.exec_oc_cmd(command, out_yaml_format=False))
+
+    def get_nodes(self):
+        """
+        Get all the nodes
+
+        Returns:
+            list: Node resources
+
+        """
+        return self._get_json("get nodes -o json")["items"]
+
+    def get_node_metrics(self):
+        """
+        Get NodeMetrics of all the nodes
+
+        Returns:
+            list: NodeMetrics resources
+
+        """
+        return self._get_json(f"get --raw {METRICS_API_PATH}/nodes")["items"]
+
+    def get_pods(self):
+        """
+        Get all non-terminated pods in all namespaces
+
+        Returns:
+            list: Pod resources
+
+        """
+        return self._get_json(
+            "get pods -A -o json "
+            "--field-selector=status.phase!=Succeeded,status.phase!=Failed"
+        )["items"]
+
+    def get_pod_metrics(self):
+        """
+        Get PodMetrics of all the pods in all namespaces
+
+        Returns:
+            list: PodMetrics resources
+
+        """
+        return self._get_json(f"get --raw {METRICS_API_PATH}/pods")["items"]
+
+    def sample(self, node_names=None):
+        """
+        Take a sample of the node utilization and requests
+
+        Args:
+            node_names (list): Names of the nodes to include, all the nodes if
+                not specified
+
+        Returns:
+            dict: Node name to its utilization. CPU is in cores, memory in
+                bytes, percentages are of the allocatable resources. If pods
+                are included, "pod_usage" holds the usage of the pods on the
+                node keyed by "namespace/name".
+
+        """
+        nodes = {
+            node["metadata"]["name"]: node
+            for node in self.get_nodes()
+            if not node_names or node["metadata"]["name"] in node_names
+        }
+        usage = {
+            metrics["metadata"]["name"]: metrics["usage"]
+            for metrics in self.get_node_metrics()
+        }
+        pods = self.get_pods()
+        requests = aggregate_pod_requests(pods, node_names=nodes)
+
+        utilization = {}
+        for name, node in nodes.items():
+            allocatable = node.get("status", {}).get("allocatable", {})
+            cpu_allocatable = parse_quantity(allocatable.get("cpu"))
+            memory_allocatable = parse_quantity(allocatable.get("memory"))
+            node_usage = usage.get(name, {})
+            cpu_usage = parse_quantity(node_usage.get("cpu"))
+            memory_usage = parse_quantity(node_usage.get("memory"))
+            cpu_requests, memory_requests, pod_count = requests.get(name, (0.0, 0.0, 0))
+            utilization[name] = {
+                "cpu_usage": cpu_usage,
+                "cpu_percent": get_percent(cpu_usage, cpu_allocatable),
+                "memory_usage": memory_usage,
+                "memory_percent": get_percent(memory_usage, memory_allocatable),
+                "cpu_requests": cpu_requests,
+                "cpu_requests_percent": get_percent(cpu_requests, cpu_allocatable),
+                "memory_requests": memory_requests,
+                "memory_requests_percent": get_percent(
+                    memory_requests, memory_allocatable
+                ),
+                "pods": pod_count,
+            }
+            if name not in usage:
+                log.warning(f"No metrics of node {name} in the metrics API")
+
+        if self.include_pods:
+            pod_nodes = {
+                f"{pod_data['metadata']['namespace']}/"
+                f"{pod_data['metadata']['name']}": pod_data["spec"].get("nodeName")
+                for pod_data in pods
+            }
+            for name in utilization:
+                utilization[name]["pod_usage"] = {}
+            for metrics in self.get_pod_metrics():
+                pod_key = (
+                    f"{metrics['metadata']['namespace']}/{metrics['metadata']['name']}"
+                )
+                node = pod_nodes.get(pod_key)
+                if node not in utilization:
+                    continue
+                utilization[node]["pod_usage"][pod_key] = {
+                    "cpu_usage": sum(
+                        parse_quantity(container["usage"].get("cpu"))
+                        for container in metrics.get("containers", [])
+                    ),
+                    "memory_usage": sum(
+                        parse_quantity(container["usage"].get("memory"))
+                        for container in metrics.get("containers", [])
+                    ),
+                }
+        return utilization
+
+
+class UtilizationMonitor(Timer):
+    """
+    Background sampling of the node utilization to a time series, the rows
+    of every sample are appended to a CSV file, so they are not kept in
+    memory and the samples taken so far are available if the run is
+    interrupted
+    """
+
+    def __init__(self, output_file, interval=30, node_names=None):
+        """
+        Constructor of UtilizationMonitor
+
+        Args:
+            output_file (str): Path to the CSV file
+            interval (int): Number of seconds between the samples
+            node_names (list): Names of the nodes to sample, all the nodes if
+                not specified
+
+        Raises:
+            ValueError: In case the output file is not a CSV file
+
+        """
+        if not output_file.endswith(".csv"):
+            raise ValueError(
+                f"Utilization is written only to CSV file, got: {output_file}"
+            )
+        super(UtilizationMonitor, self).__init__(interval, self.take_sample)
+        self.daemon = True
+        self.output_file = output_file
+        self.node_names = node_names
+        self.sampler = UtilizationSampler()
+        self.samples = 0
+        # Sample the cluster of the thread which created the monitor
+        self.config_index = get_config_index()
+
+    def run(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_file)), exist_ok=True)
+        pd.DataFrame(columns=UTILIZATION_COLUMNS).to_csv(self.output_file, index=False)
+        with config_context(self.config_index):
+            self.take_sample()
+            while not self.finished.wait(self.interval):
+                self.take_sample()
+
+    def take_sample(self):
+        """
+        Take a sample and append it to the output file, failures are only
+        logged to not interrupt the monitoring
+        """
+        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        try:
+            utilization = self.sampler.sample(node_names=self.node_names)
+        except Exception as e:
+            log.warning(f"Failed to sample node utilization: {e}")
+            return
+        rows = [
+            [timestamp, node] + [values[col] for col in UTILIZATION_COLUMNS[2:]]
+            for node, values in utilization.items()
+        ]
+        try:
+            pd.DataFrame(rows, columns=UTILIZATION_COLUMNS).to_csv(
+                self.output_file, mode="a", header=False, index=False
+            )
+        except OSError as e:
+            log.warning(f"Failed to write utilization sample: {e}")
+            return
+        self.samples += 1
+
+    def get_dataframe(self):
+        """
+        Get the time series
+
+        Returns:
+            pandas.DataFrame: The samples with UTILIZATION_COLUMNS
+
+        """
+        if not os.path.exists(self.output_file):
+            return pd.DataFrame(columns=UTILIZATION_COLUMNS)
+        return pd.read_csv(self.output_file)
+
+    def stop(self):
+        """
+        Stop the monitoring
+
+        Returns:
+            str: Path to the output file
+
+        """
+        self.cancel()
+        if self.is_alive():
+            self.join()
+        log.info(f"{self.samples} utilization samples written to {self.output_file}")
+        return self.output_file
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        self.stop()
@@ -15,7 +15,6 @@ from subprocess import TimeoutExpired
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import yaml
-from gevent import sleep
 from pathlib import Path
 from libcloud.common.exceptions import BaseHTTPError
 from libcloud.common.types import LibcloudError
@@ -65,6 +64,13 @@ mg_last_fail = None
 mg_collected_logs = 0
 mg_collected_types = set()
 mg_lock = threading.Lock()
+# Limits the number of must-gathers running at the same time
+mg_semaphore = None
+# Start time (RFC3339) of the last successful collection per
+# (cluster name, gatherer)
+mg_last_collection_time = dict()
+mg_summary_lock = threading.Lock()
+MG_SUMMARY_FILE = "must_gather_summary.json"
 subctl_lock = threading.Lock()
 
 
@@ -194,8 +200,8 @@ def cleanup_ceph_nodes(osp_cred, pattern=None, timeout=300):
                                 )
                             )
                         else:
-                            sleep(1)
-                sleep(5)
+                            time.sleep(1)
+                time.sleep(5)
     with parallel() as p:
         for fips in driver.ex_list_floating_ips():
             if fips.node_id is None:
@@ -208,7 +214,7 @@ def cleanup_ceph_nodes(osp_cred, pattern=None, timeout=300):
                 log.info("Volume has no name, skipping")
             elif name in volume.name:
                 log.info("Removing volume %s", volume.name)
-                sleep(10)
+                time.sleep(10)
                 try:
                     volume.destroy()
                 except BaseHTTPError as e:
@@ -284,7 +290,7 @@ def check_ceph_healthly(ceph_mon, num_osds, num_mons, mon_container=None, timeou
         if not any(state in lines for state in pending_states):
             if all(state in lines for state in valid_states):
                 break
-        sleep(5)
+        time.sleep(5)
     log.info(lines)
     if not all(state in lines for state in valid_states):
         log.error("Valid States are not found in the health check")
@@ -934,6 +940,109 @@ def apply_oc_resource(
     occli.apply(cfg_file)
 
 
+def get_mg_semaphore():
+    """
+    Get the semaphore limiting the number of must-gathers running at the same
+    time to REPORTING["max_parallel_must_gather"]
+
+    Returns:
+        threading.BoundedSemaphore: The must-gather semaphore
+
+    """
+    global mg_semaphore
+    with mg_lock:
+        if mg_semaphore is None:
+            mg_semaphore = threading.BoundedSemaphore(
+                config.REPORTING.get("max_parallel_must_gather", 4)
+            )
+        return mg_semaphore
+
+
+def get_path_size(path):
+    """
+    Get the size of the file, or the total size of the files in the directory
+
+    Args:
+        path (str): Path to the file or directory
+
+    Returns:
+        int: Size in bytes, 0 if the path doesn't exist
+
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total_size = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            file_path = os.path.join(root, file_name)
+            if not os.path.islink(file_path):
+                total_size += os.path.getsize(file_path)
+    return total_size
+
+
+def write_mg_summary(log_dir_path, image, status, duration, since_time=None):
+    """
+    Add record about one must-gather run to the summary file in the parent
+    directory of the must-gather logs
+
+    Args:
+        log_dir_path (str): Directory of the must-gather logs
+        image (str): The must-gather image
+        status (str): Status of the must-gather (collected / failed / skipped)
+        duration (float): Duration of the must-gather in seconds
+        since_time (str): The --since-time passed to the must-gather
+
+    """
+    size = get_path_size(log_dir_path) + get_path_size(f"{log_dir_path}.tar.gz")
+    record = {
+        "gatherer": os.path.basename(log_dir_path),
+        "image": image,
+        "status": status,
+        "since_time": since_time,
+        "duration": round(duration, 2),
+        "bytes": size,
+    }
+    summary_file = os.path.join(os.path.dirname(log_dir_path), MG_SUMMARY_FILE)
+    try:
+        with mg_summary_lock:
+            summary = []
+            if os.path.exists(summary_file):
+                with open(summary_file) as fd:
+                    summary = json.load(fd)
+            summary.append(record)
+            create_directory_path(os.path.dirname(summary_file))
+            with open(summary_file, "w") as fd:
+                json.dump(summary, fd, indent=2)
+    except (OSError, ValueError) as err:
+        log.warning(f"Failed to write must-gather summary {summary_file}: {err}")
+    log.info(f"Must-gather summary: {record}")
+
+
+def get_incremental_since_time(cluster_name, gatherer, since_time=None):
+    """
+    Get the since time for must-gather which doesn't fetch again logs older
+    than the previous successful collection by the gatherer from the cluster
+
+    Args:
+        cluster_name (str): Name of the cluster
+        gatherer (str): Type of the gatherer: ocp, ocs or mcg
+        since_time (str): Requested since time (RFC3339), None for all logs
+
+    Returns:
+        str: The later of the requested since time and start of the previous
+            successful collection by the gatherer from the cluster (RFC3339)
+
+    """
+    last_collection_time = mg_last_collection_time.get((cluster_name, gatherer))
+    if last_collection_time and (not since_time or last_collection_time > since_time):
+        log.info(
+            f"{gatherer} logs of cluster {cluster_name} were collected at "
+            f"{last_collection_time}, collecting only newer logs"
+        )
+        return last_collection_time
+    return since_time
+
+
 def run_must_gather(
     log_dir_path,
     image,
@@ -967,19 +1076,57 @@ def run_must_gather(
     Returns:
         mg_output (str): must-gather cli output
 
+    """
+    mg_output, _ = _run_must_gather(
+        log_dir_path,
+        image,
+        command=command,
+        cluster_config=cluster_config,
+        silent=silent,
+        output_file=output_file,
+        skip_after_max_fail=skip_after_max_fail,
+        timeout=timeout,
+        mg_options=mg_options,
+        since_time=since_time,
+    )
+    return mg_output
+
+
+def _run_must_gather(
+    log_dir_path,
+    image,
+    command=None,
+    cluster_config=None,
+    silent=False,
+    output_file=None,
+    skip_after_max_fail=False,
+    timeout=defaults.MUST_GATHER_TIMEOUT,
+    mg_options=None,
+    since_time=None,
+):
+    """
+    Runs the must-gather tool against the cluster, see run_must_gather
+
+    Returns:
+        tuple: must-gather cli output (str) and status of the collection
+            (str): collected, failed or skipped
+
     """
     global mg_fail_count, mg_last_fail, mg_collected_logs, mg_skip_count
 
     max_mg_fail_attempts = config.REPORTING.get("max_mg_fail_attempts")
     if skip_after_max_fail:
         with mg_lock:
-            if mg_fail_count > max_mg_fail_attempts:
+            skip = mg_fail_count > max_mg_fail_attempts
+            if skip:
                 mg_skip_count += 1
-                log.warning(
-                    f"MG collection is skipped because MG already failed {mg_fail_count} times!"
-                    f" Last error occurred at: {mg_last_fail}"
-                )
-                return
+        if skip:
+            log.warning(
+                f"MG collection is skipped because MG already failed {mg_fail_count} times!"
+                f" Last error occurred at: {mg_last_fail}"
+            )
+            write_mg_summary(log_dir_path, image, "skipped", 0, since_time)
+            return None, "skipped"
     if not cluster_config:
         cluster_config = ocsci_config
     mg_output = ""
@@ -1000,26 +1147,31 @@ def run_must_gather(
         output_file = os.path.join(log_dir_path, f"mg_output_{timestamp}.log")
         log.info(f"Must gather std error log will be placed in: {output_file}")
     occli = OCP()
-    try:
-        mg_output = occli.exec_oc_cmd(
-            cmd,
-            out_yaml_format=False,
-            timeout=timeout,
-            cluster_config=cluster_config,
-            silent=silent,
-            output_file=output_file,
-        )
-        with mg_lock:
-            mg_collected_logs += 1
-    except (CommandFailed, TimeoutExpired) as ex:
-        log.error(f"Failed during must gather logs! Error: {ex}")
-        with mg_lock:
-            mg_fail_count += 1
-            mg_last_fail = datetime.datetime.now()
-
-        if mg_output:
-            log.error(f"Must-Gather Output: {mg_output}")
-        export_mg_pods_logs(log_dir_path=log_dir_path)
+    status = "collected"
+    with get_mg_semaphore():
+        start_time = time.time()
+        try:
+            mg_output = occli.exec_oc_cmd(
+                cmd,
+                out_yaml_format=False,
+                timeout=timeout,
+                cluster_config=cluster_config,
+                silent=silent,
+                output_file=output_file,
+            )
+            with mg_lock:
+                mg_collected_logs += 1
+        except (CommandFailed, TimeoutExpired) as ex:
+            status = "failed"
+            log.error(f"Failed during must gather logs! Error: {ex}")
+            with mg_lock:
+                mg_fail_count += 1
+                mg_last_fail = datetime.datetime.now()
+
+            if mg_output:
+                log.error(f"Must-Gather Output: {mg_output}")
+            export_mg_pods_logs(log_dir_path=log_dir_path)
+        duration = time.time() - start_time
 
     if config.REPORTING.get("tarball_mg_logs"):
         tarball_path = f"{log_dir_path}.tar.gz"
@@ -1033,8 +1185,9 @@ def run_must_gather(
                 shutil.rmtree(log_dir_path)
         except Exception as err:
             log.error(f"Failed during packing files! Error: {err}")
+    write_mg_summary(log_dir_path, image, status, duration, since_time)
 
-    return mg_output
+    return mg_output, status
 
 
 def collect_ceph_external(path):
@@ -1234,6 +1387,9 @@ def _collect_ocs_logs(
     """
     This function runs in thread
 
+    Returns:
+        bool: True if all the requested gatherers collected the logs
+
     """
     global mg_collected_types
     log.info(
@@ -1249,7 +1405,8 @@ def _collect_ocs_logs(
         log.warning(
             "Cannot find $KUBECONFIG or ~/.kube/config; " "skipping log collection"
         )
-        return
+        return False
+    collected = True
     if status_failure:
         log_dir_path = os.path.join(
             os.path.expanduser(cluster_config.RUN["log_dir"]),
@@ -1282,7 +1439,7 @@ def _collect_ocs_logs(
             ocs_must_gather_image_and_tag = mirror_image(
                 ocs_must_gather_image_and_tag, cluster_config
             )
-        mg_output = run_must_gather(
+        mg_output, status = _run_must_gather(
             ocs_log_dir_path,
             ocs_must_gather_image_and_tag,
             cluster_config=cluster_config,
@@ -1294,9 +1451,11 @@ def _collect_ocs_logs(
             mg_options=mg_options,
             since_time=since_time,
         )
+        collected = collected and status == "collected"
         mg_collected_types.add("ocs")
         if (
-            ocsci_config.DEPLOYMENT.get("disconnected")
+            mg_output
+            and ocsci_config.DEPLOYMENT.get("disconnected")
             and "cannot stat 'jq'" in mg_output
         ):
             raise ValueError(
@@ -1318,27 +1477,38 @@ def _collect_ocs_logs(
         ocp_must_gather_image = cluster_config.REPORTING["ocp_must_gather_image"]
         if cluster_config.DEPLOYMENT.get("disconnected"):
             ocp_must_gather_image = mirror_image(ocp_must_gather_image)
-        run_must_gather(
-            ocp_log_dir_path,
-            ocp_must_gather_image,
-            cluster_config=cluster_config,
-            output_file=output_file,
-            skip_after_max_fail=skip_after_max_fail,
-            timeout=timeout,
-            since_time=since_time,
-        )
-        run_must_gather(
-            ocp_service_log_dir_path,
-            ocp_must_gather_image,
-            "/usr/bin/gather_service_logs worker",
-            cluster_config=cluster_config,
-            output_file=output_file,
-            skip_after_max_fail=skip_after_max_fail,
-            timeout=timeout,
-            since_time=since_time,
-        )
+        # OCP and OCP service logs gatherers are independent, run them
+        # concurrently within the must-gather concurrency limit
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ocp_futures = [
+                executor.submit(
+                    _run_must_gather,
+                    ocp_log_dir_path,
+                    ocp_must_gather_image,
+                    cluster_config=cluster_config,
+                    output_file=output_file,
+                    skip_after_max_fail=skip_after_max_fail,
+                    timeout=timeout,
+                    since_time=since_time,
+                ),
+                executor.submit(
+                    _run_must_gather,
+                    ocp_service_log_dir_path,
+                    ocp_must_gather_image,
+                    "/usr/bin/gather_service_logs worker",
+                    cluster_config=cluster_config,
+                    output_file=output_file,
+                    skip_after_max_fail=skip_after_max_fail,
+                    timeout=timeout,
+                    since_time=since_time,
+                ),
+            ]
+        for future in ocp_futures:
+            _, status = future.result()
+            collected = collected and status == "collected"
         mg_collected_types.add("ocp")
     if mcg:
+        mcg_collected = False
         counter = 0
         while counter < 5:
             counter += 1
@@ -1348,13 +1518,16 @@ def _collect_ocs_logs(
                     and ocsci_config.get_active_acm_index()
                     == cluster_config.MULTICLUSTER["multicluster_index"]
                 ):
+                    mcg_collected = True
                     break
                 collect_noobaa_db_dump(log_dir_path, cluster_config)
                 mg_collected_types.add("mcg")
+                mcg_collected = True
                 break
             except CommandFailed as ex:
                 log.error(f"Failed to dump noobaa DB! Error: {ex}")
-                sleep(30)
+                time.sleep(30)
+        collected = collected and mcg_collected
     # Collect ACM logs only from ACM
     # Collect this only once, with parallel ocp/ocs log collection, we want to collect acm logs only once
     if ocs:
@@ -1377,6 +1550,7 @@ def _collect_ocs_logs(
                     acm_mustgather_path,
                     acm_mustgather_image,
                     cluster_config=cluster_config,
+                    since_time=since_time,
                 )
 
             # We want to skip submariner log collection if it's in import clusters phase
@@ -1419,6 +1593,7 @@ def _collect_ocs_logs(
                     run_cmd(f"chmod -R 777 {submariner_log_path}")
                     os.chdir(cwd)
                     log.info(out)
+    return collected
 
 
 def collect_ocs_logs(
@@ -1434,10 +1609,16 @@ def collect_ocs_logs(
     skip_after_max_fail=False,
     timeout=defaults.MUST_GATHER_TIMEOUT,
     since_time=None,
+    incremental=False,
 ):
     """
     Collects OCS logs
 
+    Independent gatherers (OCS, OCP, MCG per cluster) run concurrently, the
+    number of must-gathers running at the same time is limited by
+    REPORTING["max_parallel_must_gather"]. Duration and size of every
+    must-gather are written to must_gather_summary.json file next to the logs.
+
     Args:
         dir_name (str): directory name to store OCS logs. Logs will be stored
             in dir_name suffix with _ocs_logs.
@@ -1455,79 +1636,67 @@ def collect_ocs_logs(
             MG collection.
         timeout (int): Max timeout to wait for MG to complete before aborting the MG execution.
         since_time (str): Only return logs after a specific date (RFC3339). For example "2024-01-15T10:30:00Z"
+        incremental (bool): True for not collecting again logs older than the
+            previous collection from the cluster
 
     """
     cwd = os.getcwd()
-    results = list()
+    # Future of every gatherer to its (cluster name, gatherer)
+    results = dict()
+    collection_start_time = datetime.datetime.now(datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+    gatherers = [
+        gatherer
+        for gatherer, enabled in (("ocp", ocp), ("ocs", ocs), ("mcg", mcg))
+        if enabled
+    ]
     with ThreadPoolExecutor() as executor:
         for cluster in ocsci_config.clusters:
-            if ocp:
-                results.append(
-                    executor.submit(
-                        _collect_ocs_logs,
-                        cluster,
-                        dir_name=dir_name,
-                        ocp=ocp,
-                        ocs=False,
-                        mcg=False,
-                        status_failure=status_failure,
-                        ocs_flags=ocs_flags,
-                        mg_options=mg_options,
-                        silent=silent,
-                        output_file=output_file,
-                        skip_after_max_fail=skip_after_max_fail,
-                        timeout=timeout,
-                        since_time=since_time,
-                    )
+            cluster_name = cluster.ENV_DATA["cluster_name"]
+            for gatherer in gatherers:
+                gatherer_since_time = (
+                    get_incremental_since_time(cluster_name, gatherer, since_time)
+                    if incremental
+                    else since_time
                 )
-            if ocs:
-                results.append(
-                    executor.submit(
-                        _collect_ocs_logs,
-                        cluster,
-                        dir_name=dir_name,
-                        ocp=False,
-                        ocs=ocs,
-                        mcg=False,
-                        status_failure=status_failure,
-                        ocs_flags=ocs_flags,
-                        mg_options=mg_options,
-                        silent=silent,
-                        output_file=output_file,
-                        skip_after_max_fail=skip_after_max_fail,
-                        timeout=timeout,
-                        since_time=since_time,
-                    )
-                )
-            if mcg:
-                results.append(
-                    executor.submit(
-                        _collect_ocs_logs,
-                        cluster,
-                        dir_name=dir_name,
-                        ocp=False,
-                        ocs=False,
-                        mcg=mcg,
-                        status_failure=status_failure,
-                        ocs_flags=ocs_flags,
-                        mg_options=mg_options,
-                        silent=silent,
-                        output_file=output_file,
-                        skip_after_max_fail=skip_after_max_fail,
-                        timeout=timeout,
-                        since_time=since_time,
-                    )
+                future = executor.submit(
+                    _collect_ocs_logs,
+                    cluster,
+                    dir_name=dir_name,
+                    ocp=gatherer == "ocp",
+                    ocs=gatherer == "ocs",
+                    mcg=gatherer == "mcg",
+                    status_failure=status_failure,
+                    ocs_flags=ocs_flags,
+                    mg_options=mg_options,
+                    silent=silent,
+                    output_file=output_file,
+                    skip_after_max_fail=skip_after_max_fail,
+                    timeout=timeout,
+                    since_time=gatherer_since_time,
                 )
+                results[future] = (cluster_name, gatherer)
 
+    error = None
     for f in as_completed(results):
+        cluster_name, gatherer = results[f]
         try:
-            log.info(f.result())
+            collected = f.result()
         except Exception as e:
             log.error("Must-gather collection failed")
             log.error(e)
-            raise
+            error = error or e
+            continue
         finally:
             os.chdir(cwd)
+        # Logs are collected again next time if the gatherer failed
+        if collected:
+            mg_last_collection_time[(cluster_name, gatherer)] = collection_start_time
+        else:
+            log.warning(f"{gatherer} logs of cluster {cluster_name} were not collected")
+    if error:
+        raise error
 
 
 def collect_prometheus_metrics(
@@ -5,7 +5,8 @@ Based on AWS S3 Vectors API: https://docs.aws.amazon.com/boto3/latest/reference/
 
 import boto3
 import logging
-import random
+
+import numpy as np
 
 from ocs_ci.ocs.bucket_utils import retrieve_verification_mode
 from ocs_ci.ocs.resources.bucket_policy import gen_bucket_policy
@@ -64,8 +65,77 @@ def create_s3vectors_client(mcg_obj, obc_obj, nsr_name=None):
     return client
 
 
+# Maximum number of vectors in a single PutVectors request
+PUT_VECTORS_MAX_BATCH_SIZE = 500
+VECTOR_GENRES = ["scifi", "family", "drama", "action", "comedy"]
+
+
+def generate_vector_array(dimension, num_vectors, seed=None, low=0.0, high=2.0):
+    """
+    Generate random vectors as a float32 NumPy array
+
+    Args:
+        dimension (int): Dimensionality of vectors
+        num_vectors (int): Number of vectors to generate
+        seed (int): Seed of the random generator, for reproducible data sets
+        low (float): Lower bound of the vector values (inclusive)
+        high (float): Upper bound of the vector values (exclusive)
+
+    Returns:
+        numpy.ndarray: Array of shape (num_vectors, dimension)
+
+    """
+    rng = np.random.default_rng(seed)
+    vectors = rng.random((num_vectors, dimension), dtype=np.float32)
+    vectors *= high - low
+    vectors += low
+    return vectors
+
+
+def get_vector_key(index, key_prefix="vector_key"):
+    """
+    Get the key of the vector generated at the given position
+
+    Args:
+        index (int): Position of the vector in the generated array
+        key_prefix (str): Prefix for vector keys
+
+    Returns:
+        str: The vector key
+
+    """
+    return f"{key_prefix}_{index + 1}"
+
+
+def iter_vectors_with_metadata(vector_array, key_prefix="vector_key"):
+    """
+    Lazily convert the rows of the vector array to vector objects with
+    genre-based metadata, so only the vectors being uploaded are held as
+    Python objects
+
+    Args:
+        vector_array (numpy.ndarray): Array of shape (num_vectors, dimension)
+        key_prefix (str): Prefix for vector keys (default: 'vector_key')
+
+    Yields:
+        dict: Vector object with key, data (float32 array) and metadata
+            (genre, source_text, price)
+
+    """
+    for i, row in enumerate(vector_array):
+        yield {
+            "key": get_vector_key(i, key_prefix),
+            "data": {"float32": row.tolist()},
+            "metadata": {
+                "genre": VECTOR_GENRES[i % len(VECTOR_GENRES)],
+                "source_text": f"i am source text {i+1}",
+                "price": (i + 1) * 10,
+            },
+        }
+
+
 def generate_test_vectors_with_metadata(
-    dimension, num_vectors, key_prefix="vector_key"
+    dimension, num_vectors, key_prefix="vector_key", seed=None
 ):
     """
     Generate test vectors with genre-based metadata matching reference format
@@ -74,29 +144,18 @@ def generate_test_vectors_with_metadata(
         dimension (int): Dimensionality of vectors [REQUIRED]
         num_vectors (int): Number of vectors to generate [REQUIRED]
         key_prefix (str): Prefix for vector keys (default: 'vector_key')
+        seed (int): Seed of the random generator, for reproducible data sets
 
     Returns:
         list: List of vector objects, each with key, data (float32 array),
             and metadata (genre, source_text, price)
 
     """
-    genres = ["scifi", "family", "drama", "action", "comedy"]
-    vectors = []
-
-    for i in range(num_vectors):
-        vector_data = [random.uniform(0.0, 2.0) for _ in range(dimension)]
-        vector_obj = {
-            "key": f"{key_prefix}_{i+1}",
-            "data": {"float32": vector_data},
-            "metadata": {
-                "genre": genres[i % len(genres)],
-                "source_text": f"i am source text {i+1}",
-                "price": (i + 1) * 10,
-            },
-        }
-        vectors.append(vector_obj)
-
-    return vectors
+    return list(
+        iter_vectors_with_metadata(
+            generate_vector_array(dimension, num_vectors, seed=seed), key_prefix
+        )
+    )
 
 
 def create_vector_bucket(s3vectors_client, vector_bucket_name, **kwargs):
@@ -282,6 +341,39 @@ def put_vectors(s3vectors_client, vectors, **kwargs):
     return s3vectors_client.put_vectors(**params)
 
 
+def put_vectors_in_batches(
+    s3vectors_client, vectors, batch_size=PUT_VECTORS_MAX_BATCH_SIZE, **kwargs
+):
+    """
+    Store vectors in a vector index in chunks of batch_size vectors
+
+    Args:
+        s3vectors_client (obj): boto3 s3vectors client
+        vectors (iterable): Vector objects, e.g. list or the generator
+            returned by iter_vectors_with_metadata
+        batch_size (int): Number of vectors per put_vectors request
+        **kwargs: Optional parameters like vectorBucketName (str),
+            indexName (str), indexArn (str)
+
+    Returns:
+        int: Number of vectors stored
+
+    """
+    stored_count = 0
+    batch = []
+    for vector in vectors:
+        batch.append(vector)
+        if len(batch) == batch_size:
+            put_vectors(s3vectors_client, batch, **kwargs)
+            stored_count += len(batch)
+            batch = []
+    if batch:
+        put_vectors(s3vectors_client, batch, **kwargs)
+        stored_count += len(batch)
+    logger.info(f"Stored {stored_count} vectors in batches of {batch_size}")
+    return stored_count
+
+
 def get_vectors(s3vectors_client, keys, **kwargs):
     """
     Retrieve specific vectors by their keys
@@ -370,6 +462,83 @@ def query_vectors(s3vectors_client, query_vector, top_k, **kwargs):
     return s3vectors_client.query_vectors(**params)
 
 
+def compute_exact_nearest_neighbors(
+    vector_array, query_vector, top_k, distance_metric="euclidean"
+):
+    """
+    Find the exact nearest neighbors of the query vector by brute force, as a
+    ground truth for results of query_vectors
+
+    Args:
+        vector_array (numpy.ndarray): Array of shape (num_vectors, dimension)
+            with the stored vectors
+        query_vector (list): Query vector as list of floats
+        top_k (int): Number of nearest neighbors to return
+        distance_metric (str): Distance metric ('euclidean'|'cosine')
+
+    Returns:
+        tuple: Array of positions of the nearest vectors in vector_array,
+            ordered from the nearest, and array of their distances
+
+    """
+    vectors = np.asarray(vector_array, dtype=np.float32)
+    query = np.asarray(query_vector, dtype=np.float32)
+    if distance_metric == "euclidean":
+        # |v - q|^2 = |v|^2 - 2 v.q + |q|^2, without a copy of the whole array
+        distances = np.einsum("ij,ij->i", vectors, vectors)
+        distances -= 2 * (vectors @ query)
+        distances += query @ query
+        distances = np.sqrt(np.maximum(distances, 0))
+    elif distance_metric == "cosine":
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        distances = 1 - (vectors @ query) / np.maximum(norms, np.finfo(np.float32).tiny)
+    else:
+        raise ValueError(f"Unsupported distance metric: {distance_metric}")
+    top_k = min(top_k, len(distances))
+    nearest = np.argpartition(distances, top_k - 1)[:top_k]
+    nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+    return nearest, distances[nearest]
+
+
+def calculate_query_recall(
+    query_response,
+    vector_array,
+    query_vector,
+    top_k,
+    distance_metric="euclidean",
+    key_prefix="vector_key",
+):
+    """
+    Calculate recall of query_vectors results against the exact nearest
+    neighbors computed locally from the vectors which were stored
+
+    Args:
+        query_response (dict): Response of query_vectors
+        vector_array (numpy.ndarray): Array with the stored vectors, the
+            vector at position i is stored with key get_vector_key(i)
+        query_vector (list): Query vector used for query_vectors
+        top_k (int): top_k used for query_vectors
+        distance_metric (str): Distance metric of the index
+        key_prefix (str): Prefix of the vector keys
+
+    Returns:
+        float: Fraction of the exact top_k nearest neighbors returned by the
+            query, 1.0 means perfect recall
+
+    """
+    nearest, _ = compute_exact_nearest_neighbors(
+        vector_array, query_vector, top_k, distance_metric
+    )
+    expected_keys = {get_vector_key(int(i), key_prefix) for i in nearest}
+    returned_keys = {vector["key"] for vector in query_response.get("vectors", [])}
+    recall = len(expected_keys & returned_keys) / len(expected_keys)
+    logger.info(
+        f"Recall of query for top {top_k} vectors by {distance_metric} "
+        f"distance: {recall}"
+    )
+    return recall
+
+
 def delete_all_vectors(s3vectors_client, **kwargs):
     """
     Delete all vectors from an index
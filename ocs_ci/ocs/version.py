@@ -20,7 +20,6 @@ import argparse
 import logging
 import os.path
 import pprint
-import re
 import sys
 from functools import wraps
 
@@ -29,6 +28,7 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants, node, ocp
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.image_inventory import get_image_inventory
 from ocs_ci.utility import utils
 from ocs_ci.utility.utils import skipif_ocs_version
 
@@ -144,10 +144,18 @@ def get_ocp_version(version_dict=None):
     return version_str
 
 
-def get_ocs_version():
+def get_ocs_version(refresh=False):
     """
     Query OCP to get all information about OCS version.
 
+    The images are taken from the image inventory of the cluster, which is
+    built from one list of the pods in all namespaces and cached for the
+    session.
+
+    Args:
+        refresh (bool): True to list the pods again instead of using the
+            cached inventory
+
     Returns:
       dict: image_dict with information about images IDs
     """
@@ -158,44 +166,23 @@ def get_ocs_version():
     # version in a similar way as it's done for OCP itself above.
     # Reference: Jose A. Rivera on ocs-qe list.
 
-    # Get all openshift storage related namespaces. Eg. at the time of writing
-    # this code (July 2019), there were these storage namespaces:
+    # The storage namespaces are openshift related namespaces matching
+    # STORAGE_NAMESPACE_PATTERN. Eg. at the time of writing this code (July
+    # 2019), there were these storage namespaces:
     #  * openshift-cluster-storage-operator
     #  * openshift-storage
     # TODO: how to do this in upstream where namespace is rook-ceph?
-    # TODO: should we use config.ENV_DATA["cluster_namespace"] somehow here?
-    storage_namespaces = []
-    all_namespaces = OCP(kind="namespace").get()["items"]
-    ns_re = re.compile("^openshift.*storage")
-    for ns in all_namespaces:
-        if ns_re.match(ns["metadata"]["name"]):
-            storage_namespaces.append(ns["metadata"]["name"])
-
-    logger.info("found storage namespaces %s", storage_namespaces)
-
-    # Now get the OCS version by asking for version of all container images of
-    # all pods in openshift-storage namespace.
-    image_dict = {}
-    for ns in storage_namespaces:
-        ocs = OCP(kind="pod", namespace=ns)
-        ocs_pods = ocs.get()
-        ns_dict = {}
-        for pod in ocs_pods["items"]:
-            for container in pod["spec"]["containers"]:
-                logger.debug(
-                    "container %s (in pod %s) uses image %s",
-                    container["name"],
-                    pod["metadata"]["name"],
-                    container["image"],
-                )
-            cs_items = pod["status"].get("containerStatuses")
-            if cs_items is None:
-                pod_name = pod["metadata"]["name"]
-                logger.warning(f"pod {pod_name} has no containerStatuses")
-                continue
-            for cs in cs_items:
-                ns_dict.setdefault(cs["image"], set()).add(cs["imageID"])
-        image_dict.setdefault(ns, ns_dict)
+    inventory = get_image_inventory(refresh=refresh)
+    image_dict = inventory.get_storage_image_ids()
+    logger.info("found storage namespaces %s", list(image_dict))
+    for ns in image_dict:
+        pods_without_status = {
+            record["pod"]
+            for record in inventory.get_containers(namespace=ns)
+            if record["image_id"] is None
+        }
+        for pod_name in sorted(pods_without_status):
+            logger.warning(f"pod {pod_name} has no containerStatuses")
 
     logger.debug("ocs version collected")
 
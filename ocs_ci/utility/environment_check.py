@@ -6,9 +6,11 @@ leftovers
 import copy
 import logging
 import yaml
-from gevent.threadpool import ThreadPoolExecutor
+from concurrent.futures import wait
+
 from ocs_ci.framework import config
 from ocs_ci.ocs import ocp, defaults, constants, exceptions
+from ocs_ci.utility.executor import get_executor
 
 log = logging.getLogger(__name__)
 
@@ -153,16 +155,19 @@ def get_environment_status(env_dict, exclude_labels=None, exclude_job_owned_pods
         exclude_labels (list): App labels to ignore leftovers
         exclude_job_owned_pods (bool): If True, exclude pods owned by Jobs
     """
-    with ThreadPoolExecutor(max_workers=len(config.RUN["KINDS"])) as executor:
-        for key, kind in zip(env_dict.keys(), config.RUN["KINDS"]):
-            executor.submit(
-                assign_get_values,
-                env_dict,
-                key,
-                kind,
-                exclude_labels=exclude_labels,
-                exclude_job_owned_pods=exclude_job_owned_pods,
-            )
+    executor = get_executor()
+    futures = [
+        executor.submit(
+            assign_get_values,
+            env_dict,
+            key,
+            kind,
+            exclude_labels=exclude_labels,
+            exclude_job_owned_pods=exclude_job_owned_pods,
+        )
+        for key, kind in zip(env_dict.keys(), config.RUN["KINDS"])
+    ]
+    wait(futures)
 
 
 def get_status_before_execution(exclude_labels=None, exclude_job_owned_pods=True):
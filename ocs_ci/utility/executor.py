@@ -0,0 +1,418 @@
+# -*- coding: utf8 -*-
+"""
+Concurrency runtime of the framework.
+
+All the concurrency in the framework is based on OS threads. gevent
+greenlets are not used, as the framework doesn't monkey patch the standard
+library and blocking calls (e.g. subprocess calls of exec_cmd) in greenlets
+are serialized.
+
+* BoundedExecutor - for fan-out of many short tasks (create / delete / wait
+  for many objects). Parallel helpers should submit their tasks into the
+  shared executor returned by get_executor() instead of creating their own
+  thread pools, so that the number of concurrent oc processes is bounded for
+  the whole test run.
+* ocs_ci.ocs.parallel.parallel - context manager for spawning a few long
+  running tasks, each in its own thread.
+* ocs_ci.framework.ConfigSafeThread or a thread using config_context() - for
+  long living background monitors.
+
+Every task and thread has to run with the config context (cluster) of the
+code which started it, otherwise it would use the current context of the
+main thread, which may be switched at any time. BoundedExecutor and
+parallel take care of it, background threads should capture the config
+index with get_config_index() when created and run in config_context().
+
+The limits of the shared executor are taken from the RUN['executor'] section
+of the configuration:
+
+* max_workers - maximum number of tasks running at the same time
+* max_workers_per_cluster - maximum number of running tasks per cluster
+  (config index) in multicluster runs
+* max_workers_per_verb - dict of verb (e.g. create, delete) to the maximum
+  number of running tasks submitted with this verb
+* throttling_max_retries - how many times a task which failed because the
+  API server throttled the request is retried
+* throttling_backoff - initial back-off in seconds after throttling
+* throttling_max_backoff - maximum back-off in seconds after throttling
+* progress_log_interval - minimum interval in seconds between progress logs
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+
+from ocs_ci.framework import config, config_lock
+from ocs_ci.ocs.exceptions import CommandFailed
+
+log = logging.getLogger(__name__)
+
+# Messages of errors returned when the API server or etcd is overloaded and
+# the request should be sent again later
+THROTTLING_ERRORS = (
+    "TooManyRequests",
+    "Too Many Requests",
+    "(429)",
+    "etcdserver: too many requests",
+    "etcdserver: request timed out",
+    "etcdserver: leader changed",
+    "the server is currently unable to handle the request",
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def is_throttling_error(exception):
+    """
+    Check if the exception was caused by throttling of the API server
+
+    Args:
+        exception (Exception): The exception to check
+
+    Returns:
+        bool: True if the request was throttled, False otherwise
+
+    """
+    message = str(exception)
+    return any(error in message for error in THROTTLING_ERRORS)
+
+
+def get_config_index():
+    """
+    Get the config index used by the current thread
+
+    Returns:
+        int: The config index of the current thread
+
+    """
+    return getattr(config.thread_local_data, "config_index", config.cur_index)
+
+
+@contextmanager
+def config_context(config_index):
+    """
+    Context manager for running a block of code in the current thread with
+    the given config index, without affecting other threads
+
+    Args:
+        config_index (int): The config index to use
+
+    """
+    previous_index = getattr(config.thread_local_data, "config_index", None)
+    with config_lock:
+        config.thread_local_data.config_index = config_index
+    try:
+        yield
+    finally:
+        with config_lock:
+            if previous_index is None:
+                del config.thread_local_data.config_index
+            else:
+                config.thread_local_data.config_index = previous_index
+
+
+def run_in_config_context(config_index, fn, *args, **kwargs):
+    """
+    Run the function with the given config index
+
+    Args:
+        config_index (int): The config index to use
+        fn (function): The function to run
+        args: Arguments for the function
+        kwargs: Keyword arguments for the function
+
+    Returns:
+        Any: The result of the function
+
+    """
+    with config_context(config_index):
+        return fn(*args, **kwargs)
+
+
+class BoundedExecutor(object):
+    """
+    Thread pool with concurrency limits per cluster and per verb, and with
+    adaptive back-off when the API server throttles requests.
+
+    Tasks are running with the config context (cluster) of the thread which
+    submitted them.
+
+    Tasks must not submit other tasks into the same executor and wait for
+    them, as this may exhaust the workers and deadlock.
+
+    Example::
+
+        executor = get_executor()
+        futures = [
+            executor.submit(create_pod, verb="create", pvc_name=pvc_obj.name)
+            for pvc_obj in pvc_objs
+        ]
+        pod_objs = [future.result() for future in futures]
+
+    """
+
+    def __init__(
+        self,
+        max_workers=32,
+        max_workers_per_cluster=16,
+        max_workers_per_verb=None,
+        throttling_max_retries=5,
+        throttling_backoff=2,
+        throttling_max_backoff=60,
+        progress_log_interval=30,
+    ):
+        """
+        Constructor for BoundedExecutor class
+
+        Args:
+            max_workers (int): Maximum number of tasks running at the same time
+            max_workers_per_cluster (int): Maximum number of running tasks per
+                cluster, None for no limit
+            max_workers_per_verb (dict): Maximum number of running tasks per
+                verb, e.g. {"create": 10, "delete": 10}
+            throttling_max_retries (int): Number of retries of a throttled task
+            throttling_backoff (float): Initial back-off in seconds after the
+                API server throttled a request
+            throttling_max_backoff (float): Maximum back-off in seconds
+            progress_log_interval (int): Minimum interval in seconds between
+                progress logs
+
+        """
+        self.max_workers = max_workers
+        self.max_workers_per_cluster = max_workers_per_cluster
+        self.max_workers_per_verb = max_workers_per_verb or {}
+        self.throttling_max_retries = throttling_max_retries
+        self.throttling_backoff = throttling_backoff
+        self.throttling_max_backoff = throttling_max_backoff
+        self.progress_log_interval = progress_log_interval
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ocs-ci-executor"
+        )
+        self._lock = threading.Lock()
+        self._cluster_semaphores = {}
+        self._verb_semaphores = {}
+        # Current back-off and the time until no new task attempt is started
+        self._backoff = 0
+        self._resume_time = 0
+        self._last_progress_log = 0
+        self.stats = Counter()
+
+    def submit(self, fn, *args, verb=None, **kwargs):
+        """
+        Submit a task into the executor
+
+        Args:
+            fn (function): The function to run
+            args: Arguments for the function
+            verb (str): The verb of the task (e.g. create, delete) used for
+                the per verb concurrency limit
+            kwargs: Keyword arguments for the function
+
+        Returns:
+            concurrent.futures.Future: The future of the task
+
+        """
+        with self._lock:
+            self.stats["submitted"] += 1
+        return self._pool.submit(
+            self._run_task, get_config_index(), verb, fn, args, kwargs
+        )
+
+    def map(self, fn, items, verb=None):
+        """
+        Run the function for every item and wait for all of them
+
+        Args:
+            fn (function): The function to run with one item as an argument
+            items (iterable): The items to run the function for
+            verb (str): The verb of the tasks
+
+        Returns:
+            list: Results of the function in the order of the items
+
+        """
+        futures = [self.submit(fn, item, verb=verb) for item in items]
+        return [future.result() for future in futures]
+
+    def get_progress(self):
+        """
+        Get progress metrics of the executor
+
+        Returns:
+            dict: Number of submitted, running, completed, failed and
+                throttled tasks and the current back-off in seconds
+
+        """
+        with self._lock:
+            return {
+                "submitted": self.stats["submitted"],
+                "running": self.stats["running"],
+                "completed": self.stats["completed"],
+                "failed": self.stats["failed"],
+                "throttled": self.stats["throttled"],
+                "backoff": self._backoff,
+            }
+
+    def shutdown(self, wait=True):
+        """
+        Shutdown the executor
+
+        Args:
+            wait (bool): True for waiting for all the submitted tasks
+
+        """
+        self._pool.shutdown(wait=wait)
+
+    def _get_semaphore(self, semaphores, key, limit):
+        """
+        Get the semaphore for the key, create it if missing
+
+        Args:
+            semaphores (dict): Semaphores by key
+            key (str): The key of the semaphore
+            limit (int): The limit of the semaphore, None for no limit
+
+        Returns:
+            threading.Semaphore or contextlib.nullcontext: The semaphore
+
+        """
+        if not limit:
+            return nullcontext()
+        with self._lock:
+            if key not in semaphores:
+                semaphores[key] = threading.Semaphore(limit)
+            return semaphores[key]
+
+    def _wait_for_backoff(self):
+        """
+        Sleep until the back-off after throttling passes
+        """
+        while True:
+            with self._lock:
+                remaining = self._resume_time - time.time()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def _register_throttling(self, exception):
+        """
+        Increase the back-off after the API server throttled a request
+
+        Args:
+            exception (Exception): The throttling exception
+
+        """
+        with self._lock:
+            self.stats["throttled"] += 1
+            self._backoff = min(
+                max(self._backoff * 2, self.throttling_backoff),
+                self.throttling_max_backoff,
+            )
+            self._resume_time = max(self._resume_time, time.time() + self._backoff)
+            backoff = self._backoff
+        log.warning(
+            f"API server throttled the request, backing off for {backoff} "
+            f"seconds: {exception}"
+        )
+
+    def _register_success(self):
+        """
+        Decrease the back-off after a successful task
+        """
+        with self._lock:
+            self._backoff = self._backoff / 2 if self._backoff > 1 else 0
+
+    def _log_progress(self):
+        """
+        Log progress of the executor, at most once per progress_log_interval,
+        and always when no task is pending
+        """
+        now = time.time()
+        with self._lock:
+            done = self.stats["completed"] + self.stats["failed"]
+            if (
+                done != self.stats["submitted"]
+                and now - self._last_progress_log < self.progress_log_interval
+            ):
+                return
+            self._last_progress_log = now
+        log.info(f"Executor progress: {self.get_progress()}")
+
+    def _run_task(self, config_index, verb, fn, args, kwargs):
+        """
+        Run the task in the config context of the submitting thread, within
+        the concurrency limits and with retries on throttling
+
+        Args:
+            config_index (int): Config index of the submitting thread
+            verb (str): The verb of the task
+            fn (function): The function to run
+            args (tuple): Arguments for the function
+            kwargs (dict): Keyword arguments for the function
+
+        Returns:
+            Any: The result of the function
+
+        """
+        cluster_semaphore = self._get_semaphore(
+            self._cluster_semaphores, config_index, self.max_workers_per_cluster
+        )
+        verb_semaphore = self._get_semaphore(
+            self._verb_semaphores, verb, self.max_workers_per_verb.get(verb)
+        )
+        try:
+            # The verb slot is acquired first, so a task waiting for a
+            # saturated verb limit doesn't hold a cluster slot and block
+            # tasks of other verbs on the cluster
+            with config_context(config_index), verb_semaphore, cluster_semaphore:
+                attempt = 0
+                while True:
+                    attempt += 1
+                    self._wait_for_backoff()
+                    with self._lock:
+                        self.stats["running"] += 1
+                    try:
+                        result = fn(*args, **kwargs)
+                    except CommandFailed as ex:
+                        if (
+                            is_throttling_error(ex)
+                            and attempt <= self.throttling_max_retries
+                        ):
+                            self._register_throttling(ex)
+                            continue
+                        raise
+                    finally:
+                        with self._lock:
+                            self.stats["running"] -= 1
+                    self._register_success()
+                    break
+        except Exception:
+            with self._lock:
+                self.stats["failed"] += 1
+            raise
+        else:
+            with self._lock:
+                self.stats["completed"] += 1
+            return result
+        finally:
+            self._log_progress()
+
+
+def get_executor():
+    """
+    Get the framework-wide executor, create it with the limits from
+    RUN['executor'] configuration on the first call
+
+    Returns:
+        BoundedExecutor: The framework-wide executor
+
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = BoundedExecutor(**config.RUN.get("executor", {}))
+        return _executor
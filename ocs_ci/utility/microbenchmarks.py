@@ -0,0 +1,454 @@
+# -*- coding: utf8 -*-
+"""
+Microbenchmarks of the framework hot paths, running without a cluster.
+
+A fake `oc` script is put on PATH, which prints canned output of
+`oc get <kind> [<name>] [-o yaml]` for a list of N pods generated for every
+scale. The benchmarks measure the framework overhead (command execution, YAML
+parsing, object creation, config access) and the results are stored to a
+JSON file, which can be used as a baseline for the next runs:
+
+    run-microbenchmarks --output baseline.json
+    run-microbenchmarks --baseline baseline.json --output current.json
+
+The run fails when the median time of any benchmark grew by more than the
+threshold against the baseline. Baselines are comparable only when taken on
+the same machine.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import yaml
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SCALES = (10, 100, 1000)
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.2
+BENCHMARK_NAMESPACE = "benchmark"
+
+FAKE_OC = """#!/bin/sh
+# Fake oc printing canned output of 'oc get' from $FAKE_OC_DATA
+verb=""
+kind=""
+name=""
+suffix="txt"
+while [ $# -gt 0 ]; do
+    case "$1" in
+        -o)
+            suffix="yaml"
+            shift 2
+            continue
+            ;;
+        -n|--namespace|--kubeconfig|--selector|--field-selector|-l)
+            shift 2
+            continue
+            ;;
+        -*)
+            shift
+            continue
+            ;;
+    esac
+    if [ -z "$verb" ]; then
+        verb="$1"
+    elif [ -z "$kind" ]; then
+        kind="$1"
+    elif [ -z "$name" ]; then
+        name="$1"
+    fi
+    shift
+done
+file="$FAKE_OC_DATA/$kind/${name:-_list}.$suffix"
+if [ "$verb" != "get" ] || [ ! -f "$file" ]; then
+    echo "Error from server (NotFound): $kind \\"$name\\" not found" >&2
+    exit 1
+fi
+exec cat "$file"
+"""
+
+
+def get_pod_dict(index, namespace=BENCHMARK_NAMESPACE):
+    """
+    Get dictionary of a running pod, similar to the real pods
+
+    Args:
+        index (int): Index of the pod
+        namespace (str): Namespace of the pod
+
+    Returns:
+        dict: The pod
+
+    """
+    name = f"benchmark-pod-{index}"
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"00000000-0000-0000-0000-{index:012d}",
+            "labels": {"app": "benchmark", "pod-template-hash": "5d8f9c7b6"},
+            "annotations": {"openshift.io/scc": "restricted-v2"},
+            "ownerReferences": [
+                {"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "benchmark"}
+            ],
+        },
+        "spec": {
+            "nodeName": f"worker-{index % 3}",
+            "containers": [
+                {
+                    "name": "benchmark",
+                    "image": "quay.io/ocsci/benchmark:latest",
+                    "command": ["/bin/sh", "-c", "sleep infinity"],
+                    "resources": {"requests": {"cpu": "10m", "memory": "32Mi"}},
+                    "volumeMounts": [
+                        {"mountPath": "/mnt", "name": "data"},
+                    ],
+                }
+            ],
+            "volumes": [{"name": "data", "persistentVolumeClaim": {"claimName": name}}],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.128.{index // 256 % 256}.{index % 256}",
+            "conditions": [
+                {"type": condition, "status": "True"}
+                for condition in ("Initialized", "Ready", "ContainersReady")
+            ],
+            "containerStatuses": [
+                {"name": "benchmark", "ready": True, "restartCount": 0}
+            ],
+        },
+    }
+
+
+def write_fake_oc_data(data_dir, scale):
+    """
+    Write canned 'oc get' output of the scale number of pods
+
+    Args:
+        data_dir (str): Directory for the canned output
+        scale (int): Number of the pods
+
+    Returns:
+        str: Path to the YAML file with the list of the pods
+
+    """
+    pods = [get_pod_dict(index) for index in range(scale)]
+    kind_dir = os.path.join(data_dir, "Pod")
+    os.makedirs(kind_dir)
+    os.symlink(kind_dir, os.path.join(data_dir, "pod"))
+    header = "NAME                READY   STATUS    RESTARTS   AGE\n"
+    for pod in pods:
+        name = pod["metadata"]["name"]
+        with open(os.path.join(kind_dir, f"{name}.yaml"), "w") as fd:
+            yaml.safe_dump(pod, fd)
+        with open(os.path.join(kind_dir, f"{name}.txt"), "w") as fd:
+            fd.write(header + f"{name}   1/1     Running   0          1d\n")
+    list_file = os.path.join(kind_dir, "_list.yaml")
+    with open(list_file, "w") as fd:
+        yaml.safe_dump(
+            {"apiVersion": "v1", "kind": "List", "items": pods, "metadata": {}}, fd
+        )
+    with open(os.path.join(kind_dir, "_list.txt"), "w") as fd:
+        fd.write(header)
+        for pod in pods:
+            fd.write(f"{pod['metadata']['name']}   1/1     Running   0          1d\n")
+    # Cluster wide proxy configuration read when Pod objects are created
+    proxy_dir = os.path.join(data_dir, "Proxy")
+    os.makedirs(proxy_dir)
+    with open(os.path.join(proxy_dir, "cluster.yaml"), "w") as fd:
+        yaml.safe_dump({"kind": "Proxy", "spec": {}, "status": {}}, fd)
+    return list_file
+
+
+@contextmanager
+def fake_oc_environment(scale):
+    """
+    Context manager putting the fake oc with canned output of the scale
+    number of pods on PATH. The cluster path in the config points to an empty
+    directory during the benchmarks, if not set. ENV_DATA and DEPLOYMENT
+    config sections are restored at the end, as the framework caches data
+    read from the cluster there.
+
+    Args:
+        scale (int): Number of the pods
+
+    Yields:
+        str: Path to the YAML file with the list of the pods
+
+    """
+    with tempfile.TemporaryDirectory(prefix="ocs-ci-benchmark-") as tmp_dir:
+        bin_dir = os.path.join(tmp_dir, "bin")
+        os.makedirs(bin_dir)
+        oc = os.path.join(bin_dir, "oc")
+        with open(oc, "w") as fd:
+            fd.write(FAKE_OC)
+        os.chmod(oc, 0o755)
+        from ocs_ci.framework import config
+
+        list_file = write_fake_oc_data(os.path.join(tmp_dir, "data"), scale)
+        original_config = {
+            section: dict(getattr(config, section))
+            for section in ("ENV_DATA", "DEPLOYMENT")
+        }
+        config.ENV_DATA.setdefault("cluster_path", tmp_dir)
+        original_env = {key: os.environ.get(key) for key in ("PATH", "FAKE_OC_DATA")}
+        os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        os.environ["FAKE_OC_DATA"] = os.path.join(tmp_dir, "data")
+        try:
+            yield list_file
+        finally:
+            for section, data in original_config.items():
+                getattr(config, section).clear()
+                getattr(config, section).update(data)
+            for key, value in original_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+def bench_exec_cmd(scale, list_file):
+    """
+    exec_cmd of 'oc get' with output of the scale number of pods
+    """
+    from ocs_ci.utility.utils import exec_cmd
+
+    exec_cmd(f"oc get pod -n {BENCHMARK_NAMESPACE} -o yaml")
+
+
+def bench_ocp_get(scale, list_file):
+    """
+    OCP.get of the list of the scale number of pods
+    """
+    from ocs_ci.ocs.ocp import OCP
+
+    OCP(kind="Pod", namespace=BENCHMARK_NAMESPACE).get()
+
+
+def bench_ocp_wait_for_resource(scale, list_file):
+    """
+    OCP.wait_for_resource of the scale number of running pods
+    """
+    from ocs_ci.ocs.ocp import OCP
+
+    assert OCP(kind="Pod", namespace=BENCHMARK_NAMESPACE).wait_for_resource(
+        "Running", resource_count=scale, timeout=600, sleep=1
+    )
+
+
+def bench_get_all_pods(scale, list_file):
+    """
+    get_all_pods of the scale number of pods
+    """
+    from ocs_ci.ocs.resources.pod import get_all_pods
+
+    get_all_pods(namespace=BENCHMARK_NAMESPACE, selector=["benchmark"])
+
+
+def bench_load_yaml(scale, list_file):
+    """
+    load_yaml of the file with the list of the scale number of pods
+    """
+    from ocs_ci.utility.templating import load_yaml
+
+    load_yaml(list_file)
+
+
+def bench_compare_dicts(scale, list_file):
+    """
+    compare_dicts of two lists of the scale number of pods, which differ in
+    one pod
+    """
+    from ocs_ci.utility.environment_check import compare_dicts
+
+    before = [get_pod_dict(index) for index in range(scale)]
+    after = before[1:] + [get_pod_dict(scale)]
+    compare_dicts(before, after)
+
+
+def bench_config_access(scale, list_file):
+    """
+    100 * scale accesses of the MultiClusterConfig sections
+    """
+    from ocs_ci.framework import config
+
+    for _ in range(100 * scale):
+        config.ENV_DATA.get("cluster_namespace")
+        config.RUN.get("kubeconfig")
+
+
+BENCHMARKS = {
+    "exec_cmd": bench_exec_cmd,
+    "ocp_get": bench_ocp_get,
+    "ocp_wait_for_resource": bench_ocp_wait_for_resource,
+    "get_all_pods": bench_get_all_pods,
+    "load_yaml": bench_load_yaml,
+    "compare_dicts": bench_compare_dicts,
+    "config_access": bench_config_access,
+}
+
+
+def measure(func, rounds, *args):
+    """
+    Measure duration of the function, after one warm-up round
+
+    Args:
+        func (function): The function to measure
+        rounds (int): Number of the measured rounds
+        args: Arguments for the function
+
+    Returns:
+        dict: Rounds, min, median, mean and standard deviation in seconds
+
+    """
+    func(*args)
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(*args)
+        durations.append(time.perf_counter() - start)
+    return {
+        "rounds": rounds,
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.mean(durations),
+        "stdev": statistics.stdev(durations) if rounds > 1 else 0,
+    }
+
+
+def run_benchmarks(scales=DEFAULT_SCALES, rounds=DEFAULT_ROUNDS, names=None):
+    """
+    Run the benchmarks at all the scales
+
+    Args:
+        scales (list): Numbers of the objects to run the benchmarks with
+        rounds (int): Number of the measured rounds of every benchmark
+        names (list): Names of the benchmarks to run, None for all
+
+    Returns:
+        dict: Environment info and results by the benchmark name and scale
+
+    """
+    names = names or list(BENCHMARKS)
+    results = {name: {} for name in names}
+    # The benchmarks measure the framework overhead, not the logging
+    logging.disable(logging.INFO)
+    try:
+        for scale in scales:
+            with fake_oc_environment(scale) as list_file:
+                for name in names:
+                    stats = measure(BENCHMARKS[name], rounds, scale, list_file)
+                    results[name][str(scale)] = stats
+                    print(
+                        f"{name:<24} scale {scale:>6}: median "
+                        f"{stats['median'] * 1000:10.2f} ms"
+                    )
+    finally:
+        logging.disable(logging.NOTSET)
+    return {
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare the benchmark results with the baseline
+
+    Args:
+        baseline (dict): Results of the baseline run
+        current (dict): Results of the current run
+        threshold (float): Allowed relative growth of the median
+
+    Returns:
+        list: Regressions - dicts with the benchmark name, scale, baseline
+            and current median and the relative change
+
+    """
+    regressions = []
+    for name, scales in current["results"].items():
+        for scale, stats in scales.items():
+            baseline_stats = baseline["results"].get(name, {}).get(scale)
+            if not baseline_stats or not baseline_stats["median"]:
+                continue
+            change = stats["median"] / baseline_stats["median"] - 1
+            if change > threshold:
+                regressions.append(
+                    {
+                        "name": name,
+                        "scale": scale,
+                        "baseline": baseline_stats["median"],
+                        "current": stats["median"],
+                        "change": change,
+                    }
+                )
+    return regressions
+
+
+def main(argv=None):
+    """
+    Run the microbenchmarks, save the results and compare them with the
+    baseline
+
+    Args:
+        argv (list): Command line arguments, None for sys.argv
+
+    Returns:
+        int: 1 if a regression against the baseline was found, 0 otherwise
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=list(BENCHMARKS),
+        help="Benchmark to run, can be repeated, all by default",
+    )
+    parser.add_argument("--output", help="JSON file to save the results to")
+    parser.add_argument("--baseline", help="JSON file with the baseline results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative growth of the median against the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scales, args.rounds, args.benchmark)
+    if args.output:
+        with open(args.output, "w") as fd:
+            json.dump(results, fd, indent=2)
+        print(f"Results saved to {args.output}")
+    if args.baseline:
+        with open(args.baseline) as fd:
+            baseline = json.load(fd)
+        regressions = compare_results(baseline, results, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['name']} scale {regression['scale']}: "
+                f"{regression['baseline'] * 1000:.2f} ms -> "
+                f"{regression['current'] * 1000:.2f} ms "
+                f"(+{regression['change']:.0%})"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -43,6 +43,10 @@ from it to compare between results.
 
         but in the dashboard all those tests (4 in the FIO example) are displayed as single test
 
+    The IDs of the indexing tables and of the builds are loaded once per
+    session (one query per table) and cached, new values are added to the cache
+    when they are inserted.
+
 """
 
 # Builtin modules
@@ -63,15 +67,31 @@ class PerfDash(object):
     The API class to connect and managing the performance dashboard database
     """
 
-    def __init__(self):
+    def __init__(self, cnx=None, placeholder="%s"):
         """
         Initializing the dashboard object and make a connection
 
+        Args:
+            cnx (obj): An already opened DB-API connection to the dashboard DB
+                (e.g. sqlite3 connection for testing), if not provided the
+                connection is created from the AUTH:perf_dashboard credentials
+            placeholder (str): Parameter placeholder of the DB driver, '%s' for
+                mysql.connector, '?' for sqlite3
+
         Raise:
             if credential file can not be open / read
             if the connection failed
 
         """
+        self.placeholder = placeholder
+        # Cache of the IDs - {table: {name: id}}, for the builds table the
+        # name is a tuple of (version id, build name)
+        self.ids_cache = {}
+        if cnx is not None:
+            self.creds = {}
+            self.cnx = cnx
+            self.cursor = self.cnx.cursor()
+            return
 
         # Reading connection information and credentials from local file
         # which is not stored in the GitHub repository
@@ -104,24 +124,68 @@ class PerfDash(object):
             log.error(f"Can not connect to DB - [{err}]")
             raise err
 
-    def _run_query(self, query=None):
+    def _run_query(self, query=None, params=None):
         """
         Run an SQL Query
 
         Args:
             query (str): sql query string
+            params (tuple): parameters of the query
 
         Returns:
             bool: True if succeed, otherwise False
         """
-        log.debug(f"Try to Execute query : {query}")
+        log.debug(f"Try to Execute query : {query} {params or ''}")
         try:
-            self.cursor.execute(query)
+            if params is None:
+                self.cursor.execute(query)
+            else:
+                self.cursor.execute(query, params)
             return True
         except Exception as err:
             log.error(f"Can not execute [{query}]\n{err}")
             return False
 
+    def load_ids(self, table):
+        """
+        Load all the IDs of the table into the cache, in one query
+
+        Args:
+            table (str): The table to load the IDs from
+
+        Returns:
+            dict : the IDs of the table as {name: id}
+
+        """
+        ids = {}
+        if table == "builds":
+            query = "SELECT id, version, name FROM builds ;"
+            if self._run_query(query=query):
+                for rec_id, ver_id, name in self.cursor:
+                    ids[(ver_id, name)] = rec_id
+        else:
+            query = f"SELECT id, name FROM {table} ;"
+            if self._run_query(query=query):
+                for rec_id, name in self.cursor:
+                    ids[name] = rec_id
+        self.ids_cache[table] = ids
+        return ids
+
+    def get_ids(self, table):
+        """
+        Get the cached IDs of the table, load them on the first call
+
+        Args:
+            table (str): The table to get the IDs of
+
+        Returns:
+            dict : the IDs of the table as {name: id}
+
+        """
+        if table not in self.ids_cache:
+            return self.load_ids(table)
+        return self.ids_cache[table]
+
     def get_id_by_name(self, table=None, name=None):
         """
         Query the ID of specific 'name' value from selected table
@@ -134,13 +198,7 @@ class PerfDash(object):
              int : the value of the ID field in the table, otherwise None
 
         """
-        query = f"SELECT id FROM {table} WHERE name = '{name}' ;"
-        if self._run_query(query=query):
-            for result_id in self.cursor:
-                # The query return a tuple and we need only the firs element
-                return result_id[0]
-
-        return None
+        return self.get_ids(table).get(name)
 
     def get_name_by_id(self, table=None, recid=None):
         """
@@ -162,13 +220,15 @@ class PerfDash(object):
 
         return None
 
-    def insert_single_value(self, table=None, value=None):
+    def insert_single_value(self, table=None, value=None, commit=True):
         """
         Insert a value to 'table' and return it's ID
 
         Args:
             table (str): The table to insert data into
             value (str): The value to insert
+            commit (bool): True for committing the insert, False for leaving
+                it to be committed with the following inserts
 
         Returns:
              int : the ID of the value in the table, otherwise None
@@ -179,17 +239,23 @@ class PerfDash(object):
         if record_id is not None:
             return record_id
 
-        query = f"INSERT INTO {table} (name) VALUES ('{value}') ;"
-        if self._run_query(query=query):
+        query = f"INSERT INTO {table} (name) VALUES ({self.placeholder}) ;"
+        if self._run_query(query=query, params=(value,)):
             try:
                 rec_id = self.cursor.lastrowid
-                # Make sure data is committed to the database
-                self.cnx.commit()
+                if commit:
+                    # Make sure data is committed to the database
+                    self.cnx.commit()
+                self.ids_cache[table][value] = rec_id
                 return rec_id
             except Exception as err:
                 log.error(f"Can not insert {value} into {table} - [{err}]")
                 return None
 
+        # The value could be inserted by another session after the IDs of
+        # the table were loaded
+        return self.load_ids(table).get(value)
+
     def get_version_id(self, version=None):
         """
         Query of the ID of version number in the DB
@@ -309,11 +375,11 @@ class PerfDash(object):
         if ver_id is None:
             return None
 
-        results = {}
-        query = f"SELECT id, name FROM builds WHERE version = {ver_id} ;"
-        if self._run_query(query=query):
-            for build_id, name in self.cursor:
-                results[name] = build_id
+        results = {
+            name: build_id
+            for (build_ver_id, name), build_id in self.get_ids("builds").items()
+            if build_ver_id == ver_id
+        }
 
         return None if results == {} else results
 
@@ -330,18 +396,20 @@ class PerfDash(object):
             int : the build ID
 
         """
-        all_builds = self.get_version_builds(version=version)
-        if all_builds:
-            return all_builds.get(build)
-        return None
+        ver_id = self.get_version_id(version)
+        if ver_id is None:
+            return None
+        return self.get_ids("builds").get((ver_id, build))
 
-    def insert_build(self, version, build):
+    def insert_build(self, version, build, commit=True):
         """
         Insert a new build to the DB and return it's ID
 
         Args:
             version (str): The version number as string (e.g. 4.9.0)
             build (str): The build number (e.g. 180 / RC1-200 / GA)
+            commit (bool): True for committing the insert, False for leaving
+                it to be committed with the following inserts
 
         Returns:
              int : the ID of the build in the DB, otherwise None
@@ -354,20 +422,31 @@ class PerfDash(object):
 
         # Try to insert the version into the DB, it will not be inserted twice,
         # If the version is exists in the DB it will just return the id of it.
-        ver_id = self.insert_single_value(table="versions", value=version)
+        ver_id = self.insert_single_value(
+            table="versions", value=version, commit=commit
+        )
 
-        query = f"INSERT INTO builds (version, name) VALUES ({ver_id}, '{build}') ;"
-        if self._run_query(query=query):
+        query = (
+            f"INSERT INTO builds (version, name) VALUES "
+            f"({self.placeholder}, {self.placeholder}) ;"
+        )
+        if self._run_query(query=query, params=(ver_id, build)):
             # Insert the data
             try:
                 rec_id = self.cursor.lastrowid
-                # Make sure data is committed to the database
-                self.cnx.commit()
+                if commit:
+                    # Make sure data is committed to the database
+                    self.cnx.commit()
+                self.ids_cache["builds"][(ver_id, build)] = rec_id
                 return rec_id
             except Exception as err:
                 log.error(f"Can not insert {version}-{build} into builds - [{err}]")
                 return None
 
+        # The build could be inserted by another session after the IDs of
+        # the builds were loaded
+        return self.load_ids("builds").get((ver_id, build))
+
     def get_results(self, version, build, platform, topology, test):
         """
         Getting the results information (es_link, log_file) for all test samples
@@ -458,20 +537,20 @@ class PerfDash(object):
         if test_id is None:
             return 0
 
-        results = []
+        max_sample = None
         query = (
-            f"SELECT sample FROM results WHERE version = {ver_id} AND "
+            f"SELECT MAX(sample) FROM results WHERE version = {ver_id} AND "
             f"build = {build_id} AND platform = {platform_id} AND "
             f"az_topology = {topology_id} AND test_name = {test_id} ;"
         )
         if self._run_query(query=query):
             for sample in self.cursor:
-                results.append(sample[0])
+                max_sample = sample[0]
 
-        if len(results) == 0:
+        if max_sample is None:
             return 0
         else:
-            return max(results) + 1
+            return max_sample + 1
 
     def add_results(self, version, build, platform, topology, test, eslink, logfile):
         """
@@ -490,35 +569,57 @@ class PerfDash(object):
              bool : True if the operation succeed otherwise False
 
         """
-        ver_id = self.get_version_id(version=version)
+        return self.add_results_batch(
+            version=version,
+            build=build,
+            platform=platform,
+            topology=topology,
+            test=test,
+            results=[(eslink, logfile)],
+        )
+
+    def add_results_batch(self, version, build, platform, topology, test, results):
+        """
+        Adding information of several results of the same test into the DB,
+        as consecutive samples, with one commit.
+
+        Args:
+            version (str): The version number (e.g. 4.9.0)
+            build (str): The build number (e.g. RC5-180)
+            platform (str): The platform (e.g.  Bare-Metal)
+            topology (str): The topology (e.g. 3-AZ)
+            test (str): The test name (e.g. SmallFiles)
+            results (list): List of (eslink, logfile) tuples - the
+                elasticsearch link(s) to the results and the link to the test
+                log file
+
+        Returns:
+             bool : True if the operation succeed otherwise False
+
+        """
+        ver_id = self.insert_single_value(table="versions", value=version, commit=False)
         if ver_id is None:
-            ver_id = self.insert_single_value(table="versions", value=version)
-            if ver_id is None:
-                return False
+            return False
 
-        build_id = self.get_build_id(version=version, build=build)
+        build_id = self.insert_build(version=version, build=build, commit=False)
         if build_id is None:
-            build_id = self.insert_build(version=version, build=build)
-            if build_id is None:
-                return False
+            return False
 
-        platform_id = self.get_platform_id(platform)
+        platform_id = self.insert_single_value(
+            table="platform", value=platform, commit=False
+        )
         if platform_id is None:
-            platform_id = self.insert_single_value(table="platform", value=platform)
-            if platform_id is None:
-                return False
+            return False
 
-        topology_id = self.get_topology_id(topology)
+        topology_id = self.insert_single_value(
+            table="az_topology", value=topology, commit=False
+        )
         if topology_id is None:
-            topology_id = self.insert_single_value(table="az_topology", value=topology)
-            if topology_id is None:
-                return False
+            return False
 
-        test_id = self.get_test_id(test)
+        test_id = self.insert_single_value(table="tests", value=test, commit=False)
         if test_id is None:
-            test_id = self.insert_single_value(table="tests", value=test)
-            if test_id is None:
-                return False
+            return False
 
         sample = self.get_next_sample(
             version=version,
@@ -528,21 +629,39 @@ class PerfDash(object):
             test=test,
         )
 
+        placeholders = ", ".join([self.placeholder] * 8)
         query = (
             f"INSERT INTO results "
             "(sample, version, build, platform, az_topology, test_name, es_link, log_file) "
-            f"VALUES ({sample}, {ver_id}, {build_id}, {platform_id}, {topology_id}, "
-            f"{test_id}, '{eslink}', '{logfile}') ;"
+            f"VALUES ({placeholders}) ;"
         )
-        if self._run_query(query=query):
-            try:
-                # Make sure data is committed to the database
-                self.cnx.commit()
-                log.info("Test results pushed to the DB!")
-                return True
-            except Exception as err:
-                log.error(f"Can not insert result into the DB - [{err}]")
-                return False
+        rows = [
+            (
+                sample + num,
+                ver_id,
+                build_id,
+                platform_id,
+                topology_id,
+                test_id,
+                # The links are stored as text, missing log file as 'None'
+                str(eslink),
+                str(logfile),
+            )
+            for num, (eslink, logfile) in enumerate(results)
+        ]
+        log.debug(f"Try to Execute query : {query} for {len(rows)} results")
+        try:
+            self.cursor.executemany(query, rows)
+            # Make sure data is committed to the database
+            self.cnx.commit()
+            log.info(f"{len(rows)} test results pushed to the DB!")
+            return True
+        except Exception as err:
+            log.error(f"Can not insert results into the DB - [{err}]")
+            self.cnx.rollback()
+            # The rolled back dimension values may be cached
+            self.ids_cache = {}
+            return False
 
     def cleanup(self):
         """
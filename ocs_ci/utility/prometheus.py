@@ -12,6 +12,7 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants, defaults
 from ocs_ci.ocs.exceptions import AlertingError, AuthError, NoThreadingLockUsedError
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.executor import config_context, get_config_index
 from ocs_ci.utility.ssl_certs import get_root_ca_cert
 from ocs_ci.utility.utils import TimeoutIterator
 
@@ -1003,6 +1004,8 @@ class PrometheusAlertSubscriber(Timer):
 
     def __init__(self, threading_lock, interval: float):
         self.prometheus_api = PrometheusAPI(threading_lock=threading_lock)
+        # Log alerts of the cluster of the config context in which it was created
+        self.config_index = get_config_index()
         super().__init__(
             interval,
             lambda: self.prometheus_api.prometheus_log(self.prometheus_alert_list),
@@ -1014,8 +1017,9 @@ class PrometheusAlertSubscriber(Timer):
 
         ! This method is called by Timer class, do not call it directly !
         """
-        while not self.finished.wait(self.interval):
-            self.function(*self.args, **self.kwargs)
+        with config_context(self.config_index):
+            while not self.finished.wait(self.interval):
+                self.function(*self.args, **self.kwargs)
 
     def get_alerts(self):
         """
@@ -1,9 +1,252 @@
+"""
+Retry decorators.
+
+Besides the exponential back-off, the retry decorator supports:
+
+* full jitter - the sleep before each retry is a random value between zero
+  and the back-off delay, so parallel workers failing at the same time don't
+  retry in lockstep (RUN['retry']['jitter'] or the jitter parameter)
+* retry budget - a circuit breaker per cluster (config index). When too many
+  calls fail because the API server is unavailable or throttles the requests
+  within a time window, retries of such failures are short-circuited until
+  a cool down passes (RUN['retry']['budget_enabled'])
+* metrics - number of retries, sleep time and short-circuited retries per
+  call site, see retry_stats
+
+Time is taken from the module level clock, which tests replace with a fake
+one.
+"""
+
 import logging
+import random
+import threading
 import time
+from collections import defaultdict, deque
 from functools import wraps
 
+from ocs_ci.utility.tracing import get_call_site
+
 logger = logging.getLogger(__name__)
 
+# Messages of errors returned when the API server is not reachable
+API_SERVER_UNAVAILABLE_ERRORS = (
+    "Unable to connect to the server",
+    "connection refused",
+    "client connection lost",
+    "TLS handshake timeout",
+    "i/o timeout",
+    "http2: server sent GOAWAY",
+)
+
+
+class Clock(object):
+    """
+    Source of time and sleeping of the retries
+    """
+
+    def time(self):
+        """
+        Returns:
+            float: Monotonic time in seconds
+
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        """
+        Args:
+            seconds (float): Time to sleep in seconds
+
+        """
+        time.sleep(seconds)
+
+
+clock = Clock()
+
+
+class RetryBudget(object):
+    """
+    Circuit breaker of retries of calls failing because the API server is
+    unhealthy. After max_failures such failures within window seconds the
+    budget is exhausted (the circuit is open) for cooldown seconds, then
+    retries are allowed again. A call which succeeds after retries closes the
+    circuit.
+    """
+
+    def __init__(self, max_failures=20, window=60, cooldown=30):
+        """
+        Constructor of RetryBudget
+
+        Args:
+            max_failures (int): Number of failures which open the circuit
+            window (int): Time window of the failures in seconds
+            cooldown (int): Time in seconds for which the circuit stays open
+
+        """
+        self.max_failures = max_failures
+        self.window = window
+        self.cooldown = cooldown
+        self._failures = deque()
+        self._open_until = 0
+        self._lock = threading.Lock()
+
+    def record_failure(self):
+        """
+        Record failure of a call, opens the circuit if the budget is exhausted
+        """
+        now = clock.time()
+        with self._lock:
+            self._failures.append(now)
+            while self._failures and self._failures[0] < now - self.window:
+                self._failures.popleft()
+            if len(self._failures) >= self.max_failures and not self.is_open():
+                logger.warning(
+                    f"{len(self._failures)} calls failed on unavailable API server "
+                    f"in {self.window}s, not retrying them for {self.cooldown}s"
+                )
+                self._open_until = now + self.cooldown
+                self._failures.clear()
+
+    def record_success(self):
+        """
+        Record success of a retried call, closes the circuit
+        """
+        with self._lock:
+            self._failures.clear()
+            self._open_until = 0
+
+    def is_open(self):
+        """
+        Returns:
+            bool: True if the retries are short-circuited
+
+        """
+        return clock.time() < self._open_until
+
+
+class RetryStats(object):
+    """
+    Counters of the retries per call site
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.call_sites = defaultdict(
+            lambda: {"retries": 0, "sleep_time": 0, "short_circuited": 0}
+        )
+
+    def reset(self):
+        """
+        Remove all the counters
+        """
+        with self._lock:
+            self.call_sites.clear()
+
+    def record_retry(self, call_site, sleep_time):
+        """
+        Args:
+            call_site (str): Call site of the retried function
+            sleep_time (float): Sleep before the retry in seconds
+
+        """
+        with self._lock:
+            self.call_sites[call_site]["retries"] += 1
+            self.call_sites[call_site]["sleep_time"] += sleep_time
+
+    def record_short_circuit(self, call_site):
+        """
+        Args:
+            call_site (str): Call site of the function which wasn't retried
+
+        """
+        with self._lock:
+            self.call_sites[call_site]["short_circuited"] += 1
+
+    def get_summary(self):
+        """
+        Returns:
+            dict: Call site to its counters, sorted by the number of retries
+
+        """
+        with self._lock:
+            call_sites = {name: dict(site) for name, site in self.call_sites.items()}
+        return dict(
+            sorted(
+                call_sites.items(), key=lambda item: item[1]["retries"], reverse=True
+            )
+        )
+
+
+retry_stats = RetryStats()
+
+# Config index of the cluster to its RetryBudget
+_retry_budgets = {}
+_retry_budgets_lock = threading.Lock()
+
+
+def get_retry_settings():
+    """
+    Returns:
+        dict: The RUN['retry'] section of the configuration
+
+    """
+    from ocs_ci.framework import config
+
+    return config.RUN.get("retry") or {}
+
+
+def get_retry_budget(settings):
+    """
+    Get retry budget of the cluster of the current thread
+
+    Args:
+        settings (dict): The RUN['retry'] section of the configuration
+
+    Returns:
+        RetryBudget: The budget, None if the budget is disabled
+
+    """
+    if not settings.get("budget_enabled"):
+        return None
+    from ocs_ci.utility.executor import get_config_index
+
+    config_index = get_config_index()
+    with _retry_budgets_lock:
+        if config_index not in _retry_budgets:
+            _retry_budgets[config_index] = RetryBudget(
+                max_failures=settings.get("budget_max_failures", 20),
+                window=settings.get("budget_window", 60),
+                cooldown=settings.get("budget_cooldown", 30),
+            )
+        return _retry_budgets[config_index]
+
+
+def reset_retry_budgets():
+    """
+    Remove the retry budgets of all the clusters
+    """
+    with _retry_budgets_lock:
+        _retry_budgets.clear()
+
+
+def is_api_server_error(exception):
+    """
+    Check if the exception was caused by unavailable or overloaded API server
+
+    Args:
+        exception (Exception): The exception to check
+
+    Returns:
+        bool: True if the API server is unhealthy, False otherwise
+
+    """
+    from ocs_ci.utility.executor import is_throttling_error
+
+    message = str(exception)
+    return is_throttling_error(exception) or any(
+        error in message for error in API_SERVER_UNAVAILABLE_ERRORS
+    )
+
 
 def validate_retry_params(tries, delay, backoff, max_timeout, max_delay):
     """
@@ -42,6 +285,7 @@ def retry(
     func=None,
     max_timeout=14400,
     max_delay=600,
+    jitter=None,
 ):
     """
     Retry calling the decorated function using exponential backoff, with a maximum timeout and maximum delay.
@@ -56,6 +300,8 @@ def retry(
         func: Function for garbage collector.
         max_timeout: Maximum total time for retries in seconds (default: 4 hours).
         max_delay: Maximum delay between retries in seconds (default: 600 seconds or 10 minutes).
+        jitter: True to sleep a random time between zero and the delay before each retry (full jitter),
+            if not set RUN['retry']['jitter'] is used.
     """
     # Validate parameters before proceeding
     validate_retry_params(tries, delay, backoff, max_timeout, max_delay)
@@ -76,7 +322,12 @@ def retry(
                 try:
                     if func is not None:
                         func()
-                    return f(*args, **kwargs)
+                    result = f(*args, **kwargs)
+                    if attempts > 1:
+                        budget = get_retry_budget(get_retry_settings())
+                        if budget:
+                            budget.record_success()
+                    return result
                 except exception_to_check as e:
                     if text_in_exception:
                         if text_in_exception in str(e):
@@ -86,8 +337,22 @@ def retry(
                         else:
                             raise
                     exception_summary.add(repr(e))
-                    logger.info(f"Retrying in {mdelay} seconds...")
-                    time.sleep(mdelay)
+                    settings = get_retry_settings()
+                    call_site = get_call_site()
+                    budget = get_retry_budget(settings)
+                    if budget and is_api_server_error(e):
+                        budget.record_failure()
+                        if budget.is_open():
+                            retry_stats.record_short_circuit(call_site)
+                            logger.warning(
+                                f"Retry budget exhausted, not retrying {f.__name__}: {e}"
+                            )
+                            raise
+                    use_jitter = settings.get("jitter") if jitter is None else jitter
+                    sleep_time = random.uniform(0, mdelay) if use_jitter else mdelay
+                    retry_stats.record_retry(call_site, sleep_time)
+                    logger.info(f"Retrying in {sleep_time:g} seconds...")
+                    clock.sleep(sleep_time)
                     mtries -= 1
                     mdelay = min(
                         mdelay * backoff, max_delay
@@ -0,0 +1,222 @@
+# -*- coding: utf8 -*-
+
+import threading
+import time
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.parallel import parallel
+from ocs_ci.utility.executor import (
+    BoundedExecutor,
+    config_context,
+    is_throttling_error,
+)
+from ocs_ci.utility.utils import exec_cmd
+
+
+class ConcurrencyTracker(object):
+    """
+    Callable which records the maximum number of its concurrent calls.
+    """
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, item=None):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.duration)
+        with self.lock:
+            self.running -= 1
+        return item
+
+
+def timed_exec_cmd(cmd):
+    """
+    Run exec_cmd and return the time interval of its execution.
+    """
+    start = time.time()
+    exec_cmd(cmd)
+    return start, time.time()
+
+
+def assert_intervals_overlap(intervals, duration):
+    """
+    Check that all the time intervals overlap, i.e. the calls ran in parallel.
+    """
+    assert len(intervals) > 1
+    assert max(start for start, _ in intervals) < min(end for _, end in intervals)
+    total = max(end for _, end in intervals) - min(start for start, _ in intervals)
+    assert total < duration * len(intervals) / 2
+
+
+def test_is_throttling_error():
+    """
+    Check that API server throttling errors are recognized.
+    """
+    assert is_throttling_error(
+        CommandFailed("Error from server (TooManyRequests): please try again later")
+    )
+    assert is_throttling_error(CommandFailed("etcdserver: request timed out"))
+    assert not is_throttling_error(CommandFailed("Error from server (NotFound)"))
+
+
+def test_executor_verb_limit():
+    """
+    Check that tasks of one verb do not exceed the per verb limit, and that
+    results are returned in order of the items.
+    """
+    executor = BoundedExecutor(max_workers=8, max_workers_per_verb={"create": 2})
+    tracker = ConcurrencyTracker()
+    assert executor.map(tracker, range(8), verb="create") == list(range(8))
+    assert tracker.max_running == 2
+    progress = executor.get_progress()
+    assert progress["submitted"] == progress["completed"] == 8
+    assert progress["running"] == 0
+    executor.shutdown()
+
+
+def test_executor_cluster_limit():
+    """
+    Check that tasks of one cluster do not exceed the per cluster limit.
+    """
+    executor = BoundedExecutor(max_workers=8, max_workers_per_cluster=3)
+    tracker = ConcurrencyTracker()
+    executor.map(tracker, range(9))
+    assert tracker.max_running == 3
+    executor.shutdown()
+
+
+def test_executor_verb_limit_does_not_hold_cluster_slot():
+    """
+    Tasks waiting for a saturated verb limit don't block tasks of other verbs
+    on the same cluster.
+    """
+    executor = BoundedExecutor(
+        max_workers=8, max_workers_per_cluster=2, max_workers_per_verb={"delete": 1}
+    )
+    release = threading.Event()
+    blocked = [executor.submit(release.wait, 10, verb="delete") for _ in range(3)]
+    time.sleep(0.1)
+    assert (
+        executor.submit(lambda: "created", verb="create").result(timeout=5) == "created"
+    )
+    release.set()
+    for future in blocked:
+        future.result(timeout=5)
+    executor.shutdown()
+
+
+def test_executor_retries_throttled_task():
+    """
+    Check that throttled tasks are retried after back-off and that other
+    failures are raised.
+    """
+    executor = BoundedExecutor(throttling_backoff=0.01, throttling_max_backoff=0.05)
+    attempts = []
+
+    def throttled_twice():
+        attempts.append(time.time())
+        if len(attempts) <= 2:
+            raise CommandFailed("Error from server (TooManyRequests)")
+        return "done"
+
+    assert executor.submit(throttled_twice).result() == "done"
+    assert len(attempts) == 3
+    assert attempts[1] - attempts[0] >= 0.01
+
+    def not_found():
+        raise CommandFailed("Error from server (NotFound)")
+
+    with pytest.raises(CommandFailed):
+        executor.submit(not_found).result()
+    progress = executor.get_progress()
+    assert progress["throttled"] == 2
+    assert progress["failed"] == 1
+    executor.shutdown()
+
+
+def test_executor_gives_up_after_max_retries():
+    """
+    Check that a task throttled more times than allowed fails.
+    """
+    executor = BoundedExecutor(
+        throttling_max_retries=1, throttling_backoff=0.01, throttling_max_backoff=0.01
+    )
+
+    def always_throttled():
+        raise CommandFailed("etcdserver: too many requests")
+
+    with pytest.raises(CommandFailed):
+        executor.submit(always_throttled).result()
+    assert executor.get_progress()["throttled"] == 1
+    executor.shutdown()
+
+
+def test_executor_propagates_config_index():
+    """
+    Check that tasks run with the config index of the submitting thread.
+    """
+    executor = BoundedExecutor()
+
+    def get_index():
+        return getattr(config.thread_local_data, "config_index", None)
+
+    assert executor.submit(get_index).result() == config.cur_index
+    executor.shutdown()
+
+
+def test_executor_config_context_nesting():
+    """
+    Check that config_context restores the previous config index.
+    """
+    with config_context(5):
+        with config_context(7):
+            assert config.thread_local_data.config_index == 7
+        assert config.thread_local_data.config_index == 5
+    assert not hasattr(config.thread_local_data, "config_index")
+
+
+def test_executor_blocking_exec_cmd_overlap():
+    """
+    Check that blocking exec_cmd calls submitted to the executor run
+    concurrently.
+    """
+    executor = BoundedExecutor(max_workers=4)
+    intervals = executor.map(timed_exec_cmd, ["sleep 0.5"] * 4)
+    assert_intervals_overlap(intervals, 0.5)
+    executor.shutdown()
+
+
+def test_parallel_blocking_exec_cmd_overlap():
+    """
+    Check that blocking exec_cmd calls spawned by parallel run concurrently.
+    """
+    with parallel() as p:
+        for _ in range(4):
+            p.spawn(timed_exec_cmd, "sleep 0.5")
+        intervals = list(p)
+    assert_intervals_overlap(intervals, 0.5)
+
+
+def test_parallel_raises_exception():
+    """
+    Check that exception of a spawned function is raised at the end of the
+    with block, after all the other functions completed.
+    """
+    results = []
+
+    def failing():
+        raise CommandFailed("failed")
+
+    with pytest.raises(CommandFailed):
+        with parallel() as p:
+            p.spawn(failing)
+            p.spawn(lambda: results.append(time.sleep(0.1)))
+    assert results == [None]
@@ -0,0 +1,42 @@
+# -*- coding: utf8 -*-
+
+import json
+
+from ocs_ci.framework import config
+from ocs_ci.utility import microbenchmarks
+
+
+def test_run_benchmarks():
+    """
+    All the benchmarks run with the fake oc and config is restored.
+    """
+    env_data = dict(config.ENV_DATA)
+    results = microbenchmarks.run_benchmarks(scales=[3], rounds=2)
+    assert set(results["results"]) == set(microbenchmarks.BENCHMARKS)
+    for stats in results["results"].values():
+        assert stats["3"]["rounds"] == 2
+        assert 0 < stats["3"]["min"] <= stats["3"]["median"]
+    assert config.ENV_DATA == env_data
+
+
+def test_compare_results(tmp_path, capsys):
+    """
+    Growth of the median over the threshold is reported as regression.
+    """
+    baseline = {
+        "results": {
+            "load_yaml": {"3": {"median": 1e-9}},
+            "compare_dicts": {"3": {"median": 1000}},
+        }
+    }
+    baseline_file = tmp_path / "baseline.json"
+    baseline_file.write_text(json.dumps(baseline))
+    output_file = tmp_path / "current.json"
+    argv = ["--scales", "3", "--rounds", "1", "--output", str(output_file)]
+    argv += ["--benchmark", "load_yaml", "--benchmark", "compare_dicts"]
+    assert microbenchmarks.main(argv + ["--baseline", str(baseline_file)]) == 1
+    assert "REGRESSION load_yaml scale 3" in capsys.readouterr().out
+    current = json.loads(output_file.read_text())
+    regressions = microbenchmarks.compare_results(baseline, current)
+    assert [r["name"] for r in regressions] == ["load_yaml"]
+    assert microbenchmarks.compare_results(current, current) == []
@@ -0,0 +1,85 @@
+# -*- coding: utf8 -*-
+
+import sqlite3
+
+import pytest
+
+from ocs_ci.utility.perf_dash.dashboard_api import PerfDash
+
+SCHEMA = """
+CREATE TABLE versions (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE platform (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE az_topology (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE tests (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE builds (id INTEGER PRIMARY KEY, version INTEGER, name TEXT);
+CREATE TABLE results (
+    id INTEGER PRIMARY KEY, sample INTEGER, version INTEGER, build INTEGER,
+    platform INTEGER, az_topology INTEGER, test_name INTEGER,
+    es_link TEXT, log_file TEXT
+);
+INSERT INTO versions (name) VALUES ('4.18.0');
+INSERT INTO builds (version, name) VALUES (1, 'GA');
+"""
+
+
+@pytest.fixture
+def dashboard(tmp_path):
+    """
+    PerfDash connected to a local SQLite DB with the dashboard schema, and
+    the list of queries executed on the DB.
+    """
+    cnx = sqlite3.connect(str(tmp_path / "perf_dash.db"))
+    cnx.executescript(SCHEMA)
+    queries = []
+    cnx.set_trace_callback(queries.append)
+    yield PerfDash(cnx=cnx, placeholder="?"), queries
+    cnx.close()
+
+
+def test_add_results_caches_ids(dashboard):
+    """
+    IDs are loaded once per table and new dimension values are inserted.
+    """
+    db, queries = dashboard
+    args = dict(
+        version="4.18.0", build="GA", platform="AWS", topology="3-AZ", test="FIO"
+    )
+    assert db.add_results(eslink="http://es/1", logfile=None, **args)
+    selects = [query for query in queries if query.startswith("SELECT id")]
+    assert len(selects) == 5
+    queries.clear()
+
+    assert db.add_results(eslink="http://es/2", logfile="log", **args)
+    assert not [query for query in queries if query.startswith("SELECT id")]
+    assert db.get_results(**args) == {
+        0: {"eslink": "http://es/1", "log": "None"},
+        1: {"eslink": "http://es/2", "log": "log"},
+    }
+    assert db.get_build_id("4.18.0", "GA") == 1
+    assert db.get_version_builds("4.18.0") == {"GA": 1}
+
+
+def test_add_results_batch(dashboard):
+    """
+    Batch of results is inserted as consecutive samples with one commit.
+    """
+    db, queries = dashboard
+    args = dict(
+        version="4.19.0", build="RC1", platform="VSPHERE", topology="1-AZ", test="SF"
+    )
+    results = [(f"http://es/{num}", f"log{num}") for num in range(5)]
+    assert db.add_results_batch(results=results, **args)
+    assert len([query for query in queries if query == "COMMIT"]) == 1
+    assert db.get_next_sample(**args) == 5
+    assert sorted(db.get_results(**args)) == list(range(5))
+    assert db.get_id_by_name("builds", (db.get_version_id("4.19.0"), "RC1"))
+
+
+def test_insert_value_added_by_other_session(dashboard):
+    """
+    Value inserted by another session after the IDs were cached is found.
+    """
+    db, _ = dashboard
+    assert db.get_platform_id("AWS") is None
+    db.cnx.execute("INSERT INTO platform (name) VALUES ('AWS')")
+    assert db.insert_single_value(table="platform", value="AWS") == 1
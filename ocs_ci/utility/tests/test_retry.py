@@ -0,0 +1,112 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility import retry as retry_module
+from ocs_ci.utility.retry import retry
+
+
+class FakeClock(object):
+    """
+    Clock which doesn't sleep, only moves the time and records the sleeps.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(retry_module, "clock", clock)
+    retry_module.retry_stats.reset()
+    retry_module.reset_retry_budgets()
+    yield clock
+    retry_module.reset_retry_budgets()
+
+
+def get_failing_func(failures, message="connection refused"):
+    """
+    Get function failing the number of times before it succeeds.
+    """
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise CommandFailed(message)
+        return "done"
+
+    func.calls = calls
+    return func
+
+
+def test_exponential_backoff(fake_clock, monkeypatch):
+    monkeypatch.setitem(config.RUN, "retry", {"jitter": False})
+    func = get_failing_func(3)
+    assert retry(CommandFailed, tries=5, delay=2, backoff=2)(func)() == "done"
+    assert fake_clock.sleeps == [2, 4, 8]
+    summary = retry_module.retry_stats.get_summary()
+    (site,) = summary.values()
+    assert site["retries"] == 3
+    assert site["sleep_time"] == 14
+
+
+def test_full_jitter(fake_clock, monkeypatch):
+    monkeypatch.setitem(config.RUN, "retry", {"jitter": True})
+    monkeypatch.setattr(
+        retry_module.random, "uniform", lambda low, high: (low + high) / 2
+    )
+    func = get_failing_func(3)
+    retry(CommandFailed, tries=5, delay=2, backoff=2)(func)()
+    assert fake_clock.sleeps == [1, 2, 4]
+    # Explicit parameter takes precedence over the config
+    fake_clock.sleeps.clear()
+    retry(CommandFailed, tries=5, delay=2, backoff=2, jitter=False)(
+        get_failing_func(1)
+    )()
+    assert fake_clock.sleeps == [2]
+
+
+def test_retry_budget(fake_clock, monkeypatch):
+    """
+    Retries of API server failures are short-circuited once the budget is
+    exhausted, other failures are still retried, and the retries are allowed
+    again after the cool down.
+    """
+    monkeypatch.setitem(
+        config.RUN,
+        "retry",
+        {
+            "budget_enabled": True,
+            "budget_max_failures": 3,
+            "budget_window": 60,
+            "budget_cooldown": 30,
+        },
+    )
+    decorator = retry(CommandFailed, tries=10, delay=1, backoff=1)
+    with pytest.raises(CommandFailed):
+        decorator(get_failing_func(100))()
+    # Third failure exhausted the budget
+    assert fake_clock.sleeps == [1, 1]
+
+    func = get_failing_func(1)
+    with pytest.raises(CommandFailed):
+        decorator(func)()
+    assert len(func.calls) == 1
+    assert decorator(get_failing_func(2, "NotFound"))() == "done"
+
+    fake_clock.now += 30
+    assert decorator(get_failing_func(2))() == "done"
+    summary = retry_module.retry_stats.get_summary()
+    assert sum(site["short_circuited"] for site in summary.values()) == 2
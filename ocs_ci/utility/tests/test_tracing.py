@@ -0,0 +1,92 @@
+# -*- coding: utf8 -*-
+
+import time
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.utility import tracing
+from ocs_ci.utility.utils import exec_cmd
+
+
+@pytest.fixture
+def trace_oc_calls(monkeypatch):
+    """
+    Enable tracing of the commands and reset the recorded calls.
+    """
+    monkeypatch.setitem(config.RUN, "trace_oc_calls", True)
+    tracing.tracer.reset()
+    yield tracing.tracer
+    tracing.tracer.reset()
+
+
+@pytest.mark.parametrize(
+    "cmd, expected",
+    [
+        (["oc", "-n", "openshift-storage", "get", "pod", "-o", "yaml"], ("get", "pod")),
+        (["oc", "--kubeconfig", "/kc", "delete", "pvc/pvc-1"], ("delete", "pvc")),
+        (["oc", "adm", "must-gather"], ("adm", "must-gather")),
+        (["oc", "version"], ("version", None)),
+        (["/usr/bin/true"], ("true", None)),
+    ],
+)
+def test_get_verb_and_kind(cmd, expected):
+    """
+    Verb and resource kind are found in the oc command.
+    """
+    assert tracing.get_verb_and_kind(cmd) == expected
+
+
+def run_commands():
+    """
+    Run the commands from a single call site.
+    """
+    for cmd in ["echo output"] * 3 + ["sleep 0.2"]:
+        exec_cmd(cmd)
+
+
+def test_traced_exec_cmd_summary(trace_oc_calls):
+    """
+    Calls of exec_cmd are recorded and aggregated by the call site.
+    """
+    run_commands()
+    trace_oc_calls.record_parse(0.01, 100)
+    summary = trace_oc_calls.get_summary(top_n=1)
+    assert summary["calls"] == 4
+    assert summary["output_bytes"] == 3 * len("output\n")
+    assert summary["parse_time"] == 0.01
+    assert summary["subprocess_time"] >= 0.2
+    assert summary["by_command"]["sleep"]["calls"] == 1
+    [site] = summary["top_call_sites"]
+    assert site["call_site"].startswith("ocs_ci/utility/tests/test_tracing.py:")
+    assert site["call_site"].endswith(" run_commands")
+    assert site["calls"] == 4
+    assert site["commands"] == ["echo", "sleep"]
+    assert len(trace_oc_calls.get_summary()["top_call_sites"]) == 2
+
+
+def test_tracing_disabled(monkeypatch):
+    """
+    Nothing is recorded when the tracing is disabled.
+    """
+    monkeypatch.setitem(config.RUN, "trace_oc_calls", False)
+    tracing.tracer.reset()
+    exec_cmd("true")
+    assert tracing.tracer.calls == []
+
+
+def test_tracing_overhead(trace_oc_calls):
+    """
+    Recording a call takes less than 1% of the time of a trivial command.
+    """
+    cmd = ["oc", "-n", "openshift-storage", "get", "pod", "-o", "yaml"]
+    count = 1000
+    start = time.perf_counter()
+    for _ in range(count):
+        trace_oc_calls.record_call(cmd, 0.1, 1000)
+    record_time = (time.perf_counter() - start) / count
+    start = time.perf_counter()
+    for _ in range(20):
+        exec_cmd("true")
+    cmd_time = (time.perf_counter() - start) / 20
+    assert record_time < cmd_time * 0.01
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import threading
 import time
 
 import pytest
@@ -352,3 +353,46 @@ def test_ts_wait_for_value_negative_never_succeeded(caplog):
     assert "last sampled value: <no successful sample>" in log_msg
     # the terminal ERROR log still surfaces the last failure reason
     assert "last attempt raised ValueError: always fails" in log_msg
+
+
+def test_ts_adaptive_polling(caplog):
+    """
+    With adaptive polling, sleep intervals grow from initial_sleep by
+    backoff_factor up to the sleep of the sampler.
+    """
+    caplog.set_level(logging.INFO)
+    sampler = TimeoutSampler(2, 0.4, lambda: 1)
+    sampler.adaptive = True
+    sampler.initial_sleep = 0.05
+    sampler.jitter = 0
+    with pytest.raises(TimeoutExpiredError):
+        for _ in sampler:
+            pass
+    intervals = [
+        float(rec.args[0]) for rec in caplog.records if "Going to sleep" in rec.msg
+    ]
+    assert intervals[:5] == [0.05, 0.1, 0.2, 0.4, 0.4]
+    assert sampler.attempt == len(intervals)
+
+
+def test_ts_wake_up():
+    """
+    Wake-up event ends the sleep immediately and the wasted time after the
+    condition was met is recorded.
+    """
+    state = {"ready": False}
+    sampler = TimeoutSampler(30, 10, lambda: state["ready"])
+
+    def make_ready():
+        time.sleep(0.2)
+        state["ready"] = True
+        sampler.wake_up()
+
+    start = time.time()
+    threading.Thread(target=make_ready).start()
+    assert sampler.wait_for_func_status(True)
+    assert time.time() - start < 5
+    assert sampler.attempt == 2
+    assert sampler.wake_ups == 1
+    assert sampler.wasted_time == 0
+    assert 0.1 < sampler.total_sleep < 5
@@ -0,0 +1,243 @@
+# -*- coding: utf8 -*-
+"""
+Lightweight tracing of the commands executed by exec_cmd or streamed by
+ocs_ci.ocs.pod_exec.stream_pod_logs and of parsing of their output in
+OCP.exec_oc_cmd.
+
+When RUN['trace_oc_calls'] is enabled, every call records its wall time,
+output size, verb and resource kind of oc commands and the call site - the
+first frame outside of the command execution plumbing. The pytest plugin
+(ocs_ci/framework/pytest_customization/reports.py) resets the records at the
+start of each test, adds summary of the slowest call sites to the HTML report
+and writes the summary to oc_call_traces/<test name>.json in the log
+directory.
+
+Recording a call costs only a few microseconds (a list append and a walk of
+a few stack frames), which is far below 1% of the duration of the command
+itself.
+"""
+
+import logging
+import os
+import sys
+import threading
+from collections import defaultdict
+
+log = logging.getLogger(__name__)
+
+# Options of oc which are followed by a value, used for finding the verb and
+# the resource kind of the command
+OC_OPTIONS_WITH_VALUE = (
+    "-n",
+    "--namespace",
+    "--kubeconfig",
+    "--context",
+    "--cluster",
+    "--server",
+    "-s",
+    "--token",
+    "--as",
+    "--request-timeout",
+)
+
+# Modules executing the commands, skipped when looking for the call site
+_PLUMBING_MODULES = (
+    "ocs_ci/utility/utils.py",
+    "ocs_ci/utility/retry.py",
+    "ocs_ci/utility/tracing.py",
+    "ocs_ci/utility/executor.py",
+    "ocs_ci/ocs/ocp.py",
+    "ocs_ci/ocs/pod_exec.py",
+    "ocs_ci/ocs/resources/ocs.py",
+    "ocs_ci/ocs/parallel.py",
+)
+_STDLIB_PREFIX = os.path.dirname(os.__file__)
+
+
+def get_call_site():
+    """
+    Get the call site of the traced command - the first frame outside of the
+    command execution plumbing and the standard library
+
+    Returns:
+        str: The call site in format "path:line function"
+
+    """
+    frame = sys._getframe(1)
+    last_frame = frame
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_STDLIB_PREFIX) and not filename.endswith(
+            _PLUMBING_MODULES
+        ):
+            break
+        last_frame = frame
+        frame = frame.f_back
+    frame = frame or last_frame
+    filename = frame.f_code.co_filename
+    if "ocs_ci/" in filename:
+        filename = filename[filename.rindex("ocs_ci/") :]
+    elif "tests/" in filename:
+        filename = filename[filename.index("tests/") :]
+    return f"{filename}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+def get_verb_and_kind(cmd):
+    """
+    Get the verb and the resource kind of the oc command
+
+    Args:
+        cmd (list): The command split to arguments
+
+    Returns:
+        tuple: The verb and the kind (None if not applicable), for commands
+            other than oc the name of the executable and None
+
+    """
+    if not cmd:
+        return None, None
+    if os.path.basename(cmd[0]) != "oc":
+        return os.path.basename(cmd[0]), None
+    args = []
+    skip_value = False
+    for arg in cmd[1:]:
+        if skip_value:
+            skip_value = False
+            continue
+        if arg.startswith("-"):
+            skip_value = arg in OC_OPTIONS_WITH_VALUE
+            continue
+        args.append(arg)
+        if len(args) == 2:
+            break
+    verb = args[0] if args else None
+    kind = args[1].split("/")[0].lower() if len(args) > 1 else None
+    return verb, kind
+
+
+class OcCallTracer(object):
+    """
+    Collects records of the traced calls
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = list()
+
+    def reset(self):
+        """
+        Remove all the records
+        """
+        with self._lock:
+            self.calls = list()
+
+    def record_call(self, cmd, duration, output_bytes, returncode=0):
+        """
+        Record executed command
+
+        Args:
+            cmd (list): The command split to arguments
+            duration (float): Wall time of the command in seconds
+            output_bytes (int): Size of the command output in bytes
+            returncode (int): Return code of the command
+
+        """
+        verb, kind = get_verb_and_kind(cmd)
+        record = {
+            "type": "call",
+            "call_site": get_call_site(),
+            "verb": verb,
+            "kind": kind,
+            "duration": duration,
+            "output_bytes": output_bytes,
+            "returncode": returncode,
+        }
+        with self._lock:
+            self.calls.append(record)
+
+    def record_parse(self, duration, input_bytes):
+        """
+        Record parsing of a command output
+
+        Args:
+            duration (float): Wall time of the parsing in seconds
+            input_bytes (int): Size of the parsed output
+
+        """
+        record = {
+            "type": "parse",
+            "call_site": get_call_site(),
+            "duration": duration,
+            "input_bytes": input_bytes,
+        }
+        with self._lock:
+            self.calls.append(record)
+
+    def get_summary(self, top_n=10):
+        """
+        Get summary of the recorded calls
+
+        Args:
+            top_n (int): Number of the slowest call sites to include
+
+        Returns:
+            dict: Total number and time of the calls and of the parsing,
+                output size, the slowest call sites and times per verb / kind
+
+        """
+        with self._lock:
+            calls = list(self.calls)
+        call_sites = defaultdict(
+            lambda: {
+                "calls": 0,
+                "subprocess_time": 0,
+                "max_time": 0,
+                "parse_time": 0,
+                "output_bytes": 0,
+                "commands": set(),
+            }
+        )
+        by_command = defaultdict(lambda: {"calls": 0, "subprocess_time": 0})
+        summary = {
+            "calls": 0,
+            "subprocess_time": 0,
+            "parse_time": 0,
+            "output_bytes": 0,
+        }
+        for record in calls:
+            site = call_sites[record["call_site"]]
+            if record["type"] == "parse":
+                site["parse_time"] += record["duration"]
+                summary["parse_time"] += record["duration"]
+                continue
+            command = " ".join(filter(None, (record["verb"], record["kind"])))
+            site["calls"] += 1
+            site["subprocess_time"] += record["duration"]
+            site["max_time"] = max(site["max_time"], record["duration"])
+            site["output_bytes"] += record["output_bytes"]
+            site["commands"].add(command)
+            by_command[command]["calls"] += 1
+            by_command[command]["subprocess_time"] += record["duration"]
+            summary["calls"] += 1
+            summary["subprocess_time"] += record["duration"]
+            summary["output_bytes"] += record["output_bytes"]
+        top_sites = sorted(
+            call_sites.items(),
+            key=lambda item: item[1]["subprocess_time"] + item[1]["parse_time"],
+            reverse=True,
+        )[:top_n]
+        summary["top_call_sites"] = [
+            dict(site, call_site=name, commands=sorted(site["commands"]))
+            for name, site in top_sites
+        ]
+        summary["by_command"] = dict(
+            sorted(
+                by_command.items(),
+                key=lambda item: item[1]["subprocess_time"],
+                reverse=True,
+            )
+        )
+        return summary
+
+
+tracer = OcCallTracer()
@@ -15,6 +15,7 @@ import smtplib
 import socket
 import string
 import subprocess
+import threading
 import time
 import traceback
 from typing import Match, Iterator
@@ -68,6 +69,7 @@ from ocs_ci.utility import version as version_module
 from ocs_ci.utility.flexy import load_cluster_info
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.jira import JiraHelper
+from ocs_ci.utility.tracing import tracer
 from psutil._common import bytes2human
 from ocs_ci.ocs.constants import HCI_PROVIDER_CLIENT_PLATFORMS
 
@@ -851,7 +853,15 @@ def exec_cmd(
         # stdin is managed internally. Do not inject stdin=PIPE if the caller set stdin.
         if "input" not in kwargs and "stdin" not in kwargs:
             run_kw["stdin"] = subprocess.PIPE
+        trace_start = time.perf_counter()
         completed_process = subprocess.run(cmd, **run_kw, **kwargs)
+        if config.RUN.get("trace_oc_calls"):
+            tracer.record_call(
+                cmd.split() if isinstance(cmd, str) else cmd,
+                time.perf_counter() - trace_start,
+                len(completed_process.stdout),
+                completed_process.returncode,
+            )
     finally:
         if threading_lock and cmd[0] == "oc":
             threading_lock.release()
@@ -2242,6 +2252,22 @@ class TimeoutSampler(object):
     recent value returned by func) and `last_exception` (the exception raised
     by the most recent sample, None if that sample succeeded).
 
+    Adaptive polling: when `adaptive` is True (default taken from
+    RUN["adaptive_polling"]["enabled"]), the first sleep is `initial_sleep`
+    seconds and every next one is `backoff_factor` times longer, up to
+    `sleep`, reduced by a random `jitter` fraction. The sampler never sleeps
+    longer than `sleep`.
+
+    Wake-up: setting `wake_up_event` (threading.Event, e.g. from a watch
+    callback, see wake_up()) ends the current sleep and the next sample is
+    taken immediately.
+
+    Instrumentation: `total_sleep` (seconds slept in total), `wake_ups`
+    (number of sleeps ended by wake_up_event) and `wasted_time` - upper bound
+    of the time between the condition becoming true and its detection, i.e.
+    the length of the sleep before the last sample, available after the
+    iteration was stopped by the caller.
+
     Args:
         timeout (int): Timeout in seconds
         sleep (int): Sleep interval in seconds
@@ -2274,6 +2300,18 @@ class TimeoutSampler(object):
         self.last_sample_time = None
         # Timestamp of the last INFO-level exception log (for rate limiting)
         self.last_exception_info_log_time = None
+        # Adaptive polling and wake-up settings
+        adaptive_polling = config.RUN.get("adaptive_polling", {})
+        self.adaptive = adaptive_polling.get("enabled", False)
+        self.initial_sleep = adaptive_polling.get("initial_sleep", 1)
+        self.backoff_factor = adaptive_polling.get("backoff_factor", 2)
+        self.jitter = adaptive_polling.get("jitter", 0.1)
+        self.wake_up_event = threading.Event()
+        # Instrumentation of the polling
+        self.total_sleep = 0
+        self.last_sleep = 0
+        self.wake_ups = 0
+        self.wasted_time = None
         # Number of sampling attempts made so far
         self.attempt = 0
         # Outcome of recent sampling attempts: the value func
@@ -2353,6 +2391,60 @@ class TimeoutSampler(object):
             raise self.timeout_exc_cls(*self.timeout_exc_args) from self.last_exception
         raise self.timeout_exc_cls(*self.timeout_exc_args)
 
+    def wake_up(self):
+        """
+        End the current sleep of the sampler, the next sample is taken
+        immediately. Can be called from other threads, e.g. watch callbacks.
+        """
+        self.wake_up_event.set()
+
+    def _get_sleep_interval(self):
+        """
+        Returns:
+            float: Interval in seconds to sleep before the next sample
+
+        """
+        if not self.adaptive:
+            return self.sleep
+        interval = min(
+            self.initial_sleep * self.backoff_factor ** max(self.attempt - 1, 0),
+            self.sleep,
+        )
+        if self.jitter:
+            interval -= interval * self.jitter * random.random()
+        return interval
+
+    def _sleep(self, interval):
+        """
+        Sleep for the interval or until the wake-up event is set
+
+        Args:
+            interval (float): Interval in seconds
+
+        """
+        start_time = time.time()
+        woken_up = self.wake_up_event.wait(interval)
+        if woken_up:
+            self.wake_up_event.clear()
+            self.wake_ups += 1
+            # The sample right after the wake-up doesn't miss the condition
+            self.last_sleep = 0
+        else:
+            self.last_sleep = time.time() - start_time
+        self.total_sleep += time.time() - start_time
+
+    def _log_polling_stats(self):
+        """
+        Log the polling instrumentation once the caller stopped the iteration
+        """
+        self.wasted_time = self.last_sleep
+        log.debug(
+            f"TimeoutSampler for '{self._get_func_name()}' finished after "
+            f"{self.attempt} polls in {time.time() - self.start_time:.1f}s, "
+            f"slept {self.total_sleep:.1f}s, woken up {self.wake_ups} times, "
+            f"at most {self.wasted_time:.1f}s after the condition was met"
+        )
+
     def _build_call_string(self):
         def stringify(value):
             if isinstance(value, str):
@@ -2377,7 +2469,11 @@ class TimeoutSampler(object):
                 self.last_result = result
                 self._has_result = True
                 self.last_exception = None
-                yield result
+                try:
+                    yield result
+                except GeneratorExit:
+                    self._log_polling_stats()
+                    raise
             except Exception as exc:
                 self.last_exception = exc
                 # Rate-limit INFO logging to once per minute to reduce log noise
@@ -2402,8 +2498,12 @@ class TimeoutSampler(object):
                 )
             if self.timeout <= (time.time() - self.start_time):
                 self._raise_timeout()
-            log.info("Going to sleep for %d seconds before next iteration", self.sleep)
-            time.sleep(self.sleep)
+            interval = self._get_sleep_interval()
+            log.info(
+                "Going to sleep for %s seconds before next iteration",
+                f"{interval:.3g}",
+            )
+            self._sleep(interval)
 
     def wait_for_func_value(self, value):
         """
@@ -2413,8 +2513,9 @@ class TimeoutSampler(object):
         Args:
             value: Expected return value of func we are waiting for.
         """
+        samples = iter(self)
         try:
-            for i_value in self:
+            for i_value in samples:
                 if i_value == value:
                     break
         except self.timeout_exc_cls:
@@ -2433,6 +2534,8 @@ class TimeoutSampler(object):
                 last_attempt_info,
             )
             raise
+        finally:
+            samples.close()
 
     def wait_for_func_status(self, result):
         """